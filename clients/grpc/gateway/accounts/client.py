@@ -2,7 +2,11 @@ from grpc import Channel
 from locust.env import Environment  # Импорт окружения Locust
 
 from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_locust_grpc_client
+from clients.grpc.gateway.client import (
+    build_gateway_grpc_client,
+    build_gateway_grpc_aio_client,
+    build_gateway_locust_grpc_client
+)
 from contracts.services.gateway.accounts.accounts_gateway_service_pb2_grpc import AccountsGatewayServiceStub
 from contracts.services.gateway.accounts.rpc_get_accounts_pb2 import GetAccountsRequest, GetAccountsResponse
 from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import (
@@ -114,6 +118,17 @@ def build_accounts_gateway_grpc_client() -> AccountsGatewayGRPCClient:
     return AccountsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
 
+def build_accounts_gateway_grpc_aio_client() -> AccountsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра AccountsGatewayGRPCClient поверх асинхронного канала grpc.aio.
+
+    Методы такого клиента возвращают awaitable-объекты, их результат нужно получать через await.
+
+    :return: Клиент для AccountsGatewayService, работающий в event loop.
+    """
+    return AccountsGatewayGRPCClient(channel=build_gateway_grpc_aio_client())
+
+
 # Новый билдер для нагрузочного тестирования
 def build_accounts_gateway_locust_grpc_client(environment: Environment) -> AccountsGatewayGRPCClient:
     """
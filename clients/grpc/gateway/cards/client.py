@@ -2,7 +2,11 @@ from grpc import Channel
 from locust.env import Environment  # Импорт окружения Locust
 
 from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_locust_grpc_client
+from clients.grpc.gateway.client import (
+    build_gateway_grpc_client,
+    build_gateway_grpc_aio_client,
+    build_gateway_locust_grpc_client
+)
 from contracts.services.gateway.cards.rpc_issue_physical_card_pb2 import IssuePhysicalCardRequest, IssuePhysicalCardResponse
 from contracts.services.gateway.cards.rpc_issue_virtual_card_pb2 import IssueVirtualCardRequest, IssueVirtualCardResponse
 from contracts.services.gateway.cards.cards_gateway_service_pb2_grpc import CardsGatewayServiceStub
@@ -73,6 +77,17 @@ def build_cards_gateway_grpc_client() -> CardsGatewayGRPCClient:
     return CardsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
 
+def build_cards_gateway_grpc_aio_client() -> CardsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра CardsGatewayGRPCClient поверх асинхронного канала grpc.aio.
+
+    Методы такого клиента возвращают awaitable-объекты, их результат нужно получать через await.
+
+    :return: Клиент для CardsGatewayService, работающий в event loop.
+    """
+    return CardsGatewayGRPCClient(channel=build_gateway_grpc_aio_client())
+
+
 # Новый билдер для нагрузочного тестирования
 def build_cards_gateway_locust_grpc_client(environment: Environment) -> CardsGatewayGRPCClient:
     """
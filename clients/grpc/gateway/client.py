@@ -1,4 +1,4 @@
-from grpc import Channel, insecure_channel, intercept_channel
+from grpc import Channel, insecure_channel, intercept_channel, aio
 from locust.env import Environment
 
 from clients.grpc.interceptors.locust_interceptor import LocustInterceptor
@@ -15,6 +15,19 @@ def build_gateway_grpc_client() -> Channel:
     return insecure_channel(settings.gateway_grpc_client.client_url)
 
 
+def build_gateway_grpc_aio_client() -> aio.Channel:
+    """
+    Фабричная функция для создания асинхронного gRPC-канала (grpc.aio) к сервису grpc-gateway.
+
+    Сгенерированные стабы одинаково работают поверх обычного и aio-канала, поэтому
+    gateway-клиенты с таким каналом возвращают awaitable-объекты вместо готовых ответов.
+    Канал должен создаваться внутри запущенного event loop.
+
+    :return: Асинхронный gRPC-канал (grpc.aio.Channel).
+    """
+    return aio.insecure_channel(settings.gateway_grpc_client.client_url)
+
+
 def build_gateway_locust_grpc_client(environment: Environment) -> Channel:
     """
     Фабричная функция для создания gRPC-канала, адаптированного для Locust.
@@ -2,7 +2,11 @@ from grpc import Channel
 from locust.env import Environment
 
 from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_locust_grpc_client
+from clients.grpc.gateway.client import (
+    build_gateway_grpc_client,
+    build_gateway_grpc_aio_client,
+    build_gateway_locust_grpc_client
+)
 from contracts.services.gateway.operations.operations_gateway_service_pb2_grpc import OperationsGatewayServiceStub
 from contracts.services.gateway.operations.rpc_get_operation_pb2 import GetOperationRequest, GetOperationResponse
 from contracts.services.gateway.operations.rpc_get_operation_receipt_pb2 import (
@@ -257,6 +261,17 @@ def build_operations_gateway_grpc_client() -> OperationsGatewayGRPCClient:
     return OperationsGatewayGRPCClient(channel=build_gateway_grpc_client())
 
 
+def build_operations_gateway_grpc_aio_client() -> OperationsGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра OperationsGatewayGRPCClient поверх асинхронного канала grpc.aio.
+
+    Методы такого клиента возвращают awaitable-объекты, их результат нужно получать через await.
+
+    :return: Клиент для OperationsGatewayService, работающий в event loop.
+    """
+    return OperationsGatewayGRPCClient(channel=build_gateway_grpc_aio_client())
+
+
 def build_operations_gateway_locust_grpc_client(environment: Environment) -> OperationsGatewayGRPCClient:
     """
     Функция создаёт экземпляр OperationsGatewayGRPCClient адаптированного под Locust.
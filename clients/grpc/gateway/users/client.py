@@ -2,7 +2,11 @@ from grpc import Channel
 from locust.env import Environment  # Импорт окружения Locust
 
 from clients.grpc.client import GRPCClient
-from clients.grpc.gateway.client import build_gateway_grpc_client, build_gateway_locust_grpc_client
+from clients.grpc.gateway.client import (
+    build_gateway_grpc_client,
+    build_gateway_grpc_aio_client,
+    build_gateway_locust_grpc_client
+)
 from contracts.services.gateway.users.rpc_create_user_pb2 import CreateUserRequest, CreateUserResponse
 from contracts.services.gateway.users.rpc_get_user_pb2 import GetUserRequest, GetUserResponse
 from contracts.services.gateway.users.users_gateway_service_pb2_grpc import UsersGatewayServiceStub
@@ -78,6 +82,17 @@ def build_users_gateway_grpc_client() -> UsersGatewayGRPCClient:
     return UsersGatewayGRPCClient(channel=build_gateway_grpc_client())
 
 
+def build_users_gateway_grpc_aio_client() -> UsersGatewayGRPCClient:
+    """
+    Фабрика для создания экземпляра UsersGatewayGRPCClient поверх асинхронного канала grpc.aio.
+
+    Методы такого клиента возвращают awaitable-объекты, их результат нужно получать через await.
+
+    :return: Клиент для UsersGatewayService, работающий в event loop.
+    """
+    return UsersGatewayGRPCClient(channel=build_gateway_grpc_aio_client())
+
+
 # Новый билдер для нагрузочного тестирования
 def build_users_gateway_locust_grpc_client(environment: Environment) -> UsersGatewayGRPCClient:
     """
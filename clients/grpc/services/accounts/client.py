@@ -0,0 +1,59 @@
+from grpc import Channel
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.services.client import build_service_grpc_client
+from contracts.services.accounts.account_pb2 import AccountType, AccountStatus
+from contracts.services.accounts.accounts_service_pb2_grpc import AccountsServiceStub
+from contracts.services.accounts.rpc_create_account_pb2 import CreateAccountRequest, CreateAccountResponse
+from tools.config.grpc import GRPCClientConfig
+
+
+class AccountsServiceGRPCClient(GRPCClient):
+    """
+    gRPC-клиент для прямого взаимодействия с внутренним AccountsService.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к AccountsService.
+        """
+        super().__init__(channel)
+
+        self.stub = AccountsServiceStub(channel)
+
+    def create_account_api(self, request: CreateAccountRequest) -> CreateAccountResponse:
+        """
+        Низкоуровневый вызов метода CreateAccount через gRPC.
+
+        :param request: gRPC-запрос с типом счёта и ID пользователя.
+        :return: Ответ от сервиса с данными созданного счёта.
+        """
+        return self.stub.CreateAccount(request)
+
+    def create_account(self, user_id: str, account_type: AccountType.ValueType) -> CreateAccountResponse:
+        """
+        Создание активного счёта заданного типа с нулевым балансом.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_type: Тип счёта (AccountType).
+        :return: Ответ с информацией о созданном счёте.
+        """
+        request = CreateAccountRequest(
+            type=account_type,
+            status=AccountStatus.ACCOUNT_STATUS_ACTIVE,
+            user_id=user_id,
+            balance=0
+        )
+        return self.create_account_api(request)
+
+
+def build_accounts_service_grpc_client(config: GRPCClientConfig) -> AccountsServiceGRPCClient:
+    """
+    Фабрика для создания экземпляра AccountsServiceGRPCClient.
+
+    :param config: Настройки подключения к AccountsService.
+    :return: Инициализированный клиент для AccountsService.
+    """
+    return AccountsServiceGRPCClient(channel=build_service_grpc_client(config))
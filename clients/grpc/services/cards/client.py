@@ -0,0 +1,65 @@
+from grpc import Channel
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.services.client import build_service_grpc_client
+from contracts.services.cards.card_pb2 import CardType, CardStatus, CardPaymentSystem
+from contracts.services.cards.cards_service_pb2_grpc import CardsServiceStub
+from contracts.services.cards.rpc_create_card_pb2 import CreateCardRequest, CreateCardResponse
+from tools.config.grpc import GRPCClientConfig
+from tools.fakers import fake
+
+
+class CardsServiceGRPCClient(GRPCClient):
+    """
+    gRPC-клиент для прямого взаимодействия с внутренним CardsService.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к CardsService.
+        """
+        super().__init__(channel)
+
+        self.stub = CardsServiceStub(channel)
+
+    def create_card_api(self, request: CreateCardRequest) -> CreateCardResponse:
+        """
+        Низкоуровневый вызов метода CreateCard через gRPC.
+
+        :param request: gRPC-запрос с реквизитами карты и ID счёта.
+        :return: Ответ от сервиса с данными созданной карты.
+        """
+        return self.stub.CreateCard(request)
+
+    def create_card(self, account_id: str, card_type: CardType.ValueType) -> CreateCardResponse:
+        """
+        Создание активной карты заданного типа с фейковыми реквизитами.
+
+        :param account_id: Идентификатор счёта.
+        :param card_type: Тип карты (CardType).
+        :return: Ответ с информацией о созданной карте.
+        """
+        request = CreateCardRequest(
+            pin=fake.pin(),
+            cvv=fake.cvv(),
+            type=card_type,
+            status=CardStatus.CARD_STATUS_ACTIVE,
+            account_id=account_id,
+            card_number=fake.card_number(),
+            card_holder=f"{fake.first_name()} {fake.last_name()}",
+            expiry_date=fake.card_expiry_date(),
+            payment_system=fake.proto_enum(CardPaymentSystem)
+        )
+        return self.create_card_api(request)
+
+
+def build_cards_service_grpc_client(config: GRPCClientConfig) -> CardsServiceGRPCClient:
+    """
+    Фабрика для создания экземпляра CardsServiceGRPCClient.
+
+    :param config: Настройки подключения к CardsService.
+    :return: Инициализированный клиент для CardsService.
+    """
+    return CardsServiceGRPCClient(channel=build_service_grpc_client(config))
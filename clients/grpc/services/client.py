@@ -0,0 +1,16 @@
+from grpc import Channel, insecure_channel
+
+from tools.config.grpc import GRPCClientConfig
+
+
+def build_service_grpc_client(config: GRPCClientConfig) -> Channel:
+    """
+    Фабричная функция для создания gRPC-канала напрямую к внутреннему сервису (в обход grpc-gateway).
+
+    В отличие от gateway, у каждого внутреннего сервиса свой адрес, поэтому конфигурация
+    передаётся явно (см. SEEDS.SERVICES.* в настройках).
+
+    :param config: Настройки подключения к сервису.
+    :return: gRPC-канал (Channel) к сервису.
+    """
+    return insecure_channel(config.client_url)
@@ -0,0 +1,71 @@
+from datetime import datetime, timezone
+
+from grpc import Channel
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.services.client import build_service_grpc_client
+from contracts.services.operations.operation_pb2 import OperationType, OperationStatus
+from contracts.services.operations.operations_service_pb2_grpc import OperationsServiceStub
+from contracts.services.operations.rpc_create_operation_pb2 import CreateOperationRequest, CreateOperationResponse
+from tools.config.grpc import GRPCClientConfig
+from tools.fakers import fake
+
+
+class OperationsServiceGRPCClient(GRPCClient):
+    """
+    gRPC-клиент для прямого взаимодействия с внутренним OperationsService.
+    """
+
+    def __init__(self, channel: Channel):
+        """
+        Инициализация клиента с указанным gRPC-каналом.
+
+        :param channel: gRPC-канал для подключения к OperationsService.
+        """
+        super().__init__(channel)
+
+        self.stub = OperationsServiceStub(channel)
+
+    def create_operation_api(self, request: CreateOperationRequest) -> CreateOperationResponse:
+        """
+        Низкоуровневый вызов метода CreateOperation через gRPC.
+
+        :param request: gRPC-запрос с данными операции.
+        :return: Ответ от сервиса с данными созданной операции.
+        """
+        return self.stub.CreateOperation(request)
+
+    def create_operation(
+            self,
+            card_id: str,
+            account_id: str,
+            operation_type: OperationType.ValueType
+    ) -> CreateOperationResponse:
+        """
+        Создание операции заданного типа со случайной суммой, статусом и категорией.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :param operation_type: Тип операции (OperationType).
+        :return: Ответ с информацией о созданной операции.
+        """
+        request = CreateOperationRequest(
+            type=operation_type,
+            status=fake.proto_enum(OperationStatus),
+            amount=fake.amount(),
+            card_id=card_id,
+            category=fake.category(),
+            created_at=datetime.now(timezone.utc).isoformat(),
+            account_id=account_id
+        )
+        return self.create_operation_api(request)
+
+
+def build_operations_service_grpc_client(config: GRPCClientConfig) -> OperationsServiceGRPCClient:
+    """
+    Фабрика для создания экземпляра OperationsServiceGRPCClient.
+
+    :param config: Настройки подключения к OperationsService.
+    :return: Инициализированный клиент для OperationsService.
+    """
+    return OperationsServiceGRPCClient(channel=build_service_grpc_client(config))
@@ -1,7 +1,7 @@
 # client.py
 from typing import Any, TypedDict
 
-from httpx import Client, URL, Response, QueryParams
+from httpx import Client, AsyncClient, URL, Response, QueryParams
 
 
 class HTTPClientExtensions(TypedDict, total=False):
@@ -49,3 +49,48 @@ class HTTPClient:
         :return: Объект Response с данными ответа.
         """
         return self.client.post(url=url, json=json, extensions=extensions)
+
+
+class AsyncHTTPClient:
+    """
+    Асинхронный базовый HTTP API клиент, принимающий объект httpx.AsyncClient.
+
+    Повторяет интерфейс HTTPClient, но методы являются корутинами.
+
+    :param client: экземпляр httpx.AsyncClient для выполнения HTTP-запросов
+    """
+
+    def __init__(self, client: AsyncClient):
+        self.client = client
+
+    async def get(
+            self,
+            url: URL | str,
+            params: QueryParams | None = None,
+            extensions: HTTPClientExtensions | None = None
+        ) -> Response:
+        """
+        Выполняет асинхронный GET-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param params: GET-параметры запроса (например, ?key=value).
+        :param extensions: Дополнительный данные передаваемые через HTTPX extensions
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.get(url, params=params, extensions=extensions)
+
+    async def post(
+            self,
+            url: str,
+            json: Any | None = None,
+            extensions: HTTPClientExtensions | None = None
+        ) -> Response:
+        """
+        Выполняет асинхронный POST-запрос.
+
+        :param url: URL-адрес эндпоинта.
+        :param json: Данные в формате JSON.
+        :param extensions: Дополнительный данные передаваемые через HTTPX extensions
+        :return: Объект Response с данными ответа.
+        """
+        return await self.client.post(url=url, json=json, extensions=extensions)
@@ -3,30 +3,112 @@ import time
 from httpx import Request, Response, HTTPStatusError, HTTPError
 from locust.env import Environment
 
+# Наносекунды в миллисекундах: Locust принимает response_time в мс
+NANOSECONDS_IN_MILLISECOND = 1_000_000
+
+# Фазы запроса для locust_phases_event_hook: тип запроса Locust -> (начальное, конечное) событие httpcore trace.
+# Префикс события (connection., http11., http2.) отбрасывается, поэтому таблица одна для HTTP/1.1 и HTTP/2.
+HTTP_PHASES = {
+    "HTTP_CONNECT": ("connect_tcp.started", "connect_tcp.complete"),  # TCP-подключение нового соединения
+    "HTTP_TLS": ("start_tls.started", "start_tls.complete"),  # TLS handshake нового соединения
+    "HTTP_SEND": ("send_request_headers.started", "send_request_body.complete"),  # Отправка запроса
+    "HTTP_WAIT": ("receive_response_headers.started", "receive_response_headers.complete"),  # До первого байта
+    "HTTP_RECEIVE": ("receive_response_body.started", "receive_response_body.complete"),  # Загрузка тела
+}
+
+
+def log_timing_metric(environment: Environment, request_type: str, name: str, response_time: float) -> None:
+    """
+    Записывает вспомогательную метрику времени (HTTP_POOL, HTTP_TTFB, фазы запроса) отдельной строкой
+    статистики Locust, минуя `environment.events.request`.
+
+    Такая строка видна в таблице и CSV и передаётся с воркеров на мастер вместе с остальными,
+    но не попадает в строку Aggregated: общее количество запросов и RPS считаются только по HTTP.
+
+    :param environment: Объект окружения Locust.
+    :param request_type: Тип метрики, например "HTTP_POOL".
+    :param name: Имя запроса (метод + маршрут).
+    :param response_time: Время в миллисекундах.
+    """
+    environment.stats.get(name, request_type).log(response_time, 0)
+
 
 def locust_request_event_hook(request: Request) -> None:
     """
     HTTPX event hook, вызываемый перед отправкой запроса.
 
-    Сохраняет текущее время в `request.extensions["start_time"]`,
-    чтобы потом использовать его для расчёта времени ответа.
+    Сохраняет монотонное время `time.perf_counter_ns()` в `request.extensions["start_time"]`,
+    чтобы потом использовать его для расчёта времени ответа. В отличие от time.time()
+    оно не зависит от перевода системных часов и не теряет точность на float.
     """
-    request.extensions["start_time"] = time.time()
+    request.extensions["start_time"] = time.perf_counter_ns()
+
 
+def locust_pool_wait_event_hook(request: Request) -> None:
+    """
+    HTTPX event hook, вызываемый перед отправкой запроса после `locust_request_event_hook`.
 
-def locust_response_event_hook(environment: Environment):
+    Подключает к запросу httpcore trace extension: первое trace-событие (подключение нового
+    соединения или отправка заголовков по уже открытому) означает, что соединение получено из пула.
+    Его время сохраняется в `request.extensions["connection_time"]`.
+    """
+    extensions = request.extensions
+
+    def trace(event_name: str, info: dict) -> None:
+        if "connection_time" not in extensions:
+            extensions["connection_time"] = time.perf_counter_ns()
+
+    extensions["trace"] = trace
+
+
+def locust_phases_event_hook(request: Request) -> None:
+    """
+    HTTPX event hook, вызываемый перед отправкой запроса после `locust_request_event_hook`.
+
+    Расширенный вариант `locust_pool_wait_event_hook`: кроме времени получения соединения из пула
+    сохраняет в `request.extensions["trace_events"]` время каждого события httpcore trace
+    (подключение, TLS, отправка запроса, получение заголовков и тела ответа).
+    По ним `locust_response_event_hook` отправляет в Locust фазы запроса из HTTP_PHASES.
+    """
+    extensions = request.extensions
+    events = extensions["trace_events"] = {}
+
+    def trace(event_name: str, info: dict) -> None:
+        now = time.perf_counter_ns()
+        if "connection_time" not in extensions:
+            extensions["connection_time"] = now
+
+        events[event_name.partition(".")[2]] = now
+
+    extensions["trace"] = trace
+
+
+def locust_response_event_hook(environment: Environment, ttfb: bool = False):
     """
     Возвращает HTTPX event hook, вызываемый после получения ответа.
 
+    Хук вызывается, как только получены заголовки ответа, — этот момент считается временем
+    до первого байта (TTFB). Затем хук дочитывает тело (httpx буферизует его один раз, повторного
+    чтения в Client.send не будет) и считает полное время ответа.
+
     Использует `request.extensions["start_time"]` для вычисления времени отклика.
+    Если запрос прошёл через `locust_pool_wait_event_hook`, время ожидания соединения из пула
+    дополнительно записывается отдельной метрикой с типом HTTP_POOL; время ответа HTTP
+    по-прежнему измеряется целиком, вместе с ожиданием.
+    Если запрос прошёл через `locust_phases_event_hook`, каждая фаза из HTTP_PHASES, которая была
+    у запроса, записывается отдельной метрикой (HTTP_CONNECT, HTTP_TLS, HTTP_SEND, HTTP_WAIT, HTTP_RECEIVE).
+    Эти метрики пишутся через `log_timing_metric` и не увеличивают Aggregated.
     Извлекает route из `request.extensions["route"]`, если задан.
-    Отправляет собранные метрики в `environment.events.request`, чтобы Locust мог агрегировать статистику.
+    Отправляет сам запрос в `environment.events.request`, чтобы Locust мог агрегировать статистику.
 
     :param environment: Объект окружения Locust, через который отправляются метрики.
+    :param ttfb: Отправлять время до первого байта отдельной метрикой с типом HTTP_TTFB.
     :return: Функция-хук для HTTPX response event hook.
     """
 
     def inner(response: Response) -> None:
+        # Заголовки ответа получены: фиксируем время до первого байта
+        first_byte_time = time.perf_counter_ns()
         exception: HTTPError | HTTPStatusError | None = None
 
         try:
@@ -36,25 +118,48 @@ def locust_response_event_hook(environment: Environment):
             exception = error
 
         request = response.request
+        # Дочитываем тело ответа, он сохраняется в response.content и больше не читается
+        response.read()
+        end_time = time.perf_counter_ns()
 
         # Получаем route, если он был передан через extensions, иначе используем raw path
         route = request.extensions.get("route", request.url.path)
+        name = f"{request.method} {route}"
         # Время начала запроса, установленное в request event hook
-        start_time = request.extensions.get("start_time", time.time())
-        # Вычисляем длительность запроса в миллисекундах
-        response_time = (time.time() - start_time) * 1000
-        # Определяем размер тела ответа (можно заменить на 0, если не нужно)
-        response_length = len(response.read())
+        start_time = request.extensions.get("start_time", first_byte_time)
+
+        # Время получения соединения из пула (если подключён locust_pool_wait_event_hook)
+        connection_time = request.extensions.get("connection_time")
+        if connection_time is not None:
+            # Ожидание свободного соединения из пула на стороне клиента
+            log_timing_metric(
+                environment, "HTTP_POOL", name, (connection_time - start_time) / NANOSECONDS_IN_MILLISECOND
+            )
+
+        if ttfb:
+            # Время до получения заголовков ответа; ошибка запроса учитывается один раз — в метрике HTTP
+            log_timing_metric(
+                environment, "HTTP_TTFB", name, (first_byte_time - start_time) / NANOSECONDS_IN_MILLISECOND
+            )
+
+        # Фазы запроса (если подключён locust_phases_event_hook); подключения и TLS нет у переиспользованных соединений
+        events = request.extensions.get("trace_events")
+        if events:
+            for request_type, (started, complete) in HTTP_PHASES.items():
+                if started in events and complete in events:
+                    log_timing_metric(
+                        environment, request_type, name, (events[complete] - events[started]) / NANOSECONDS_IN_MILLISECOND
+                    )
 
         # Отправляем событие в Locust
         environment.events.request.fire(
-            name=f"{request.method} {route}",  # Имя запроса (метод + логическое имя маршрута)
+            name=name,  # Имя запроса (метод + логическое имя маршрута)
             context=None,  # Контекст (опционально, можно использовать для расширений)
             response=response,  # Объект ответа (опционально)
             exception=exception,  # Исключение, если оно произошло
             request_type="HTTP",  # Тип запроса (может быть любым: HTTP, gRPC, DB и т.д.)
-            response_time=response_time,  # Время выполнения запроса в мс
-            response_length=response_length,  # Размер тела ответа
+            response_time=(end_time - start_time) / NANOSECONDS_IN_MILLISECOND,  # Полное время ответа в мс
+            response_length=response.num_bytes_downloaded,  # Размер тела ответа, полученный по сети
         )
 
     return inner
@@ -0,0 +1,18 @@
+from httpx import Response
+
+
+def raise_for_status_event_hook(response: Response) -> None:
+    """
+    HTTPX event hook, выбрасывающий httpx.HTTPStatusError для ответов 4xx/5xx.
+
+    Без него ответ с ошибкой доходит до разбора схемы и падает невнятной ошибкой валидации,
+    а с ним вызывающий код (например, SeedsScheduler) видит статус и может решить, повторять ли запрос.
+    """
+    response.raise_for_status()
+
+
+async def async_raise_for_status_event_hook(response: Response) -> None:
+    """
+    Асинхронный вариант raise_for_status_event_hook для httpx.AsyncClient.
+    """
+    response.raise_for_status()
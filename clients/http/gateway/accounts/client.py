@@ -1,8 +1,12 @@
-from httpx import Response, QueryParams
+from httpx import Client, Response, QueryParams
 from locust.env import Environment
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.client import HTTPClient, AsyncHTTPClient, HTTPClientExtensions
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_async_http_client,
+    build_gateway_locust_http_client
+)
 from clients.http.gateway.accounts.schema import (
     GetAccountsQuerySchema,
     OpenDepositAccountRequestSchema,
@@ -103,6 +107,98 @@ class AccountsGatewayHTTPClient(HTTPClient):
         return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
 
 
+class AccountsGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для открытия счетов через /api/v1/accounts сервиса http-gateway.
+    """
+
+    async def open_deposit_account_api(self, request: OpenDepositAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия депозитного счёта.
+
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(f"{APIRoutes.ACCOUNTS}/open-deposit-account", json=request.model_dump(by_alias=True))
+
+    async def open_savings_account_api(self, request: OpenSavingsAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия сберегательного счёта.
+
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(f"{APIRoutes.ACCOUNTS}/open-savings-account", json=request.model_dump(by_alias=True))
+
+    async def open_debit_card_account_api(self, request: OpenDebitCardAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия дебетовой карты.
+
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-debit-card-account",
+            json=request.model_dump(by_alias=True)
+        )
+
+    async def open_credit_card_account_api(self, request: OpenCreditCardAccountRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для открытия кредитной карты.
+
+        :param request: Словарь с userId.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(
+            f"{APIRoutes.ACCOUNTS}/open-credit-card-account",
+            json=request.model_dump(by_alias=True)
+        )
+
+    async def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponseSchema:
+        """
+        Открывает депозитный счёт пользователя.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Валидированная схема OpenDepositAccountResponseSchema.
+        """
+        request = OpenDepositAccountRequestSchema(user_id=user_id)
+        response = await self.open_deposit_account_api(request)
+        return OpenDepositAccountResponseSchema.model_validate_json(response.text)
+
+    async def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponseSchema:
+        """
+        Открывает сберегательный счёт пользователя.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Валидированная схема OpenSavingsAccountResponseSchema.
+        """
+        request = OpenSavingsAccountRequestSchema(user_id=user_id)
+        response = await self.open_savings_account_api(request)
+        return OpenSavingsAccountResponseSchema.model_validate_json(response.text)
+
+    async def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponseSchema:
+        """
+        Открывает дебетовый счёт с картой пользователя.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Валидированная схема OpenDebitCardAccountResponseSchema.
+        """
+        request = OpenDebitCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_debit_card_account_api(request)
+        return OpenDebitCardAccountResponseSchema.model_validate_json(response.text)
+
+    async def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponseSchema:
+        """
+        Открывает кредитный счёт с картой пользователя.
+
+        :param user_id: Идентификатор пользователя.
+        :return: Валидированная схема OpenCreditCardAccountResponseSchema.
+        """
+        request = OpenCreditCardAccountRequestSchema(user_id=user_id)
+        response = await self.open_credit_card_account_api(request)
+        return OpenCreditCardAccountResponseSchema.model_validate_json(response.text)
+
+
 def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient с уже настроенным HTTP-клиентом.
@@ -112,7 +208,19 @@ def build_accounts_gateway_http_client() -> AccountsGatewayHTTPClient:
     return AccountsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_accounts_gateway_locust_http_client(environment:Environment) -> AccountsGatewayHTTPClient:
+def build_accounts_gateway_async_http_client() -> AccountsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр AccountsGatewayAsyncHTTPClient поверх httpx.AsyncClient.
+
+    :return: Асинхронный клиент для открытия счетов.
+    """
+    return AccountsGatewayAsyncHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_accounts_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> AccountsGatewayHTTPClient:
     """
     Функция создаёт экземпляр AccountsGatewayHTTPClient адаптированного под Locust.
 
@@ -120,6 +228,8 @@ def build_accounts_gateway_locust_http_client(environment:Environment) -> Accoun
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: общий HTTP-клиент виртуального пользователя (см. acquire_gateway_locust_http_client);
+                   если не передан, создаётся собственный.
     :return: экземпляр AccountsGatewayHTTPClient с хуками сбора метрик.
     """
-    return AccountsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return AccountsGatewayHTTPClient(client=client or build_gateway_locust_http_client(environment))
@@ -1,8 +1,12 @@
-from httpx import Response
+from httpx import Client, Response
 from locust.env import Environment
 
-from clients.http.client import HTTPClient
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.client import HTTPClient, AsyncHTTPClient
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_async_http_client,
+    build_gateway_locust_http_client
+)
 from clients.http.gateway.cards.schema import (
     IssueVirtualCardRequestSchema,
     IssuePhysicalCardRequestSchema,
@@ -48,6 +52,54 @@ class CardsGatewayHTTPClient(HTTPClient):
         return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
 
 
+class CardsGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для выпуска карт через /api/v1/cards сервиса http-gateway.
+    """
+
+    async def issue_virtual_card_api(self, request: IssueVirtualCardRequestSchema) -> Response:
+        """
+        Выпуск виртуальной карты.
+
+        :param request: Словарь с данными для выпуска виртуальной карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(f"{APIRoutes.CARDS}/issue-virtual-card", json=request.model_dump(by_alias=True))
+
+    async def issue_physical_card_api(self, request: IssuePhysicalCardRequestSchema) -> Response:
+        """
+        Выпуск физической карты.
+
+        :param request: Словарь с данными для выпуска физической карты.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(f"{APIRoutes.CARDS}/issue-physical-card", json=request.model_dump(by_alias=True))
+
+    async def issue_virtual_card(self, user_id: str, account_id: str) -> IssueVirtualCardResponseSchema:
+        """
+        Выпускает виртуальную карту на счёте пользователя.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_id: Идентификатор счёта.
+        :return: Валидированная схема IssueVirtualCardResponseSchema.
+        """
+        request = IssueVirtualCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.issue_virtual_card_api(request)
+        return IssueVirtualCardResponseSchema.model_validate_json(response.text)
+
+    async def issue_physical_card(self, user_id: str, account_id: str) -> IssuePhysicalCardResponseSchema:
+        """
+        Выпускает физическую карту на счёте пользователя.
+
+        :param user_id: Идентификатор пользователя.
+        :param account_id: Идентификатор счёта.
+        :return: Валидированная схема IssuePhysicalCardResponseSchema.
+        """
+        request = IssuePhysicalCardRequestSchema(user_id=user_id, account_id=account_id)
+        response = await self.issue_physical_card_api(request)
+        return IssuePhysicalCardResponseSchema.model_validate_json(response.text)
+
+
 def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient с уже настроенным HTTP-клиентом.
@@ -57,7 +109,19 @@ def build_cards_gateway_http_client() -> CardsGatewayHTTPClient:
     return CardsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_cards_gateway_locust_http_client(environment:Environment) -> CardsGatewayHTTPClient:
+def build_cards_gateway_async_http_client() -> CardsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр CardsGatewayAsyncHTTPClient поверх httpx.AsyncClient.
+
+    :return: Асинхронный клиент для выпуска карт.
+    """
+    return CardsGatewayAsyncHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_cards_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> CardsGatewayHTTPClient:
     """
     Функция создаёт экземпляр CardsGatewayHTTPClient адаптированного под Locust.
 
@@ -65,6 +129,8 @@ def build_cards_gateway_locust_http_client(environment:Environment) -> CardsGate
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: общий HTTP-клиент виртуального пользователя (см. acquire_gateway_locust_http_client);
+                   если не передан, создаётся собственный.
     :return: экземпляр CardsGatewayHTTPClient с хуками сбора метрик.
     """
-    return CardsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return CardsGatewayHTTPClient(client=client or build_gateway_locust_http_client(environment))
@@ -1,22 +1,59 @@
 import logging
 
-from httpx import Client
-
+import gevent
+from httpx import Client, AsyncClient
 from locust.env import Environment
+from pydantic import BaseModel
 
-from clients.http.event_hooks.locust_event_hook import locust_request_event_hook, locust_response_event_hook
+from clients.http.event_hooks.locust_event_hook import (
+    locust_request_event_hook,
+    locust_response_event_hook,
+    locust_pool_wait_event_hook,
+    locust_phases_event_hook
+)
+from clients.http.event_hooks.status_event_hook import raise_for_status_event_hook, async_raise_for_status_event_hook
 from config import settings
+from tools.config.http import HTTPPoolSharing
+from tools.logger import get_logger
+
+logger = get_logger("GATEWAY_HTTP_POOL")
 
 
-def build_gateway_http_client() -> Client:
+def build_gateway_http_client(raise_for_status: bool = False) -> Client:
     """
     Функция создаёт экземпляр httpx.Client с базовыми настройками для сервиса http-gateway.
+    При GATEWAY_HTTP_CLIENT.HTTP2=true запросы мультиплексируются по HTTP/2.
 
+    :param raise_for_status: Превращать ответы 4xx/5xx в httpx.HTTPStatusError
+                             (нужно сидингу, чтобы отличать временные ошибки от фатальных).
     :return: Готовый к использованию объект httpx.Client.
     """
     return Client(
-        timeout=settings.gateway_http_client.timeout,
-        base_url=settings.gateway_http_client.client_url
+        timeout=settings.gateway_http_client.timeouts,
+        limits=settings.gateway_http_client.limits,
+        base_url=settings.gateway_http_client.client_url,
+        http1=settings.gateway_http_client.http1,
+        http2=settings.gateway_http_client.http2,
+        event_hooks={"response": [raise_for_status_event_hook] if raise_for_status else []}
+    )
+
+
+def build_gateway_async_http_client(raise_for_status: bool = False) -> AsyncClient:
+    """
+    Функция создаёт экземпляр httpx.AsyncClient с теми же настройками, что и build_gateway_http_client.
+
+    Используется там, где запросы выполняются в asyncio event loop (например, асинхронный сидинг).
+
+    :param raise_for_status: Превращать ответы 4xx/5xx в httpx.HTTPStatusError.
+    :return: Готовый к использованию объект httpx.AsyncClient.
+    """
+    return AsyncClient(
+        timeout=settings.gateway_http_client.timeouts,
+        limits=settings.gateway_http_client.limits,
+        base_url=settings.gateway_http_client.client_url,
+        http1=settings.gateway_http_client.http1,
+        http2=settings.gateway_http_client.http2,
+        event_hooks={"response": [async_raise_for_status_event_hook] if raise_for_status else []}
     )
 
 
@@ -27,23 +64,268 @@ def build_gateway_locust_http_client(environment: Environment) -> Client:
     Отличается от обычного клиента тем, что:
     - добавляет хук `locust_request_event_hook` для фиксации времени начала запроса,
     - добавляет хук `locust_response_event_hook`, который вычисляет метрики
-    (время ответа, длину ответа и т.д.) и отправляет их в Locust через `environment.events.request`.
+    (время ответа, длину ответа и т.д.) и отправляет их в Locust через `environment.events.request`,
+    - при GATEWAY_HTTP_CLIENT.POOL_WAIT_METRIC=true добавляет хук `locust_pool_wait_event_hook`,
+    и время ожидания соединения из пула дополнительно репортится отдельной метрикой (тип запроса HTTP_POOL),
+    - при GATEWAY_HTTP_CLIENT.TTFB_METRIC=true время до первого байта репортится отдельно (тип HTTP_TTFB),
+    - при GATEWAY_HTTP_CLIENT.TRACE_PHASES=true добавляет хук `locust_phases_event_hook`, и каждая фаза запроса
+    (ожидание пула, TCP, TLS, отправка, ожидание ответа, загрузка тела) репортится отдельным типом запроса.
+    Эти дополнительные метрики видны отдельными строками статистики, но не входят в Aggregated и общий RPS.
 
     Таким образом, данный клиент автоматически репортит статистику в Locust
     при каждом выполненном HTTP-запросе.
 
+    При GATEWAY_HTTP_CLIENT.HTTP2=true параллельные запросы виртуального пользователя
+    (например, из разных greenlet'ов) идут отдельными потоками HTTP/2 по одному соединению.
+
     :param environment: Объект окружения Locust, необходим для генерации событий метрик.
     :return: httpx.Client с подключёнными хуками под нагрузочное тестирование.
     """
     # Подавляем INFO-логи httpx (например: "HTTP Request: GET ... 200 OK")
     # Это избавляет консоль от лишнего вывода при высоконагруженных тестах
     logging.getLogger("httpx").setLevel(logging.WARNING)
-    
+
+    request_event_hooks = [locust_request_event_hook]
+    if settings.gateway_http_client.trace_phases:
+        request_event_hooks.append(locust_phases_event_hook)
+    elif settings.gateway_http_client.pool_wait_metric:
+        request_event_hooks.append(locust_pool_wait_event_hook)
+
     return Client(
-        timeout=settings.gateway_http_client.timeout,
+        timeout=settings.gateway_http_client.timeouts,
+        limits=settings.gateway_http_client.limits,
         base_url=settings.gateway_http_client.client_url,
+        http1=settings.gateway_http_client.http1,
+        http2=settings.gateway_http_client.http2,
         event_hooks={
-            "request": [locust_request_event_hook],
-            "response": [locust_response_event_hook(environment)],
+            "request": request_event_hooks,
+            "response": [
+                locust_response_event_hook(environment, ttfb=settings.gateway_http_client.ttfb_metric)
+            ],
         }
     )
+
+
+class HTTPPoolOccupancy(BaseModel):
+    """
+    Заполненность пулов соединений httpx.
+
+    Attributes:
+        clients (int): Количество httpx.Client (пулов соединений).
+        users (int): Количество виртуальных пользователей, использующих пулы.
+        connections (int): Открытые соединения во всех пулах.
+        active (int): Соединения, по которым сейчас выполняются запросы.
+        idle (int): Свободные keep-alive соединения.
+        queued (int): Запросы, ожидающие свободного соединения.
+    """
+    clients: int = 0
+    users: int = 0
+    connections: int = 0
+    active: int = 0
+    idle: int = 0
+    queued: int = 0
+
+
+def get_http_pool_occupancy(client: Client) -> HTTPPoolOccupancy | None:
+    """
+    Читает состояние пула соединений httpx.Client (httpcore.ConnectionPool его транспорта).
+
+    httpx не даёт публичного API для этого, поэтому используются внутренние атрибуты
+    транспорта и пула. Если их нет (другая версия httpx/httpcore или свой транспорт),
+    возвращается None.
+
+    :param client: HTTP-клиент.
+    :return: Заполненность пула одного клиента или None, если её нельзя получить.
+    """
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    requests = getattr(pool, "_requests", None)
+    if connections is None or requests is None:
+        return None
+
+    try:
+        active = sum(not connection.is_idle() for connection in connections)
+        queued = sum(request.is_queued() for request in requests)
+    except AttributeError:
+        return None
+
+    return HTTPPoolOccupancy(
+        clients=1,
+        connections=len(connections),
+        active=active,
+        idle=len(connections) - active,
+        queued=queued
+    )
+
+
+class GatewayLocustHTTPClientPool:
+    """
+    Раздаёт виртуальным пользователям Locust общие httpx.Client по политике HTTPPoolSharing.
+
+    Все gateway-клиенты одного виртуального пользователя (users, cards, accounts, operations, documents)
+    работают через один httpx.Client, а значит через один пул соединений. Политика определяет,
+    сколько пользователей делят этот пул:
+    - USER: у каждого пользователя свой пул, он закрывается, когда пользователь останавливается;
+    - PROCESS: один пул на процесс Locust;
+    - USERS: один пул на группу из users пользователей, места освободившихся пользователей переиспользуются.
+
+    Заполненность пулов (соединения, активные запросы, очередь ожидания соединения) пишется в лог
+    каждые report_interval секунд во время теста и по его окончании.
+    """
+
+    def __init__(
+            self,
+            environment: Environment,
+            sharing: HTTPPoolSharing = HTTPPoolSharing.USER,
+            users: int = 10,
+            report_interval: float | None = None
+    ):
+        """
+        :param environment: Окружение Locust, в которое клиенты отправляют метрики.
+        :param sharing: Политика разделения пулов между пользователями.
+        :param users: Количество пользователей на пул для политики USERS.
+        :param report_interval: Период вывода заполненности пулов в лог в секундах.
+        """
+        self.environment = environment
+        self.sharing = sharing
+        self.users = max(users, 1)
+        self.report_interval = report_interval
+        self.leases: dict[Client, int] = {}
+        self.greenlet: gevent.Greenlet | None = None
+        self.occupancy_unavailable = False
+
+    def acquire(self) -> Client:
+        """
+        Выдаёт пользователю httpx.Client согласно политике.
+
+        :return: HTTP-клиент с хуками Locust (см. build_gateway_locust_http_client).
+        """
+        match self.sharing:
+            case HTTPPoolSharing.PROCESS:
+                client = next(iter(self.leases), None)
+            case HTTPPoolSharing.USERS:
+                client = next((client for client, users in self.leases.items() if users < self.users), None)
+            case _:
+                client = None
+
+        if client is None:
+            client = build_gateway_locust_http_client(self.environment)
+
+        self.leases[client] = self.leases.get(client, 0) + 1
+        return client
+
+    def release(self, client: Client):
+        """
+        Возвращает клиент остановившегося пользователя. Пул политики USER закрывается сразу.
+
+        :param client: Клиент, полученный из acquire().
+        """
+        if client not in self.leases:
+            return
+
+        self.leases[client] -= 1
+        if self.sharing == HTTPPoolSharing.USER and not self.leases[client]:
+            del self.leases[client]
+            client.close()
+
+    def occupancy(self) -> HTTPPoolOccupancy:
+        """
+        Суммарная заполненность всех пулов. Пулы, состояние которых прочитать нельзя
+        (см. get_http_pool_occupancy), учитываются только в числе клиентов; об этом пишется в лог один раз.
+        """
+        total = HTTPPoolOccupancy(users=sum(self.leases.values()))
+        for client in self.leases:
+            total.clients += 1
+            occupancy = get_http_pool_occupancy(client)
+            if occupancy is None:
+                if not self.occupancy_unavailable:
+                    self.occupancy_unavailable = True
+                    logger.warning("HTTP pool occupancy is unavailable for this httpx transport")
+                continue
+
+            total.connections += occupancy.connections
+            total.active += occupancy.active
+            total.idle += occupancy.idle
+            total.queued += occupancy.queued
+
+        return total
+
+    def report(self):
+        """
+        Пишет заполненность пулов в лог.
+        """
+        occupancy = self.occupancy()
+        logger.info(
+            f"{occupancy.clients} HTTP pools ({self.sharing}) for {occupancy.users} users: "
+            f"{occupancy.connections} connections, {occupancy.active} active, {occupancy.idle} idle, "
+            f"{occupancy.queued} requests waiting for a connection"
+        )
+
+    def run(self):
+        while True:
+            gevent.sleep(self.report_interval)
+            self.report()
+
+    def start(self):
+        """
+        Запускает периодический вывод заполненности пулов, если он задан и ещё не запущен.
+        """
+        if self.report_interval and self.greenlet is None:
+            self.greenlet = gevent.spawn(self.run)
+
+    def stop(self):
+        """
+        Останавливает периодический вывод и пишет итоговую заполненность пулов.
+        """
+        if self.greenlet is not None:
+            self.greenlet.kill()
+            self.greenlet = None
+
+        self.report()
+
+
+def get_gateway_locust_http_pool(environment: Environment) -> GatewayLocustHTTPClientPool:
+    """
+    Возвращает пул HTTP-клиентов процесса, создавая его при первом обращении
+    с настройками GATEWAY_HTTP_CLIENT.POOL_*.
+
+    Пул хранится в environment.gateway_http_pool и живёт, пока жив процесс Locust;
+    вывод заполненности запускается в test_start и останавливается в test_stop.
+
+    :param environment: Объект окружения Locust.
+    :return: Пул HTTP-клиентов.
+    """
+    pool = getattr(environment, "gateway_http_pool", None)
+    if pool is None:
+        pool = environment.gateway_http_pool = GatewayLocustHTTPClientPool(
+            environment=environment,
+            sharing=settings.gateway_http_client.pool_sharing,
+            users=settings.gateway_http_client.pool_users,
+            report_interval=settings.gateway_http_client.pool_report_interval
+        )
+        environment.events.test_start.add_listener(lambda **kwargs: pool.start())
+        environment.events.test_stop.add_listener(lambda **kwargs: pool.stop())
+        pool.start()
+
+    return pool
+
+
+def acquire_gateway_locust_http_client(environment: Environment) -> Client:
+    """
+    Выдаёт виртуальному пользователю общий HTTP-клиент для всех его gateway-клиентов
+    согласно политике GATEWAY_HTTP_CLIENT.POOL_SHARING (см. GatewayLocustHTTPClientPool).
+
+    :param environment: Объект окружения Locust.
+    :return: httpx.Client с хуками Locust.
+    """
+    return get_gateway_locust_http_pool(environment).acquire()
+
+
+def release_gateway_locust_http_client(environment: Environment, client: Client):
+    """
+    Возвращает HTTP-клиент остановившегося виртуального пользователя.
+
+    :param environment: Объект окружения Locust.
+    :param client: Клиент, полученный из acquire_gateway_locust_http_client.
+    """
+    get_gateway_locust_http_pool(environment).release(client)
@@ -1,4 +1,4 @@
-from httpx import Response
+from httpx import Client, Response
 from locust.env import Environment
 
 from clients.http.client import HTTPClient, HTTPClientExtensions
@@ -81,7 +81,10 @@ def build_documents_gateway_http_client() -> DocumentsGatewayHTTPClient:
     return DocumentsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_documents_gateway_locust_http_client(environment:Environment) -> DocumentsGatewayHTTPClient:
+def build_documents_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> DocumentsGatewayHTTPClient:
     """
     Функция создаёт экземпляр DocumentsGatewayHTTPClient адаптированного под Locust.
 
@@ -89,6 +92,8 @@ def build_documents_gateway_locust_http_client(environment:Environment) -> Docum
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: общий HTTP-клиент виртуального пользователя (см. acquire_gateway_locust_http_client);
+                   если не передан, создаётся собственный.
     :return: экземпляр DocumentsGatewayHTTPClient с хуками сбора метрик.
     """
-    return DocumentsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return DocumentsGatewayHTTPClient(client=client or build_gateway_locust_http_client(environment))
@@ -1,5 +1,7 @@
+from httpx import Client
 from locust import TaskSet, SequentialTaskSet
 
+from clients.http.gateway.client import acquire_gateway_locust_http_client, release_gateway_locust_http_client
 from clients.http.gateway.users.client import UsersGatewayHTTPClient, build_users_gateway_locust_http_client
 from clients.http.gateway.cards.client import CardsGatewayHTTPClient, build_cards_gateway_locust_http_client
 from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient, build_accounts_gateway_locust_http_client
@@ -21,17 +23,28 @@ class GatewayHTTPTaskSet(TaskSet):
     accounts_gateway_client: AccountsGatewayHTTPClient
     operations_gateway_client: OperationsGatewayHTTPClient
     documents_gateway_client: DocumentsGatewayHTTPClient
+    http_client: Client  # Общий httpx.Client всех клиентов пользователя
 
     def on_start(self) -> None:
         """
         Метод вызывается перед запуском задач TaskSet.
         Здесь создаются API клиенты с использованием контекста окружения Locust.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
+        # Все клиенты пользователя работают через один пул соединений (см. GATEWAY_HTTP_CLIENT.POOL_SHARING)
+        self.http_client = acquire_gateway_locust_http_client(self.user.environment)
+
+        environment, client = self.user.environment, self.http_client
+        self.users_gateway_client = build_users_gateway_locust_http_client(environment, client=client)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(environment, client=client)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(environment, client=client)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(environment, client=client)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(environment, client=client)
+
+    def on_stop(self) -> None:
+        """
+        Метод вызывается при остановке TaskSet: возвращает HTTP-клиент пользователя в пул.
+        """
+        release_gateway_locust_http_client(self.user.environment, self.http_client)
 
 
 class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
@@ -47,13 +60,24 @@ class GatewayHTTPSequentialTaskSet(SequentialTaskSet):
     accounts_gateway_client: AccountsGatewayHTTPClient
     operations_gateway_client: OperationsGatewayHTTPClient
     documents_gateway_client: DocumentsGatewayHTTPClient
+    http_client: Client  # Общий httpx.Client всех клиентов пользователя
 
     def on_start(self) -> None:
         """
         Создание API клиентов для последовательного сценария.
         """
-        self.users_gateway_client = build_users_gateway_locust_http_client(self.user.environment)
-        self.cards_gateway_client = build_cards_gateway_locust_http_client(self.user.environment)
-        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(self.user.environment)
-        self.operations_gateway_client = build_operations_gateway_locust_http_client(self.user.environment)
-        self.documents_gateway_client = build_documents_gateway_locust_http_client(self.user.environment)
+        # Все клиенты пользователя работают через один пул соединений (см. GATEWAY_HTTP_CLIENT.POOL_SHARING)
+        self.http_client = acquire_gateway_locust_http_client(self.user.environment)
+
+        environment, client = self.user.environment, self.http_client
+        self.users_gateway_client = build_users_gateway_locust_http_client(environment, client=client)
+        self.cards_gateway_client = build_cards_gateway_locust_http_client(environment, client=client)
+        self.accounts_gateway_client = build_accounts_gateway_locust_http_client(environment, client=client)
+        self.operations_gateway_client = build_operations_gateway_locust_http_client(environment, client=client)
+        self.documents_gateway_client = build_documents_gateway_locust_http_client(environment, client=client)
+
+    def on_stop(self) -> None:
+        """
+        Метод вызывается при остановке TaskSet: возвращает HTTP-клиент пользователя в пул.
+        """
+        release_gateway_locust_http_client(self.user.environment, self.http_client)
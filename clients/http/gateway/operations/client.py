@@ -1,8 +1,13 @@
-from httpx import Response, QueryParams
+from httpx import Client, Response, QueryParams
+from pydantic import BaseModel
 from locust.env import Environment
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.client import HTTPClient, AsyncHTTPClient, HTTPClientExtensions
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_async_http_client,
+    build_gateway_locust_http_client
+)
 from clients.http.gateway.operations.schema import (
     GetOperationResponseSchema,
     GetOperationReceiptResponseSchema,
@@ -250,6 +255,106 @@ class OperationsGatewayHTTPClient(HTTPClient):
         return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
 
 
+class OperationsGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный клиент для создания операций через /api/v1/operations сервиса http-gateway.
+    """
+
+    async def make_operation_api(self, path: str, request: BaseModel) -> Response:
+        """
+        Выполняет POST-запрос на создание операции.
+
+        :param path: Путь эндпоинта внутри /api/v1/operations (например, make-top-up-operation).
+        :param request: Схема запроса с данными карты, счета, суммы и статуса операции.
+        :return: Ответ от сервера (объект httpx.Response).
+        """
+        return await self.post(f"{APIRoutes.OPERATIONS}/{path}", json=request.model_dump(by_alias=True))
+
+    async def make_fee_operation(self, card_id: str, account_id: str) -> MakeFeeOperationResponseSchema:
+        """
+        Создаёт операцию комиссии по карте.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Валидированная схема MakeFeeOperationResponseSchema.
+        """
+        request = MakeFeeOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.make_operation_api("make-fee-operation", request)
+        return MakeFeeOperationResponseSchema.model_validate_json(response.text)
+
+    async def make_top_up_operation(self, card_id: str, account_id: str) -> MakeTopUpOperationResponseSchema:
+        """
+        Создаёт операцию пополнения по карте.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Валидированная схема MakeTopUpOperationResponseSchema.
+        """
+        request = MakeTopUpOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.make_operation_api("make-top-up-operation", request)
+        return MakeTopUpOperationResponseSchema.model_validate_json(response.text)
+
+    async def make_cashback_operation(self, card_id: str, account_id: str) -> MakeCashbackOperationResponseSchema:
+        """
+        Создаёт операцию кэшбэка по карте.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Валидированная схема MakeCashbackOperationResponseSchema.
+        """
+        request = MakeCashbackOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.make_operation_api("make-cashback-operation", request)
+        return MakeCashbackOperationResponseSchema.model_validate_json(response.text)
+
+    async def make_transfer_operation(self, card_id: str, account_id: str) -> MakeTransferOperationResponseSchema:
+        """
+        Создаёт операцию перевода по карте.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Валидированная схема MakeTransferOperationResponseSchema.
+        """
+        request = MakeTransferOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.make_operation_api("make-transfer-operation", request)
+        return MakeTransferOperationResponseSchema.model_validate_json(response.text)
+
+    async def make_purchase_operation(self, card_id: str, account_id: str) -> MakePurchaseOperationResponseSchema:
+        """
+        Создаёт операцию покупки по карте.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Валидированная схема MakePurchaseOperationResponseSchema.
+        """
+        request = MakePurchaseOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.make_operation_api("make-purchase-operation", request)
+        return MakePurchaseOperationResponseSchema.model_validate_json(response.text)
+
+    async def make_bill_payment_operation(self, card_id: str, account_id: str) -> MakeBillPaymentOperationResponseSchema:
+        """
+        Создаёт операцию оплаты по счёту по карте.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Валидированная схема MakeBillPaymentOperationResponseSchema.
+        """
+        request = MakeBillPaymentOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.make_operation_api("make-bill-payment-operation", request)
+        return MakeBillPaymentOperationResponseSchema.model_validate_json(response.text)
+
+    async def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> MakeCashWithdrawalOperationResponseSchema:
+        """
+        Создаёт операцию снятия наличных денег по карте.
+
+        :param card_id: Идентификатор карты.
+        :param account_id: Идентификатор счёта.
+        :return: Валидированная схема MakeCashWithdrawalOperationResponseSchema.
+        """
+        request = MakeCashWithdrawalOperationRequestSchema(card_id=card_id, account_id=account_id)
+        response = await self.make_operation_api("make-cash-withdrawal-operation", request)
+        return MakeCashWithdrawalOperationResponseSchema.model_validate_json(response.text)
+
+
 # Добавляем builder для DocumentsGatewayHTTPClient
 def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
     """
@@ -260,7 +365,19 @@ def build_operations_gateway_http_client() -> OperationsGatewayHTTPClient:
     return OperationsGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_operations_gateway_locust_http_client(environment:Environment) -> OperationsGatewayHTTPClient:
+def build_operations_gateway_async_http_client() -> OperationsGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр OperationsGatewayAsyncHTTPClient поверх httpx.AsyncClient.
+
+    :return: Асинхронный клиент для создания операций.
+    """
+    return OperationsGatewayAsyncHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_operations_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> OperationsGatewayHTTPClient:
     """
     Функция создаёт экземпляр OperationsGatewayHTTPClient адаптированного под Locust.
 
@@ -268,6 +385,8 @@ def build_operations_gateway_locust_http_client(environment:Environment) -> Oper
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: общий HTTP-клиент виртуального пользователя (см. acquire_gateway_locust_http_client);
+                   если не передан, создаётся собственный.
     :return: экземпляр OperationsGatewayHTTPClient с хуками сбора метрик.
     """
-    return OperationsGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return OperationsGatewayHTTPClient(client=client or build_gateway_locust_http_client(environment))
@@ -1,8 +1,12 @@
-from httpx import Response
+from httpx import Client, Response
 from locust.env import Environment
 
-from clients.http.client import HTTPClient, HTTPClientExtensions
-from clients.http.gateway.client import build_gateway_http_client, build_gateway_locust_http_client
+from clients.http.client import HTTPClient, AsyncHTTPClient, HTTPClientExtensions
+from clients.http.gateway.client import (
+    build_gateway_http_client,
+    build_gateway_async_http_client,
+    build_gateway_locust_http_client
+)
 from clients.http.gateway.users.schema import (
     GetUserResponseSchema,
     CreateUserRequestSchema,
@@ -104,6 +108,55 @@ class UsersGatewayHTTPClient(HTTPClient):
         return CreateUserResponseSchema.model_validate_json(response.text)
 
 
+class UsersGatewayAsyncHTTPClient(AsyncHTTPClient):
+    """
+    Асинхронный HTTP-клиент для работы с API пользователей через шлюз (gateway).
+
+    Повторяет UsersGatewayHTTPClient поверх httpx.AsyncClient — все методы являются корутинами.
+    """
+
+    async def get_user_api(self, user_id: str) -> Response:
+        """
+        Выполняет GET-запрос для получения данных пользователя по ID.
+
+        :param user_id: Уникальный строковый идентификатор пользователя.
+        :return: Объект httpx.Response.
+        """
+        return await self.get(
+            f"{APIRoutes.USERS}/{user_id}",
+            extensions=HTTPClientExtensions(route=f"{APIRoutes.USERS}/{{user_id}}")
+        )
+
+    async def create_user_api(self, request: CreateUserRequestSchema) -> Response:
+        """
+        Выполняет POST-запрос для создания нового пользователя.
+
+        :param request: Схема CreateUserRequestSchema с данными нового пользователя.
+        :return: Объект httpx.Response.
+        """
+        return await self.post(APIRoutes.USERS, json=request.model_dump(by_alias=True))
+
+    async def get_user(self, user_id: str) -> GetUserResponseSchema:
+        """
+        Получает данные пользователя и валидирует их в Pydantic-схему.
+
+        :param user_id: Уникальный строковый идентификатор пользователя.
+        :return: Валидированная схема GetUserResponseSchema с данными пользователя.
+        """
+        response = await self.get_user_api(user_id)
+        return GetUserResponseSchema.model_validate_json(response.text)
+
+    async def create_user(self) -> CreateUserResponseSchema:
+        """
+        Создает тестового пользователя с автоматически сгенерированными данными.
+
+        :return: Валидированная схема CreateUserResponseSchema с данными созданного пользователя.
+        """
+        request = CreateUserRequestSchema()
+        response = await self.create_user_api(request)
+        return CreateUserResponseSchema.model_validate_json(response.text)
+
+
 def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
     """
     Фабричная функция для создания предварительно настроенного клиента пользователей.
@@ -122,7 +175,19 @@ def build_users_gateway_http_client() -> UsersGatewayHTTPClient:
     return UsersGatewayHTTPClient(client=build_gateway_http_client())
 
 
-def build_users_gateway_locust_http_client(environment:Environment) -> UsersGatewayHTTPClient:
+def build_users_gateway_async_http_client() -> UsersGatewayAsyncHTTPClient:
+    """
+    Функция создаёт экземпляр UsersGatewayAsyncHTTPClient поверх httpx.AsyncClient.
+
+    :return: Асинхронный клиент для работы с API пользователей.
+    """
+    return UsersGatewayAsyncHTTPClient(client=build_gateway_async_http_client())
+
+
+def build_users_gateway_locust_http_client(
+        environment: Environment,
+        client: Client | None = None
+) -> UsersGatewayHTTPClient:
     """
     Функция создаёт экземпляр UsersGatewayHTTPClient адаптированного под Locust.
 
@@ -130,6 +195,8 @@ def build_users_gateway_locust_http_client(environment:Environment) -> UsersGate
     Используется исключительно в нагрузочных тестах.
 
     :param environment: объект окружения Locust.
+    :param client: общий HTTP-клиент виртуального пользователя (см. acquire_gateway_locust_http_client);
+                   если не передан, создаётся собственный.
     :return: экземпляр UsersGatewayHTTPClient с хуками сбора метрик.
     """ 
-    return UsersGatewayHTTPClient(client=build_gateway_locust_http_client(environment))
+    return UsersGatewayHTTPClient(client=client or build_gateway_locust_http_client(environment))
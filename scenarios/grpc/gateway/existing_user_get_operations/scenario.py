@@ -2,8 +2,11 @@ from locust import task, events
 from locust.env import Environment
 
 from clients.grpc.gateway.locust import GatewayGRPCTaskSet
+from seeds.pool import SeedUserLease
 from seeds.scenarios.existing_user_get_operations import ExistingUserGetOperationsSeedsScenario
 from seeds.schema.result import SeedUserResult
+from tools.config.seeds import SeedUserPoolMode
+from tools.locust.seeds import init_seeds_pool
 from tools.locust.user import LocustBaseUser
 
 
@@ -12,19 +15,24 @@ from tools.locust.user import LocustBaseUser
 def init(environment: Environment, **kwargs):
     # Выполняем сидинг
     seeds_scenario = ExistingUserGetOperationsSeedsScenario()
-    seeds_scenario.build()  # создаём пользователей, счета, карты и операции
-
-    # Загружаем результат сидинга (из файла JSON)
-    environment.seeds = seeds_scenario.load()
+    # Создаём пользователей, счета, карты и операции и кладём пул пользователей в окружение Locust;
+    # при распределённом запуске каждый воркер получает от мастера свой шард пользователей
+    init_seeds_pool(environment, seeds_scenario, mode=SeedUserPoolMode.SHARED)
 
 
 class GetOperationsTaskSet(GatewayGRPCTaskSet):
     seed_user: SeedUserResult  # Типизированная ссылка на данные из сидинга
+    seed_user_lease: SeedUserLease  # Аренда пользователя из пула сидинга
 
     def on_start(self) -> None:
         super().on_start()
-        # Получаем случайного пользователя из подготовленного списка
-        self.seed_user = self.user.environment.seeds.get_random_user()
+        # Арендуем пользователя из общего пула (число одновременных аренд ограничено SEEDS.POOL.SHARES)
+        self.seed_user_lease = self.user.environment.seeds.lease()
+        self.seed_user = self.seed_user_lease.user
+
+    def on_stop(self) -> None:
+        # Возвращаем пользователя в пул, чтобы его мог получить следующий виртуальный пользователь
+        self.seed_user_lease.release()
 
     @task(1)
     def get_accounts(self):
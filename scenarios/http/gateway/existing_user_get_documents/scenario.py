@@ -2,8 +2,11 @@ from locust import events, task
 from locust.env import Environment
 
 from clients.http.gateway.locust import GatewayHTTPTaskSet
+from seeds.pool import SeedUserLease
 from seeds.scenarios.existing_user_get_documents import ExistingUserGetDocumentsSeedsScenario
 from seeds.schema.result import SeedUserResult
+from tools.config.seeds import SeedUserPoolMode
+from tools.locust.seeds import init_seeds_pool
 from tools.locust.user import LocustBaseUser
 
 
@@ -14,24 +17,29 @@ def init(environment: Environment, **kwargs):
     # Создаем экземпляр сидинг-сценария
     seeds_scenario = ExistingUserGetDocumentsSeedsScenario()
 
-    # Выполняем генерацию данных, если они ещё не созданы
-    seeds_scenario.build()
-
-    # Загружаем сгенерированных пользователей в окружение Locust
-    environment.seeds = seeds_scenario.load()
+    # Выполняем сидинг (на мастере — один раз) и кладём пул пользователей в окружение Locust;
+    # при распределённом запуске каждый воркер получает от мастера свой шард пользователей
+    init_seeds_pool(environment, seeds_scenario, mode=SeedUserPoolMode.EXCLUSIVE)
 
 
 # Набор задач (TaskSet), который будет выполняться виртуальными пользователями.
 class GetDocumentsTaskSet(GatewayHTTPTaskSet):
     # Типизируем объект пользователя из сидинга
     seed_user: SeedUserResult
+    seed_user_lease: SeedUserLease  # Аренда пользователя из пула сидинга
 
     # Метод вызывается при запуске каждой сессии пользователя (до начала задач)
     def on_start(self) -> None:
         super().on_start()
 
-        # Получаем следующего пользователя из списка (по порядку!)
-        self.seed_user = self.user.environment.seeds.get_next_user()
+        # Арендуем следующего свободного пользователя из пула (по порядку!)
+        self.seed_user_lease = self.user.environment.seeds.lease()
+        self.seed_user = self.seed_user_lease.user
+
+    def on_stop(self) -> None:
+        # Возвращаем пользователя в пул, чтобы его мог получить следующий виртуальный пользователь
+        self.seed_user_lease.release()
+        super().on_stop()
 
     @task(1)
     def get_accounts(self):
@@ -1,8 +1,10 @@
+import gevent
 from locust import task
 
 from clients.http.gateway.locust import GatewayHTTPSequentialTaskSet
 from clients.http.gateway.users.schema import CreateUserResponseSchema
 from clients.http.gateway.accounts.schema import OpenSavingsAccountResponseSchema
+from config import settings
 from tools.locust.user import LocustBaseUser
 
 
@@ -44,16 +46,27 @@ class GetDocumentSequentialTaskSet(GatewayHTTPSequentialTaskSet):
     def get_documents(self):
         """
         Получаем документы, если счёт был успешно открыт.
+        При GATEWAY_HTTP_CLIENT.HTTP2 тариф и контракт запрашиваются параллельно по одному соединению,
+        иначе — последовательно, как и раньше.
         """
         if not self.open_savings_account_response:
             return
 
-        self.documents_gateway_client.get_tariff_document(
-            account_id=self.open_savings_account_response.account.id
-        )
-        self.documents_gateway_client.get_contract_document(
-            account_id=self.open_savings_account_response.account.id
-        )
+        account_id = self.open_savings_account_response.account.id
+        if not settings.gateway_http_client.http2:
+            self.documents_gateway_client.get_tariff_document(account_id=account_id)
+            self.documents_gateway_client.get_contract_document(account_id=account_id)
+            return
+
+        greenlets = [
+            gevent.spawn(self.documents_gateway_client.get_tariff_document, account_id=account_id),
+            gevent.spawn(self.documents_gateway_client.get_contract_document, account_id=account_id)
+        ]
+        try:
+            gevent.joinall(greenlets, raise_error=True)
+        except BaseException:
+            gevent.killall(greenlets)
+            raise
 
 
 class GetDocumentsUser(LocustBaseUser):
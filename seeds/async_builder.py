@@ -0,0 +1,446 @@
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Callable
+
+from clients.grpc.client import GRPCClient
+from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_aio_client, AccountsGatewayGRPCClient
+from clients.grpc.gateway.cards.client import build_cards_gateway_grpc_aio_client, CardsGatewayGRPCClient
+from clients.grpc.gateway.operations.client import (
+    build_operations_gateway_grpc_aio_client,
+    OperationsGatewayGRPCClient
+)
+from clients.grpc.gateway.users.client import build_users_gateway_grpc_aio_client, UsersGatewayGRPCClient
+from clients.http.gateway.accounts.client import AccountsGatewayAsyncHTTPClient
+from clients.http.gateway.cards.client import CardsGatewayAsyncHTTPClient
+from clients.http.gateway.client import build_gateway_async_http_client
+from clients.http.gateway.operations.client import OperationsGatewayAsyncHTTPClient
+from clients.http.gateway.users.client import UsersGatewayAsyncHTTPClient
+from config import settings
+from seeds.metrics import SeedsMetrics
+from seeds.registry import ACCOUNT_ENDPOINTS, CARD_ENDPOINTS, OPERATION_ENDPOINTS, OPERATIONS_CARD
+from seeds.schema.metrics import SeedsMetricsSummary
+from seeds.scheduler import AsyncSeedsScheduler, build_async_seeds_scheduler
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan
+from seeds.schema.result import (
+    SeedsResult,
+    SeedUserResult,
+    SeedCardResult,
+    SeedAccountResult,
+    SeedOperationResult
+)
+from tools.config.seeds import SeedsBackend
+
+
+class AsyncSeedsBuilder:
+    """
+    AsyncSeedsBuilder — асинхронный аналог SeedsBuilder поверх grpc.aio и httpx.AsyncClient.
+
+    Принимает тот же SeedsPlan и возвращает тот же SeedsResult. Все независимые сущности
+    (пользователи, счета одного пользователя, карты и операции одного счёта) создаются
+    через asyncio.gather, поэтому в полёте одновременно находятся сотни RPC.
+
+    Attributes:
+        users_gateway_client: Клиент для работы с пользователями (grpc.aio или httpx.AsyncClient)
+        cards_gateway_client: Клиент для выпуска карт
+        accounts_gateway_client: Клиент для открытия счетов
+        operations_gateway_client: Клиент для операций (топ-ап, покупки и т.д.)
+        workers: Максимальное количество пользователей, которые создаются одновременно
+        scheduler: Планировщик с лимитами одновременных вызовов по эндпоинтам
+    """
+
+    def __init__(
+            self,
+            users_gateway_client: UsersGatewayGRPCClient | UsersGatewayAsyncHTTPClient,
+            cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayAsyncHTTPClient,
+            accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayAsyncHTTPClient,
+            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayAsyncHTTPClient,
+            workers: int = 1,
+            scheduler: AsyncSeedsScheduler | None = None
+    ):
+        self.users_gateway_client = users_gateway_client
+        self.cards_gateway_client = cards_gateway_client
+        self.accounts_gateway_client = accounts_gateway_client
+        self.operations_gateway_client = operations_gateway_client
+        self.workers = max(workers, 1)
+        self.scheduler = scheduler or AsyncSeedsScheduler()
+
+    @property
+    def metrics(self) -> SeedsMetrics:
+        """
+        Метрики сидинга: счётчики сущностей и задержки RPC, записанные планировщиком.
+        """
+        return self.scheduler.metrics
+
+    async def build_card_result(self, endpoint: str, user_id: str, account_id: str) -> SeedCardResult:
+        """
+        Выпускает карту на счёте.
+
+        Args:
+            endpoint: Эндпоинт выпуска карты из CARD_ENDPOINTS, например "issue_virtual_card"
+            user_id: Идентификатор пользователя
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedCardResult: Результат с ID выпущенной карты
+        """
+        response = await self.scheduler.call(
+            endpoint,
+            getattr(self.cards_gateway_client, endpoint),
+            user_id=user_id,
+            account_id=account_id
+        )
+        return SeedCardResult(card_id=response.card.id)
+
+    async def build_operation_result(self, endpoint: str, card_id: str, account_id: str) -> SeedOperationResult:
+        """
+        Выполняет операцию по карте.
+
+        Args:
+            endpoint: Эндпоинт операции из OPERATION_ENDPOINTS, например "make_purchase_operation"
+            card_id: Идентификатор карты
+            account_id: Идентификатор счёта
+
+        Returns:
+            SeedOperationResult: Результат с ID выполненной операции
+        """
+        response = await self.scheduler.call(
+            endpoint,
+            getattr(self.operations_gateway_client, endpoint),
+            card_id=card_id,
+            account_id=account_id
+        )
+        return SeedOperationResult(operation_id=response.operation.id)
+
+    async def build_account_result(self, kind: str, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        """
+        Открывает счёт заданного вида, а затем одновременно выпускает на нём карты и выполняет операции
+        (см. SeedsBuilder.build_account_result).
+
+        Args:
+            kind: Вид счетов из ACCOUNT_ENDPOINTS, например "credit_card_accounts"
+            plan: План счёта (кол-во карт и операций)
+            user_id: Идентификатор пользователя
+
+        Returns:
+            SeedAccountResult: Результат с ID счёта, картами и операциями
+        """
+        endpoint = ACCOUNT_ENDPOINTS[kind]
+        response = await self.scheduler.call(
+            endpoint,
+            getattr(self.accounts_gateway_client, endpoint),
+            user_id=user_id
+        )
+        account_id = response.account.id
+
+        cards = {relation: [] for relation in CARD_ENDPOINTS}
+        operations_cards = []
+        card_id = response.account.cards[0].id if response.account.cards else None
+        if card_id is None and any(getattr(plan, relation).count for relation in OPERATION_ENDPOINTS):
+            card = await self.build_card_result(
+                CARD_ENDPOINTS[OPERATIONS_CARD],
+                user_id=user_id,
+                account_id=account_id
+            )
+            (cards[OPERATIONS_CARD] if getattr(plan, OPERATIONS_CARD).count else operations_cards).append(card)
+            card_id = card.card_id
+
+        groups = await self.scheduler.gather_groups(
+            *[
+                [
+                    self.build_card_result(endpoint, user_id=user_id, account_id=account_id)
+                    for _ in range(getattr(plan, relation).count - len(cards[relation]))
+                ]
+                for relation, endpoint in CARD_ENDPOINTS.items()
+            ],
+            *[
+                [
+                    self.build_operation_result(endpoint, card_id=card_id, account_id=account_id)
+                    for _ in range(getattr(plan, relation).count)
+                ]
+                for relation, endpoint in OPERATION_ENDPOINTS.items()
+            ]
+        )
+
+        return SeedAccountResult(
+            account_id=account_id,
+            operations_cards=operations_cards,
+            **{
+                relation: cards.get(relation, []) + group
+                for relation, group in zip([*CARD_ENDPOINTS, *OPERATION_ENDPOINTS], groups)
+            }
+        )
+
+    async def build_user_accounts(self, plan: SeedUsersPlan, user: SeedUserResult) -> SeedUserResult:
+        """
+        Доводит счета пользователя до плана: одновременно открывает только недостающие счета
+        каждого вида, а лишние счета отбрасывает из результата.
+
+        Args:
+            plan: План генерации пользователя
+            user: Уже созданный пользователь (для нового пользователя — без счетов)
+
+        Returns:
+            SeedUserResult: Пользователь с полным по плану набором счетов
+        """
+        user_id = user.user_id
+
+        groups = await self.scheduler.gather_groups(
+            *[
+                [
+                    self.build_account_result(kind=kind, plan=getattr(plan, kind), user_id=user_id)
+                    for _ in range(getattr(plan, kind).count - len(getattr(user, kind)))
+                ]
+                for kind in ACCOUNT_ENDPOINTS
+            ]
+        )
+
+        return SeedUserResult(
+            user_id=user_id,
+            **{
+                kind: (getattr(user, kind) + accounts)[:getattr(plan, kind).count]
+                for kind, accounts in zip(ACCOUNT_ENDPOINTS, groups)
+            }
+        )
+
+    async def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
+        """
+        Создаёт пользователя, а затем одновременно открывает все его счета согласно плану.
+
+        Args:
+            plan: План генерации пользователя
+
+        Returns:
+            SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
+        """
+        response = await self.scheduler.call("create_user", self.users_gateway_client.create_user)
+        return await self.build_user_accounts(plan=plan, user=SeedUserResult(user_id=response.user.id))
+
+    async def build(
+            self,
+            plan: SeedsPlan,
+            users: list[SeedUserResult] | None = None,
+            on_user: Callable[[SeedUserResult], None] | None = None
+    ) -> SeedsResult:
+        """
+        Генерирует полную структуру данных на основе плана.
+        Одновременно обрабатывается не более workers пользователей, порядок результата совпадает с планом.
+        Переданные уже созданные пользователи только дополняются недостающими счетами.
+
+        Args:
+            plan: Полный план генерации данных
+            users: Уже созданные пользователи, которых нужно дополнить до плана
+            on_user: Колбэк, вызываемый сразу после готовности каждого пользователя
+
+        Returns:
+            SeedsResult: Результат с данными всех пользователей плана
+        """
+        users = (users or [])[:plan.users.count]
+        semaphore = asyncio.Semaphore(self.workers)
+        self.metrics.start(total_users=plan.users.count)
+
+        async def build_user(index: int) -> SeedUserResult:
+            async with semaphore:
+                if index < len(users):
+                    user = await self.build_user_accounts(plan=plan.users, user=users[index])
+                else:
+                    user = await self.build_user(plan=plan.users)
+
+            self.metrics.add_user()
+            if on_user is not None:
+                on_user(user)
+
+            return user
+
+        result = await asyncio.gather(*[build_user(index) for index in range(plan.users.count)])
+        return SeedsResult(users=result)
+
+    async def close(self) -> None:
+        """
+        Закрывает каналы и HTTP-соединения всех клиентов билдера.
+        """
+        for client in (
+                self.users_gateway_client,
+                self.cards_gateway_client,
+                self.accounts_gateway_client,
+                self.operations_gateway_client
+        ):
+            if isinstance(client, GRPCClient):
+                await client.channel.close()
+            else:
+                await client.client.aclose()
+
+
+def build_grpc_aio_seeds_builder() -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания асинхронного сидера с использованием grpc.aio-клиентов.
+    Должна вызываться внутри запущенного event loop.
+
+    Returns:
+        AsyncSeedsBuilder: Инициализированный сидер с grpc.aio-клиентами
+    """
+    return AsyncSeedsBuilder(
+        users_gateway_client=build_users_gateway_grpc_aio_client(),
+        cards_gateway_client=build_cards_gateway_grpc_aio_client(),
+        accounts_gateway_client=build_accounts_gateway_grpc_aio_client(),
+        operations_gateway_client=build_operations_gateway_grpc_aio_client(),
+        workers=settings.seeds.workers,
+        scheduler=build_async_seeds_scheduler()
+    )
+
+
+def build_http_async_seeds_builder() -> AsyncSeedsBuilder:
+    """
+    Фабрика для создания асинхронного сидера с использованием httpx.AsyncClient.
+    Все четыре клиента используют один httpx.AsyncClient, ответы 4xx/5xx превращаются в исключения.
+
+    Returns:
+        AsyncSeedsBuilder: Инициализированный сидер с асинхронными HTTP-клиентами
+    """
+    client = build_gateway_async_http_client(raise_for_status=True)
+    return AsyncSeedsBuilder(
+        users_gateway_client=UsersGatewayAsyncHTTPClient(client=client),
+        cards_gateway_client=CardsGatewayAsyncHTTPClient(client=client),
+        accounts_gateway_client=AccountsGatewayAsyncHTTPClient(client=client),
+        operations_gateway_client=OperationsGatewayAsyncHTTPClient(client=client),
+        workers=settings.seeds.workers,
+        scheduler=build_async_seeds_scheduler()
+    )
+
+
+async def build_async_seeds_result(
+        backend: SeedsBackend,
+        plan: SeedsPlan,
+        users: list[SeedUserResult] | None = None,
+        on_user: Callable[[SeedUserResult], None] | None = None,
+        on_metrics: Callable[[SeedsMetricsSummary], None] | None = None
+) -> SeedsResult:
+    """
+    Создаёт асинхронный сидер для выбранного бэкенда, выполняет план и закрывает соединения.
+
+    :param backend: SeedsBackend.GRPC_AIO или SeedsBackend.HTTP_ASYNC.
+    :param plan: План сидинга.
+    :param users: Уже созданные пользователи, которых нужно дополнить до плана.
+    :param on_user: Колбэк, вызываемый сразу после создания каждого пользователя.
+    :param on_metrics: Колбэк, получающий итоговую статистику сидинга (в том числе при ошибке).
+    :return: Результат сидинга.
+    """
+    if backend == SeedsBackend.GRPC_AIO:
+        builder = build_grpc_aio_seeds_builder()
+    else:
+        builder = build_http_async_seeds_builder()
+
+    try:
+        return await builder.build(plan, users=users, on_user=on_user)
+    finally:
+        await builder.close()
+        if on_metrics is not None:
+            on_metrics(builder.metrics.summary())
+
+
+class AsyncSeedsBuilderProcess:
+    """
+    Обёртка с интерфейсом SeedsBuilder, которая выполняет AsyncSeedsBuilder в отдельном интерпретаторе.
+
+    Locust при импорте патчит стандартную библиотеку через gevent (monkey.patch_all),
+    после чего asyncio и grpc.aio в этом процессе работать не могут. Поэтому асинхронный
+    сидинг запускается через `python -m seeds.async_builder` с LOCUST_SKIP_MONKEY_PATCH=1:
+    план (первой строкой) и уже созданные пользователи (по строке на пользователя) передаются в stdin,
+    а каждый готовый пользователь сразу пишется в stdout
+    отдельной строкой JSON. Так родительский процесс получает пользователей по мере готовности
+    и может сохранять их в checkpoint, даже если дочерний процесс упадёт посередине.
+
+    Прогресс по пользователям родитель пишет в лог по мере получения строк, а статистику RPC
+    дочерний процесс в конце сохраняет во временный файл, откуда она добавляется в metrics родителя.
+    """
+
+    def __init__(self, backend: SeedsBackend):
+        """
+        :param backend: SeedsBackend.GRPC_AIO или SeedsBackend.HTTP_ASYNC.
+        """
+        self.backend = backend
+        self.metrics = SeedsMetrics(interval=settings.seeds.progress_interval)
+
+    def build(
+            self,
+            plan: SeedsPlan,
+            users: list[SeedUserResult] | None = None,
+            on_user: Callable[[SeedUserResult], None] | None = None
+    ) -> SeedsResult:
+        """
+        Выполняет план в дочернем процессе и возвращает результат.
+        Переданные пользователи сохраняют свой порядок, новые идут за ними в порядке завершения создания.
+
+        :param plan: План сидинга.
+        :param users: Уже созданные пользователи, которых нужно дополнить до плана.
+        :param on_user: Колбэк, вызываемый для каждого пользователя сразу после получения от дочернего процесса.
+        :return: Результат сидинга.
+        :raises subprocess.CalledProcessError: Если дочерний процесс завершился с ошибкой.
+        """
+        with tempfile.NamedTemporaryFile(prefix="seeds_metrics_", suffix=".json", delete=False) as file:
+            metrics_file = file.name
+
+        self.metrics.start(total_users=plan.users.count)
+        command = [sys.executable, "-m", "seeds.async_builder", self.backend, metrics_file]
+        process = subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            env={**os.environ, "LOCUST_SKIP_MONKEY_PATCH": "1"},
+            text=True
+        )
+        process.stdin.write(plan.model_dump_json() + "\n")
+        for user in users or []:
+            process.stdin.write(user.model_dump_json() + "\n")
+        process.stdin.close()
+
+        result = []
+        for line in process.stdout:
+            user = SeedUserResult.model_validate_json(line)
+            self.metrics.add_user()
+            if on_user is not None:
+                on_user(user)
+
+            result.append(user)
+
+        process.wait()
+        with open(metrics_file, 'r', encoding="utf-8") as file:
+            content = file.read()
+        os.remove(metrics_file)
+        if content:
+            self.metrics.merge(SeedsMetricsSummary.model_validate_json(content))
+
+        if process.returncode != 0:
+            raise subprocess.CalledProcessError(process.returncode, command)
+
+        order = {user.user_id: index for index, user in enumerate(users or [])}
+        result.sort(key=lambda user: order.get(user.user_id, len(order)))
+        return SeedsResult(users=result)
+
+
+if __name__ == '__main__':
+    # Точка входа дочернего процесса: читаем план из stdin, пишем каждого готового пользователя в stdout,
+    # а итоговую статистику — в файл из второго аргумента
+    def write_user(user: SeedUserResult):
+        sys.stdout.write(user.model_dump_json() + "\n")
+        sys.stdout.flush()
+
+
+    def write_metrics(summary: SeedsMetricsSummary):
+        with open(sys.argv[2], 'w', encoding="utf-8") as metrics_file:
+            metrics_file.write(summary.model_dump_json())
+
+
+    seeds_plan = SeedsPlan.model_validate_json(sys.stdin.readline())
+    seeds_users = [SeedUserResult.model_validate_json(line) for line in sys.stdin]
+    asyncio.run(
+        build_async_seeds_result(
+            backend=SeedsBackend(sys.argv[1]),
+            plan=seeds_plan,
+            users=seeds_users,
+            on_user=write_user,
+            on_metrics=write_metrics
+        )
+    )
@@ -1,11 +1,28 @@
-from clients.grpc.gateway.accounts.client import build_accounts_gateway_grpc_client, AccountsGatewayGRPCClient
-from clients.grpc.gateway.cards.client import build_cards_gateway_grpc_client, CardsGatewayGRPCClient
-from clients.grpc.gateway.operations.client import build_operations_gateway_grpc_client, OperationsGatewayGRPCClient
-from clients.grpc.gateway.users.client import build_users_gateway_grpc_client, UsersGatewayGRPCClient
-from clients.http.gateway.accounts.client import build_accounts_gateway_http_client, AccountsGatewayHTTPClient
-from clients.http.gateway.cards.client import build_cards_gateway_http_client, CardsGatewayHTTPClient
-from clients.http.gateway.operations.client import build_operations_gateway_http_client, OperationsGatewayHTTPClient
-from clients.http.gateway.users.client import build_users_gateway_http_client, UsersGatewayHTTPClient
+from functools import partial
+from typing import Callable
+
+from gevent.pool import Pool
+
+from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient
+from clients.grpc.gateway.cards.client import CardsGatewayGRPCClient
+from clients.grpc.gateway.client import build_gateway_grpc_client
+from clients.grpc.gateway.operations.client import OperationsGatewayGRPCClient
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient
+from clients.grpc.services.accounts.client import build_accounts_service_grpc_client
+from clients.grpc.services.cards.client import build_cards_service_grpc_client
+from clients.grpc.services.operations.client import build_operations_service_grpc_client
+from clients.grpc.services.users.client import build_users_service_grpc_client, UsersServiceGRPCClient
+from clients.http.gateway.accounts.client import AccountsGatewayHTTPClient
+from clients.http.gateway.cards.client import CardsGatewayHTTPClient
+from clients.http.gateway.client import build_gateway_http_client
+from clients.http.gateway.operations.client import OperationsGatewayHTTPClient
+from clients.http.gateway.users.client import UsersGatewayHTTPClient
+from config import settings
+from seeds.async_builder import AsyncSeedsBuilderProcess
+from seeds.metrics import SeedsMetrics
+from seeds.registry import ACCOUNT_ENDPOINTS, CARD_ENDPOINTS, OPERATION_ENDPOINTS, OPERATIONS_CARD
+from seeds.scheduler import SeedsScheduler, build_seeds_scheduler
+from seeds.services import AccountsServiceSeedsClient, CardsServiceSeedsClient, OperationsServiceSeedsClient
 from seeds.schema.plan import (
     SeedsPlan,
     SeedUsersPlan,
@@ -18,252 +35,190 @@ from seeds.schema.result import (
     SeedAccountResult,
     SeedOperationResult
 )
+from tools.config.seeds import SeedsBackend
 
 
 class SeedsBuilder:
     """
     SeedsBuilder — генератор (сидер), формирующий необходимые тестовые или демонстрационные данные
-    на основании входного плана. Работает одинаково как с HTTP, так и с gRPC клиентами.
+    на основании входного плана. Работает одинаково как с HTTP, так и с gRPC клиентами gateway,
+    а также с адаптерами внутренних сервисов (seeds.services).
 
     Attributes:
         users_gateway_client: Клиент для работы с пользователями (HTTP или gRPC)
         cards_gateway_client: Клиент для выпуска карт
         accounts_gateway_client: Клиент для открытия счетов
         operations_gateway_client: Клиент для операций (топ-ап, покупки и т.д.)
+        workers: Количество пользователей, которые создаются параллельно (1 — последовательно)
+        scheduler: Планировщик, выполняющий независимые RPC одновременно с лимитами по эндпоинтам
     """
 
     def __init__(
             self,
-            users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient,
-            cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient,
-            accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient,
-            operations_gateway_client: OperationsGatewayGRPCClient | OperationsGatewayHTTPClient
+            users_gateway_client: UsersGatewayGRPCClient | UsersGatewayHTTPClient | UsersServiceGRPCClient,
+            cards_gateway_client: CardsGatewayGRPCClient | CardsGatewayHTTPClient | CardsServiceSeedsClient,
+            accounts_gateway_client: AccountsGatewayGRPCClient | AccountsGatewayHTTPClient | AccountsServiceSeedsClient,
+            operations_gateway_client: (
+                    OperationsGatewayGRPCClient | OperationsGatewayHTTPClient | OperationsServiceSeedsClient
+            ),
+            workers: int = 1,
+            scheduler: SeedsScheduler | None = None
     ):
         self.users_gateway_client = users_gateway_client
         self.cards_gateway_client = cards_gateway_client
         self.accounts_gateway_client = accounts_gateway_client
         self.operations_gateway_client = operations_gateway_client
+        self.workers = max(workers, 1)
+        self.scheduler = scheduler or SeedsScheduler()
 
-    def build_virtual_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+    @property
+    def metrics(self) -> SeedsMetrics:
         """
-        Выпускает виртуальную карту для заданного пользователя и счёта.
-
-        Args:
-            user_id: Идентификатор пользователя
-            account_id: Идентификатор счёта
+        Метрики сидинга: счётчики сущностей и задержки RPC, записанные планировщиком.
+        """
+        return self.scheduler.metrics
 
-        Returns:
-            SeedCardResult: Результат с ID выпущенной карты
+    def fork(self) -> "SeedsBuilder":
         """
-        response = self.cards_gateway_client.issue_virtual_card(
-            user_id=user_id,
-            account_id=account_id
+        Создаёт билдер с теми же клиентами (каналами и пулами соединений) и общими ограничениями
+        планировщика, но с собственными метриками (см. SeedsScheduler.fork).
+        Используется, чтобы сидить несколько сценариев одновременно поверх одних соединений.
+        """
+        return SeedsBuilder(
+            users_gateway_client=self.users_gateway_client,
+            cards_gateway_client=self.cards_gateway_client,
+            accounts_gateway_client=self.accounts_gateway_client,
+            operations_gateway_client=self.operations_gateway_client,
+            workers=self.workers,
+            scheduler=self.scheduler.fork()
         )
-        return SeedCardResult(card_id=response.card.id)
 
-    def build_physical_card_result(self, user_id: str, account_id: str) -> SeedCardResult:
+    def build_card_result(self, endpoint: str, user_id: str, account_id: str) -> SeedCardResult:
         """
-        Выпускает физическую карту для заданного пользователя и счёта.
+        Выпускает карту на счёте.
 
         Args:
+            endpoint: Эндпоинт выпуска карты из CARD_ENDPOINTS, например "issue_virtual_card"
             user_id: Идентификатор пользователя
             account_id: Идентификатор счёта
 
         Returns:
             SeedCardResult: Результат с ID выпущенной карты
         """
-        response = self.cards_gateway_client.issue_physical_card(
+        response = self.scheduler.call(
+            endpoint,
+            getattr(self.cards_gateway_client, endpoint),
             user_id=user_id,
             account_id=account_id
         )
         return SeedCardResult(card_id=response.card.id)
 
-    def build_top_up_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
-        """
-        Выполняет операцию пополнения на карту.
-
-        Args:
-            card_id: Идентификатор карты
-            account_id: Идентификатор счёта
-
-        Returns:
-            SeedOperationResult: Результат с ID выполненной операции
-        """
-        response = self.operations_gateway_client.make_top_up_operation(
-            card_id=card_id,
-            account_id=account_id
-        )
-        return SeedOperationResult(operation_id=response.operation.id)
-
-    def build_purchase_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
-        """
-        Выполняет операцию покупки по карте.
-
-        Args:
-            card_id: Идентификатор карты
-            account_id: Идентификатор счёта
-
-        Returns:
-            SeedOperationResult: Результат с ID выполненной операции
-        """
-        response = self.operations_gateway_client.make_purchase_operation(
-            card_id=card_id,
-            account_id=account_id
-        )
-        return SeedOperationResult(operation_id=response.operation.id)
-
-    def build_transfer_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+    def build_operation_result(self, endpoint: str, card_id: str, account_id: str) -> SeedOperationResult:
         """
-        Выполняет операцию перевода по карте.
+        Выполняет операцию по карте.
 
         Args:
+            endpoint: Эндпоинт операции из OPERATION_ENDPOINTS, например "make_purchase_operation"
             card_id: Идентификатор карты
             account_id: Идентификатор счёта
 
         Returns:
             SeedOperationResult: Результат с ID выполненной операции
         """
-        response = self.operations_gateway_client.make_transfer_operation(
+        response = self.scheduler.call(
+            endpoint,
+            getattr(self.operations_gateway_client, endpoint),
             card_id=card_id,
             account_id=account_id
         )
         return SeedOperationResult(operation_id=response.operation.id)
 
-    def build_cash_withdrawal_operation_result(self, card_id: str, account_id: str) -> SeedOperationResult:
+    def build_account_result(self, kind: str, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
         """
-        Выполняет операцию снятия наличных по карте.
+        Открывает счёт заданного вида и создаёт на нём карты и операции согласно плану.
 
-        Args:
-            card_id: Идентификатор карты
-            account_id: Идентификатор счёта
+        Каждый вид карт и операций (см. seeds.registry) — одна группа задач. Все они зависят только
+        от ID счёта и ID карты для операций, поэтому образуют один уровень графа и выполняются
+        планировщиком одновременно.
 
-        Returns:
-            SeedOperationResult: Результат с ID выполненной операции
-        """
-        response = self.operations_gateway_client.make_cash_withdrawal_operation(
-            card_id=card_id,
-            account_id=account_id
-        )
-        return SeedOperationResult(operation_id=response.operation.id)
-
-    def build_savings_account_result(self, user_id: str) -> SeedAccountResult:
-        """
-        Открывает сберегательный счёт для пользователя.
+        Операции проводятся по карте, выпущенной вместе со счётом. Если счёт открывается без карты
+        (сберегательный, депозитный), а операции в плане есть, перед ними отдельным уровнем выпускается
+        виртуальная карта. Она засчитывается в план виртуальных карт счёта, а если план их не
+        предусматривает — сохраняется отдельно в operations_cards, чтобы virtual_cards совпадал с планом.
 
         Args:
+            kind: Вид счетов из ACCOUNT_ENDPOINTS, например "credit_card_accounts"
+            plan: План счёта (кол-во карт, операций и т.п.)
             user_id: Идентификатор пользователя
 
         Returns:
-            SeedAccountResult: Результат с ID созданного счёта
+            SeedAccountResult: Результат с ID счёта, картами и операциями
         """
-        response = self.accounts_gateway_client.open_savings_account(user_id=user_id)
-        return SeedAccountResult(account_id=response.account.id)
-
-    def build_deposit_account_result(self, user_id: str) -> SeedAccountResult:
-        """
-        Открывает депозитный счёт для пользователя.
-
-        Args:
-            user_id: Идентификатор пользователя
-
-        Returns:
-            SeedAccountResult: Результат с ID созданного счёта
-        """
-        response = self.accounts_gateway_client.open_deposit_account(user_id=user_id)
-        return SeedAccountResult(account_id=response.account.id)
-
-    def build_debit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
-        """
-        Открывает дебетовый счёт для пользователя и при необходимости:
-        - выпускает физические карты
-        - выполняет операции пополнения (top-up)
-        - выполняет операции покупки
-
-        Args:
-            plan: План создания дебетового счёта (кол-во карт, операций и т.п.)
-            user_id: Идентификатор пользователя
-
-        Returns:
-            SeedAccountResult: Результат с ID счёта и дополнительными действиями (карты, операции)
-        """
-        response = self.accounts_gateway_client.open_debit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
+        endpoint = ACCOUNT_ENDPOINTS[kind]
+        response = self.scheduler.call(endpoint, getattr(self.accounts_gateway_client, endpoint), user_id=user_id)
         account_id = response.account.id
 
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=response.account.id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
+        cards = {relation: [] for relation in CARD_ENDPOINTS}
+        operations_cards = []
+        card_id = response.account.cards[0].id if response.account.cards else None
+        if card_id is None and any(getattr(plan, relation).count for relation in OPERATION_ENDPOINTS):
+            card = self.build_card_result(CARD_ENDPOINTS[OPERATIONS_CARD], user_id=user_id, account_id=account_id)
+            (cards[OPERATIONS_CARD] if getattr(plan, OPERATIONS_CARD).count else operations_cards).append(card)
+            card_id = card.card_id
+
+        groups = self.scheduler.gather_groups(
+            *[
+                [partial(self.build_card_result, endpoint, user_id=user_id, account_id=account_id)]
+                * (getattr(plan, relation).count - len(cards[relation]))
+                for relation, endpoint in CARD_ENDPOINTS.items()
             ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
+            *[
+                [partial(self.build_operation_result, endpoint, card_id=card_id, account_id=account_id)]
+                * getattr(plan, relation).count
+                for relation, endpoint in OPERATION_ENDPOINTS.items()
             ]
         )
 
-    def build_credit_card_account_result(self, plan: SeedAccountsPlan, user_id: str) -> SeedAccountResult:
+        return SeedAccountResult(
+            account_id=account_id,
+            operations_cards=operations_cards,
+            **{
+                relation: cards.get(relation, []) + group
+                for relation, group in zip([*CARD_ENDPOINTS, *OPERATION_ENDPOINTS], groups)
+            }
+        )
+
+    def build_user_accounts(self, plan: SeedUsersPlan, user: SeedUserResult) -> SeedUserResult:
         """
-        Открывает кредитный счёт и выполняет действия согласно плану:
-        - выпускает физические карты
-        - выполняет операции пополнения (top-up)
-        - выполняет операции покупки
+        Доводит счета пользователя до плана: открывает только недостающие счета каждого вида
+        (с картами и операциями по плану), а лишние счета отбрасывает из результата.
 
         Args:
-            plan: План создания кредитного счёта
-            user_id: Идентификатор пользователя
+            plan: План генерации пользователя
+            user: Уже созданный пользователь (для нового пользователя — без счетов)
 
         Returns:
-            SeedAccountResult: Результат с ID счёта и деталями операций
+            SeedUserResult: Пользователь с полным по плану набором счетов
         """
-        response = self.accounts_gateway_client.open_credit_card_account(user_id=user_id)
-        card_id = response.account.cards[0].id
-        account_id = response.account.id
-
-        return SeedAccountResult(
-            account_id=response.account.id,
-            physical_cards=[
-                self.build_physical_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.physical_cards.count)
-            ],
-            virtual_cards=[
-                self.build_virtual_card_result(user_id=user_id, account_id=account_id)
-                for _ in range(plan.virtual_cards.count)
-            ],
-            top_up_operations=[
-                self.build_top_up_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.top_up_operations.count)
-            ],
-            purchase_operations=[
-                self.build_purchase_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.purchase_operations.count)
-            ],
-            transfer_operations=[
-                self.build_transfer_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.transfer_operations.count)
-            ],
-            cash_withdrawal_operations=[
-                self.build_cash_withdrawal_operation_result(card_id=card_id, account_id=account_id)
-                for _ in range(plan.cash_withdrawal_operations.count)
+        user_id = user.user_id
+
+        # Все счета зависят только от ID пользователя — открываем их одновременно
+        groups = self.scheduler.gather_groups(
+            *[
+                [partial(self.build_account_result, kind=kind, plan=getattr(plan, kind), user_id=user_id)]
+                * (getattr(plan, kind).count - len(getattr(user, kind)))
+                for kind in ACCOUNT_ENDPOINTS
             ]
         )
 
+        return SeedUserResult(
+            user_id=user_id,
+            **{
+                kind: (getattr(user, kind) + accounts)[:getattr(plan, kind).count]
+                for kind, accounts in zip(ACCOUNT_ENDPOINTS, groups)
+            }
+        )
+
     def build_user(self, plan: SeedUsersPlan) -> SeedUserResult:
         """
         Создаёт пользователя и согласно переданному плану:
@@ -276,68 +231,152 @@ class SeedsBuilder:
         Returns:
             SeedUserResult: Результат с ID пользователя и всеми созданными сущностями
         """
-        response = self.users_gateway_client.create_user()
+        response = self.scheduler.call("create_user", self.users_gateway_client.create_user)
+        return self.build_user_accounts(plan=plan, user=SeedUserResult(user_id=response.user.id))
 
-        return SeedUserResult(
-            user_id=response.user.id,
-            savings_accounts=[
-                self.build_savings_account_result(user_id=response.user.id)
-                for _ in range(plan.savings_accounts.count)
-            ],
-            deposit_accounts=[
-                self.build_deposit_account_result(user_id=response.user.id)
-                for _ in range(plan.deposit_accounts.count)
-            ],
-            debit_card_accounts=[
-                self.build_debit_card_account_result(plan=plan.debit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.debit_card_accounts.count)
-            ],
-            credit_card_accounts=[
-                self.build_credit_card_account_result(plan=plan.credit_card_accounts, user_id=response.user.id)
-                for _ in range(plan.credit_card_accounts.count)
-            ]
-        )
-
-    def build(self, plan: SeedsPlan) -> SeedsResult:
+    def build(
+            self,
+            plan: SeedsPlan,
+            users: list[SeedUserResult] | None = None,
+            on_user: Callable[[SeedUserResult], None] | None = None
+    ) -> SeedsResult:
         """
         Генерирует полную структуру данных на основе плана:
         - создаёт указанное количество пользователей
         - каждому пользователю присваиваются счета, карты и операции
 
+        Если переданы уже созданные пользователи (из прошлого дампа или checkpoint), они
+        дополняются недостающими счетами, а новыми создаются только недостающие пользователи.
+        Так наращивание данных стоит пропорционально приросту плана, а не его полному размеру.
+
+        Пользователи независимы друг от друга, поэтому при workers > 1 они создаются
+        параллельно в пуле greenlet'ов. Pool.map сохраняет порядок, так что результат
+        детерминирован и совпадает с последовательным режимом.
+
+        Прогресс (пользователи, сущности в секунду, ETA) пишется в лог каждые
+        SEEDS.PROGRESS_INTERVAL секунд, итоговая статистика доступна через metrics.
+
         Args:
             plan: Полный план генерации данных
+            users: Уже созданные пользователи, которых нужно дополнить до плана
+            on_user: Колбэк, вызываемый сразу после готовности каждого пользователя
+                     (например, для записи в checkpoint-файл)
 
         Returns:
-            SeedsResult: Результат с данными всех созданных пользователей
+            SeedsResult: Результат с данными всех пользователей плана
         """
-        return SeedsResult(users=[self.build_user(plan=plan.users) for _ in range(plan.users.count)])
+        users = (users or [])[:plan.users.count]
+        self.metrics.start(total_users=plan.users.count)
+
+        def build_user(index: int) -> SeedUserResult:
+            if index < len(users):
+                user = self.build_user_accounts(plan=plan.users, user=users[index])
+            else:
+                user = self.build_user(plan=plan.users)
+
+            self.metrics.add_user()
+            if on_user is not None:
+                on_user(user)
+
+            return user
+
+        if self.workers == 1:
+            return SeedsResult(users=[build_user(index) for index in range(plan.users.count)])
+
+        pool = Pool(size=self.workers)
+        users = pool.map(build_user, range(plan.users.count))
+        return SeedsResult(users=users)
 
 
 def build_grpc_seeds_builder() -> SeedsBuilder:
     """
     Фабрика для создания сидера с использованием gRPC-клиентов.
+    Все четыре клиента работают через один канал к gateway.
 
     Returns:
         SeedsBuilder: Инициализированный сидер с gRPC-клиентами
     """
+    channel = build_gateway_grpc_client()
     return SeedsBuilder(
-        users_gateway_client=build_users_gateway_grpc_client(),
-        cards_gateway_client=build_cards_gateway_grpc_client(),
-        accounts_gateway_client=build_accounts_gateway_grpc_client(),
-        operations_gateway_client=build_operations_gateway_grpc_client()
+        users_gateway_client=UsersGatewayGRPCClient(channel=channel),
+        cards_gateway_client=CardsGatewayGRPCClient(channel=channel),
+        accounts_gateway_client=AccountsGatewayGRPCClient(channel=channel),
+        operations_gateway_client=OperationsGatewayGRPCClient(channel=channel),
+        workers=settings.seeds.workers,
+        scheduler=build_seeds_scheduler()
     )
 
 
-def build_http_seeds_builder():
+def build_http_seeds_builder() -> SeedsBuilder:
     """
     Фабрика для создания сидера с использованием HTTP-клиентов.
+    Все четыре клиента используют один httpx.Client и его пул соединений.
+    Ответы 4xx/5xx превращаются в исключения, чтобы планировщик мог классифицировать ошибки и повторять временные.
 
     Returns:
         SeedsBuilder: Инициализированный сидер с HTTP-клиентами
     """
+    client = build_gateway_http_client(raise_for_status=True)
+    return SeedsBuilder(
+        users_gateway_client=UsersGatewayHTTPClient(client=client),
+        cards_gateway_client=CardsGatewayHTTPClient(client=client),
+        accounts_gateway_client=AccountsGatewayHTTPClient(client=client),
+        operations_gateway_client=OperationsGatewayHTTPClient(client=client),
+        workers=settings.seeds.workers,
+        scheduler=build_seeds_scheduler()
+    )
+
+
+def build_services_seeds_builder() -> SeedsBuilder:
+    """
+    Фабрика для создания сидера, который пишет данные напрямую во внутренние сервисы
+    (UsersService, AccountsService, CardsService, OperationsService) в обход gateway.
+
+    Сущности создаются без fan-out и валидации gateway и не прогревают его кэши перед замером.
+    Результат — тот же SeedsResult, что и у сидинга через gateway.
+
+    Returns:
+        SeedsBuilder: Инициализированный сидер с клиентами внутренних сервисов
+
+    Raises:
+        ValueError: Если адреса сервисов (SEEDS.SERVICES.*) не заданы
+    """
+    services = settings.seeds.services
+    if services is None:
+        raise ValueError("SEEDS.SERVICES.* must be configured to use the services seeds backend")
+
+    cards_client = build_cards_service_grpc_client(services.cards)
     return SeedsBuilder(
-        users_gateway_client=build_users_gateway_http_client(),
-        cards_gateway_client=build_cards_gateway_http_client(),
-        accounts_gateway_client=build_accounts_gateway_http_client(),
-        operations_gateway_client=build_operations_gateway_http_client()
+        users_gateway_client=build_users_service_grpc_client(services.users),
+        cards_gateway_client=CardsServiceSeedsClient(cards_client=cards_client),
+        accounts_gateway_client=AccountsServiceSeedsClient(
+            accounts_client=build_accounts_service_grpc_client(services.accounts),
+            cards_client=cards_client
+        ),
+        operations_gateway_client=OperationsServiceSeedsClient(
+            operations_client=build_operations_service_grpc_client(services.operations)
+        ),
+        workers=settings.seeds.workers,
+        scheduler=build_seeds_scheduler()
     )
+
+
+def build_seeds_builder(backend: SeedsBackend) -> SeedsBuilder | AsyncSeedsBuilderProcess:
+    """
+    Фабрика, выбирающая реализацию сидера по настройке SEEDS.BACKEND.
+
+    Args:
+        backend: Бэкенд сидинга (grpc, http, grpc_aio, http_async, services)
+
+    Returns:
+        SeedsBuilder | AsyncSeedsBuilderProcess: Объект с методом build(plan) -> SeedsResult
+    """
+    match backend:
+        case SeedsBackend.GRPC:
+            return build_grpc_seeds_builder()
+        case SeedsBackend.HTTP:
+            return build_http_seeds_builder()
+        case SeedsBackend.SERVICES:
+            return build_services_seeds_builder()
+        case _:
+            return AsyncSeedsBuilderProcess(backend=backend)
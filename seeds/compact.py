@@ -0,0 +1,276 @@
+import random
+from array import array
+from typing import Iterable, Iterator, get_args
+
+from seeds.schema.result import SeedsResult, SeedUserResult, SeedAccountResult
+
+# Виды счетов пользователя: deposit_accounts, savings_accounts, debit_card_accounts, credit_card_accounts
+ACCOUNT_KINDS = tuple(name for name in SeedUserResult.model_fields if name != "user_id")
+
+# Связи счёта с картами и операциями и имя поля идентификатора дочерней сущности,
+# например {"physical_cards": "card_id", "top_up_operations": "operation_id", ...}
+ACCOUNT_RELATIONS = {
+    name: next(iter(get_args(field.annotation)[0].model_fields))
+    for name, field in SeedAccountResult.model_fields.items()
+    if name != "account_id"
+}
+
+
+class IdColumn:
+    """
+    Колонка строковых идентификаторов: все ID хранятся подряд в одном bytearray,
+    а границы — в массиве смещений. Вместо отдельного объекта str (и pydantic-модели вокруг него)
+    на каждый ID тратится только его длина плюс 8 байт смещения.
+    """
+
+    __slots__ = ("blob", "offsets")
+
+    def __init__(self):
+        self.blob = bytearray()
+        self.offsets = array("Q", [0])
+
+    def __len__(self) -> int:
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> str:
+        return self.blob[self.offsets[index]:self.offsets[index + 1]].decode("utf-8")
+
+    def append(self, value: str):
+        self.blob += value.encode("utf-8")
+        self.offsets.append(len(self.blob))
+
+
+class Relation:
+    """
+    Связь «один ко многим» в формате CSR: дочерние записи родителя i лежат в дочерней колонке
+    в диапазоне [offsets[i], offsets[i + 1]).
+    """
+
+    __slots__ = ("offsets",)
+
+    def __init__(self):
+        self.offsets = array("I", [0])
+
+    def range(self, index: int) -> range:
+        return range(self.offsets[index], self.offsets[index + 1])
+
+    def append(self, count: int):
+        self.offsets.append(self.offsets[-1] + count)
+
+
+class SeedEntityView:
+    """
+    Лёгкое представление карты или операции: атрибут card_id/operation_id читается из колонки по запросу.
+    """
+
+    __slots__ = ("column", "index", "id_field")
+
+    def __init__(self, column: IdColumn, index: int, id_field: str):
+        self.column = column
+        self.index = index
+        self.id_field = id_field
+
+    def __getattr__(self, name: str) -> str:
+        if name == self.id_field:
+            return self.column[self.index]
+
+        raise AttributeError(name)
+
+
+class SeedListView:
+    """
+    Неизменяемая последовательность представлений (аналог list[...] в SeedsResult),
+    элементы создаются только при обращении.
+    """
+
+    __slots__ = ("items", "factory")
+
+    def __init__(self, items: range, factory):
+        self.items = items
+        self.factory = factory
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __getitem__(self, index: int):
+        return self.factory(self.items[index])
+
+    def __iter__(self) -> Iterator:
+        return map(self.factory, self.items)
+
+
+class SeedAccountView:
+    """
+    Представление счёта с тем же API, что и SeedAccountResult: account_id, physical_cards, top_up_operations и т.д.
+    """
+
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: "AccountsTable", index: int):
+        self.table = table
+        self.index = index
+
+    @property
+    def account_id(self) -> str:
+        return self.table.ids[self.index]
+
+    def __getattr__(self, name: str) -> SeedListView:
+        if name not in ACCOUNT_RELATIONS:
+            raise AttributeError(name)
+
+        column, id_field = self.table.children[name], ACCOUNT_RELATIONS[name]
+        return SeedListView(
+            self.table.relations[name].range(self.index),
+            lambda index: SeedEntityView(column, index, id_field)
+        )
+
+
+class SeedUserView:
+    """
+    Представление пользователя с тем же API, что и SeedUserResult: user_id, savings_accounts, credit_card_accounts и т.д.
+    """
+
+    __slots__ = ("result", "index")
+
+    def __init__(self, result: "CompactSeedsResult", index: int):
+        self.result = result
+        self.index = index
+
+    @property
+    def user_id(self) -> str:
+        return self.result.user_ids[self.index]
+
+    def __getattr__(self, name: str) -> SeedListView:
+        if name not in ACCOUNT_KINDS:
+            raise AttributeError(name)
+
+        table = self.result.accounts[name]
+        return SeedListView(
+            self.result.user_accounts[name].range(self.index),
+            lambda index: SeedAccountView(table, index)
+        )
+
+    def to_result(self) -> SeedUserResult:
+        """
+        Собирает полноценную pydantic-модель пользователя (например, для сохранения в дамп).
+        """
+        return SeedUserResult(
+            user_id=self.user_id,
+            **{
+                kind: [
+                    SeedAccountResult(
+                        account_id=account.account_id,
+                        **{
+                            relation: [{id_field: getattr(entity, id_field)} for entity in getattr(account, relation)]
+                            for relation, id_field in ACCOUNT_RELATIONS.items()
+                        }
+                    )
+                    for account in getattr(self, kind)
+                ]
+                for kind in ACCOUNT_KINDS
+            }
+        )
+
+
+class AccountsTable:
+    """
+    Счета одного вида: колонка ID счетов и по колонке с CSR-связью на каждый вид карт и операций.
+    """
+
+    __slots__ = ("ids", "children", "relations")
+
+    def __init__(self):
+        self.ids = IdColumn()
+        self.children = {relation: IdColumn() for relation in ACCOUNT_RELATIONS}
+        self.relations = {relation: Relation() for relation in ACCOUNT_RELATIONS}
+
+    def append(self, account: SeedAccountResult):
+        self.ids.append(account.account_id)
+        for relation, id_field in ACCOUNT_RELATIONS.items():
+            entities = getattr(account, relation)
+            for entity in entities:
+                self.children[relation].append(getattr(entity, id_field))
+
+            self.relations[relation].append(len(entities))
+
+
+class CompactSeedsResult:
+    """
+    Компактное колоночное хранилище результата сидинга.
+
+    Вместо дерева pydantic-моделей (по объекту на каждого пользователя, счёт, карту и операцию)
+    все ID хранятся в плоских колонках, а связи — в массивах смещений. Пользователи выдаются
+    как лёгкие представления SeedUserView с тем же API атрибутов, что и SeedUserResult,
+    поэтому сценарии работают с ним без изменений. Занимаемая память на порядок меньше,
+    чем у SeedsResult, что важно, когда пул пользователей держит в памяти каждый воркер Locust.
+    """
+
+    def __init__(self):
+        self.user_ids = IdColumn()
+        self.accounts = {kind: AccountsTable() for kind in ACCOUNT_KINDS}
+        self.user_accounts = {kind: Relation() for kind in ACCOUNT_KINDS}
+        self.cursor = 0
+
+    @classmethod
+    def from_users(cls, users: Iterable[SeedUserResult]) -> "CompactSeedsResult":
+        """
+        Строит хранилище из последовательности пользователей.
+        Пользователи обрабатываются по одному, поэтому при чтении из SeedsDump дамп целиком в памяти не появляется.
+
+        :param users: Пользователи (например, SeedsResult.users или SeedsDump).
+        :return: Заполненное хранилище.
+        """
+        result = cls()
+        for user in users:
+            result.append(user)
+
+        return result
+
+    def append(self, user: SeedUserResult):
+        """
+        Добавляет пользователя со всеми его счетами, картами и операциями.
+        """
+        self.user_ids.append(user.user_id)
+        for kind in ACCOUNT_KINDS:
+            accounts = getattr(user, kind)
+            for account in accounts:
+                self.accounts[kind].append(account)
+
+            self.user_accounts[kind].append(len(accounts))
+
+    def __len__(self) -> int:
+        return len(self.user_ids)
+
+    def __getitem__(self, index: int) -> SeedUserView:
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Compact seeds result has no user with index {index}")
+
+        return SeedUserView(self, index)
+
+    def __iter__(self) -> Iterator[SeedUserView]:
+        for index in range(len(self)):
+            yield SeedUserView(self, index)
+
+    def get_next_user(self) -> SeedUserView:
+        """
+        Возвращает следующего ещё не выданного пользователя (по порядку).
+
+        :raises IndexError: Если все пользователи уже выданы.
+        """
+        user = self[self.cursor]
+        self.cursor += 1
+        return user
+
+    def get_random_user(self) -> SeedUserView:
+        """
+        Возвращает случайного пользователя.
+        """
+        return self[random.randrange(len(self))]
+
+    def to_result(self) -> SeedsResult:
+        """
+        Восстанавливает обычный SeedsResult из хранилища.
+        """
+        return SeedsResult(users=[user.to_result() for user in self])
@@ -0,0 +1,45 @@
+import argparse
+
+from seeds.scenarios import get_seeds_scenarios
+from seeds.schema.estimate import SeedsPlanEstimate
+
+
+def format_duration(seconds: float | None) -> str:
+    if seconds is None:
+        return "unknown (no previous seeding metrics in ./dumps)"
+
+    minutes, seconds = divmod(round(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m {seconds:02d}s" if hours else f"{minutes}m {seconds:02d}s"
+
+
+def format_estimate(scenario: str, estimate: SeedsPlanEstimate) -> str:
+    """
+    Форматирует оценку плана в читаемую таблицу.
+    """
+    lines = [f"[{scenario}] {estimate.total_calls} RPCs, workers={estimate.workers}"]
+    for endpoint, count in sorted(estimate.calls.items()):
+        latency = estimate.latencies.get(endpoint)
+        latency = "n/a" if latency is None else f"{latency:.1f} ms"
+        lines.append(f"    {endpoint:<36} {count:>10}  {latency:>10}")
+
+    if estimate.missing_latencies:
+        lines.append(f"    no latency measured for: {', '.join(estimate.missing_latencies)} (assumed average)")
+
+    lines.append(f"    estimated duration: {format_duration(estimate.duration)}")
+    if estimate.bottleneck is not None:
+        lines.append(f"    bounded by: {estimate.bottleneck}, per user: {estimate.user_duration:.3f}s")
+
+    return "\n".join(lines)
+
+
+if __name__ == '__main__':
+    # Dry-run сидинга: печатает количество RPC и оценку времени по каждому сценарию, не обращаясь к стенду.
+    # Пример: python -m seeds.dry_run existing_user_get_operations --workers 20
+    parser = argparse.ArgumentParser(description="Estimate seeding cost without touching the gateway")
+    parser.add_argument("scenarios", nargs="*", help="Seeds scenario names (default: all)")
+    parser.add_argument("--workers", type=int, default=None, help="Users seeded concurrently (default: SEEDS.WORKERS)")
+    arguments = parser.parse_args()
+
+    for seeds_scenario in get_seeds_scenarios(arguments.scenarios):
+        print(format_estimate(seeds_scenario.scenario, seeds_scenario.estimate(workers=arguments.workers)))
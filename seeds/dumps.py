@@ -1,14 +1,57 @@
+import glob
+import mmap
 import os
+import random
+import time
+from array import array
+from typing import Iterator
 
-from seeds.schema.result import SeedsResult
+from seeds.schema.meta import SeedsMeta, SeedsCheckpointMeta
+from seeds.schema.metrics import SeedsMetricsSummary
+from seeds.schema.result import SeedsResult, SeedUserResult
 from tools.logger import get_logger
 
 logger = get_logger("SEEDS_DUMPS")
 
+# Сколько раз SeedsDump переоткрывает дамп, если попал между подменой файла дампа и таблицы смещений
+SEEDS_DUMP_OPEN_ATTEMPTS = 3
+
+
+class SeedsDumpCorruptedError(ValueError):
+    """
+    Таблица смещений не соответствует файлу дампа: дамп записан не до конца,
+    создан старой версией без завершающего смещения или файлы относятся к разным сидингам.
+    """
+
+
+def get_seeds_file(scenario: str) -> str:
+    """
+    Возвращает путь к дампу сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь вида ./dumps/{scenario}_seeds.jsonl
+    """
+    return f"./dumps/{scenario}_seeds.jsonl"
+
+
+def get_seeds_index_file(scenario: str) -> str:
+    """
+    Возвращает путь к таблице смещений дампа сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь вида ./dumps/{scenario}_seeds.index
+    """
+    return f"./dumps/{scenario}_seeds.index"
+
 
 def save_seeds_result(result: SeedsResult, scenario: str):
     """
-    Сохраняет результат сидинга (SeedsResult) в JSON-файл.
+    Сохраняет результат сидинга (SeedsResult) в построчный JSON-файл (JSONL).
+
+    Каждый пользователь пишется отдельной строкой, а рядом сохраняется таблица смещений строк
+    (массив uint64), по которой SeedsDump читает любого пользователя без загрузки всего файла.
+    Последний элемент таблицы — размер файла дампа: по нему читатель проверяет, что таблица
+    и дамп записаны одним сидингом.
 
     :param result: Результат сидинга, сгенерированный билдером.
     :param scenario: Название сценария нагрузки, для которого создаются данные.
@@ -18,23 +61,343 @@ def save_seeds_result(result: SeedsResult, scenario: str):
     if not os.path.exists("dumps"):
         os.mkdir("dumps")
 
-    # Сохраняем результат сидинга в файл с именем {scenario}_seeds.json
-    seeds_file = f"./dumps/{scenario}_seeds.json"
-    with open(seeds_file, 'w+', encoding="utf-8") as file:
-        file.write(result.model_dump_json())
-        logger.debug(f"Seeding result saved to file: {seeds_file}")
+    # Сохраняем результат сидинга в файл с именем {scenario}_seeds.jsonl
+    seeds_file = get_seeds_file(scenario)
+    index_file = get_seeds_index_file(scenario)
+
+    offsets = array("Q")
+    with open(f"{seeds_file}.tmp", 'wb') as file:
+        for user in result.users:
+            offsets.append(file.tell())
+            file.write(user.model_dump_json().encode("utf-8") + b"\n")
+
+        offsets.append(file.tell())
+
+    with open(f"{index_file}.tmp", 'wb') as file:
+        offsets.tofile(file)
+
+    # Каждый файл подменяется целиком, но вместе — двумя шагами. Читатель, попавший между ними
+    # (или дамп после падения на втором шаге), не совпадёт по завершающему смещению, см. SeedsDump
+    os.replace(f"{seeds_file}.tmp", seeds_file)
+    os.replace(f"{index_file}.tmp", index_file)
+    logger.debug(f"Seeding result saved to file: {seeds_file}")
 
 
 def load_seeds_result(scenario: str) -> SeedsResult:
     """
-    Загружает результат сидинга из JSON-файла.
+    Загружает результат сидинга из JSONL-файла целиком.
+    Для раздачи пользователей в нагрузочных сценариях используйте SeedsDump — он не держит дамп в памяти.
 
     :param scenario: Название сценария нагрузки, данные которого нужно загрузить.
     :return: Объект SeedsResult, восстановленный из файла.
     """
-    # Открываем файл и валидируем его как объект SeedsResult
-    seeds_file = f'./dumps/{scenario}_seeds.json'
-    with open(seeds_file, 'r', encoding="utf-8") as file:
-        result = SeedsResult.model_validate_json(file.read())
-        logger.debug(f"Seeding result loaded from file: {seeds_file}")
+    with SeedsDump(scenario) as dump:
+        result = SeedsResult(users=list(dump))
+        logger.debug(f"Seeding result loaded from file: {dump.seeds_file}")
         return result
+
+
+class SeedsDump:
+    """
+    Ленивое представление дампа сидинга.
+
+    Файл дампа и таблица смещений отображаются в память через mmap, поэтому загрузка занимает
+    константное время и память независимо от числа пользователей: страницы подгружаются ОС
+    по мере обращения, а SeedUserResult создаётся только для запрошенного пользователя.
+
+    Поддерживает тот же интерфейс раздачи, что и SeedsResult (get_next_user, get_random_user),
+    а также len(), доступ по индексу и итерацию.
+
+    При открытии проверяется, что завершающее смещение таблицы равно размеру дампа. Если дамп
+    подменяется прямо сейчас, открытие повторяется; если файлы так и не совпали,
+    выбрасывается SeedsDumpCorruptedError.
+    """
+
+    def __init__(self, scenario: str):
+        """
+        :param scenario: Название сценария нагрузки, дамп которого нужно открыть.
+        :raises SeedsDumpCorruptedError: Если таблица смещений не соответствует дампу.
+        """
+        self.seeds_file = get_seeds_file(scenario)
+        self.index_file = get_seeds_index_file(scenario)
+        self.cursor = 0
+
+        for attempt in range(SEEDS_DUMP_OPEN_ATTEMPTS):
+            self.data = self._map(self.seeds_file)
+            self.index = self._map(self.index_file)
+            self.offsets = memoryview(self.index).cast("Q")
+            if len(self.offsets) and self.offsets[-1] == len(self.data):
+                return
+
+            self.close()
+            time.sleep(0.1 * (attempt + 1))
+
+        raise SeedsDumpCorruptedError(f"Seeds dump {self.seeds_file} does not match its index {self.index_file}")
+
+    @staticmethod
+    def _map(path: str) -> mmap.mmap | bytes:
+        with open(path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                return b""
+
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def __len__(self) -> int:
+        # Последнее смещение — размер дампа, а не начало пользователя
+        return len(self.offsets) - 1
+
+    def __getitem__(self, index: int) -> SeedUserResult:
+        """
+        Читает пользователя по порядковому номеру в дампе.
+
+        :param index: Номер пользователя (поддерживаются отрицательные индексы).
+        :return: Пользователь из дампа.
+        :raises IndexError: Если номер вне дампа.
+        """
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError(f"Seeds dump {self.seeds_file} has no user with index {index}")
+
+        return SeedUserResult.model_validate_json(self.data[self.offsets[index]:self.offsets[index + 1]])
+
+    def __iter__(self) -> Iterator[SeedUserResult]:
+        for index in range(len(self)):
+            yield self[index]
+
+    def __enter__(self) -> "SeedsDump":
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def get_next_user(self) -> SeedUserResult:
+        """
+        Возвращает следующего ещё не выданного пользователя (по порядку дампа).
+
+        :return: Следующий пользователь.
+        :raises IndexError: Если все пользователи уже выданы.
+        """
+        user = self[self.cursor]
+        self.cursor += 1
+        return user
+
+    def get_random_user(self) -> SeedUserResult:
+        """
+        Возвращает случайного пользователя из дампа.
+
+        :return: Случайный пользователь.
+        """
+        return self[random.randrange(len(self))]
+
+    def close(self):
+        """
+        Освобождает отображения файлов в память.
+        """
+        self.offsets.release()
+        for mapping in (self.data, self.index):
+            if isinstance(mapping, mmap.mmap):
+                mapping.close()
+
+
+def is_seeds_dump_consistent(scenario: str) -> bool:
+    """
+    Проверяет без отображения в память, что дамп и таблица смещений существуют
+    и завершающее смещение таблицы равно размеру дампа.
+
+    :param scenario: Название сценария нагрузки.
+    :return: True, если дамп можно открыть через SeedsDump.
+    """
+    seeds_file, index_file = get_seeds_file(scenario), get_seeds_index_file(scenario)
+    if not (os.path.exists(seeds_file) and os.path.exists(index_file)):
+        return False
+
+    with open(index_file, 'rb') as file:
+        if os.fstat(file.fileno()).st_size < 8:
+            return False
+
+        file.seek(-8, os.SEEK_END)
+        size, = array("Q", file.read(8))
+
+    return size == os.path.getsize(seeds_file)
+
+
+def get_seeds_meta_file(scenario: str) -> str:
+    """
+    Возвращает путь к файлу метаданных дампа.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь вида ./dumps/{scenario}_seeds.meta.json
+    """
+    return f"./dumps/{scenario}_seeds.meta.json"
+
+
+def save_seeds_meta(meta: SeedsMeta, scenario: str):
+    """
+    Сохраняет метаданные дампа сидинга.
+
+    :param meta: Метаданные: хэш плана, адрес окружения и время создания.
+    :param scenario: Название сценария нагрузки.
+    """
+    os.makedirs("dumps", exist_ok=True)
+
+    meta_file = get_seeds_meta_file(scenario)
+    with open(meta_file, 'w+', encoding="utf-8") as file:
+        file.write(meta.model_dump_json())
+        logger.debug(f"Seeding meta saved to file: {meta_file}")
+
+
+def load_seeds_meta(scenario: str) -> SeedsMeta | None:
+    """
+    Загружает метаданные дампа сидинга.
+    Возвращает None, если метаданных или самого дампа нет, либо таблица смещений не соответствует
+    дампу (например, дамп создан старой версией или сидинг упал при его подмене).
+
+    :param scenario: Название сценария нагрузки.
+    :return: Метаданные дампа или None.
+    """
+    meta_file = get_seeds_meta_file(scenario)
+    if not (os.path.exists(meta_file) and is_seeds_dump_consistent(scenario)):
+        return None
+
+    with open(meta_file, 'r', encoding="utf-8") as file:
+        return SeedsMeta.model_validate_json(file.read())
+
+
+def get_seeds_metrics_file(scenario: str) -> str:
+    """
+    Возвращает путь к файлу со статистикой последнего сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь вида ./dumps/{scenario}_seeds.metrics.json
+    """
+    return f"./dumps/{scenario}_seeds.metrics.json"
+
+
+def save_seeds_metrics(summary: SeedsMetricsSummary, scenario: str):
+    """
+    Сохраняет итоговую статистику сидинга рядом с дампом.
+
+    :param summary: Счётчики сущностей, скорость и гистограммы задержек по эндпоинтам.
+    :param scenario: Название сценария нагрузки.
+    """
+    os.makedirs("dumps", exist_ok=True)
+
+    metrics_file = get_seeds_metrics_file(scenario)
+    with open(metrics_file, 'w+', encoding="utf-8") as file:
+        file.write(summary.model_dump_json(indent=2))
+        logger.debug(f"Seeding metrics saved to file: {metrics_file}")
+
+
+def load_seeds_metrics_summaries() -> list[SeedsMetricsSummary]:
+    """
+    Загружает статистику всех прошлых сидингов из папки dumps (по всем сценариям).
+
+    :return: Список итоговых статистик; пустой, если сидингов ещё не было.
+    """
+    summaries = []
+    for metrics_file in sorted(glob.glob(get_seeds_metrics_file("*"))):
+        with open(metrics_file, 'r', encoding="utf-8") as file:
+            summaries.append(SeedsMetricsSummary.model_validate_json(file.read()))
+
+    return summaries
+
+
+def get_seeds_cursor_file(scenario: str) -> str:
+    """
+    Возвращает путь к файлу общего курсора раздачи пользователей между процессами.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь вида ./dumps/{scenario}_seeds.cursor
+    """
+    return f"./dumps/{scenario}_seeds.cursor"
+
+
+def get_seeds_checkpoint_file(scenario: str) -> str:
+    """
+    Возвращает путь к checkpoint-файлу сидинга.
+
+    :param scenario: Название сценария нагрузки.
+    :return: Путь вида ./dumps/{scenario}_seeds.checkpoint.jsonl
+    """
+    return f"./dumps/{scenario}_seeds.checkpoint.jsonl"
+
+
+def append_seeds_checkpoint(user: SeedUserResult, meta: SeedsCheckpointMeta, scenario: str):
+    """
+    Дописывает готового пользователя в checkpoint-файл (одна строка JSON на пользователя).
+    Новый файл начинается с заголовка SeedsCheckpointMeta.
+
+    Вызывается сразу после создания каждого пользователя, поэтому при падении сидинга
+    все уже созданные пользователи остаются на диске.
+
+    :param user: Полностью созданный пользователь со всеми счетами, картами и операциями.
+    :param meta: План и окружение, для которых создаётся пользователь.
+    :param scenario: Название сценария нагрузки.
+    """
+    os.makedirs("dumps", exist_ok=True)
+
+    with open(get_seeds_checkpoint_file(scenario), 'a', encoding="utf-8") as file:
+        if not file.tell():
+            file.write(meta.model_dump_json() + "\n")
+
+        file.write(user.model_dump_json() + "\n")
+
+
+def load_seeds_checkpoint(meta: SeedsCheckpointMeta, scenario: str) -> list[SeedUserResult]:
+    """
+    Загружает пользователей из checkpoint-файла.
+
+    Checkpoint, записанный для другого плана или окружения (или без заголовка), удаляется,
+    а его пользователи не возвращаются.
+
+    Если процесс упал во время записи, последняя строка окажется неполной. Она отбрасывается,
+    а файл обрезается до последней целой строки, чтобы новые записи не склеились с обрывком.
+
+    :param meta: План и окружение текущего сидинга.
+    :param scenario: Название сценария нагрузки.
+    :return: Список пользователей, созданных до остановки сидинга, или пустой список.
+    """
+    checkpoint_file = get_seeds_checkpoint_file(scenario)
+    if not os.path.exists(checkpoint_file):
+        return []
+
+    with open(checkpoint_file, 'rb+') as file:
+        header = file.readline()
+        try:
+            matches = header.endswith(b"\n") and SeedsCheckpointMeta.model_validate_json(header) == meta
+        except ValueError:
+            matches = False
+
+        if not matches:
+            logger.warning(f"Discarding checkpoint written for another plan or target: {checkpoint_file}")
+            users = None
+        else:
+            users, offset = [], len(header)
+            for line in file:
+                if not line.endswith(b"\n"):
+                    logger.warning(f"Dropping incomplete checkpoint line in file: {checkpoint_file}")
+                    file.truncate(offset)
+                    break
+
+                users.append(SeedUserResult.model_validate_json(line))
+                offset += len(line)
+
+    if users is None:
+        remove_seeds_checkpoint(scenario)
+        return []
+
+    logger.debug(f"Loaded {len(users)} users from checkpoint file: {checkpoint_file}")
+    return users
+
+
+def remove_seeds_checkpoint(scenario: str):
+    """
+    Удаляет checkpoint-файл сидинга, если он существует.
+
+    :param scenario: Название сценария нагрузки.
+    """
+    checkpoint_file = get_seeds_checkpoint_file(scenario)
+    if os.path.exists(checkpoint_file):
+        os.remove(checkpoint_file)
+        logger.debug(f"Seeding checkpoint removed: {checkpoint_file}")
@@ -0,0 +1,147 @@
+import math
+
+from seeds.registry import (
+    ACCOUNT_ENDPOINTS,
+    CARD_ACCOUNT_KINDS,
+    CARD_ENDPOINTS,
+    OPERATION_ENDPOINTS,
+    OPERATIONS_CARD
+)
+from seeds.schema.estimate import SeedsPlanEstimate
+from seeds.schema.metrics import SeedsMetricsSummary
+from seeds.schema.plan import SeedsPlan, SeedAccountsPlan
+
+
+def needs_operations_card(kind: str, plan: SeedAccountsPlan) -> bool:
+    """
+    Проверяет, выпустит ли SeedsBuilder отдельную карту для операций: счёт открывается без карты,
+    а операции в плане есть (см. SeedsBuilder.build_account_result).
+
+    :param kind: Вид счетов из SeedUsersPlan, например "savings_accounts".
+    :param plan: План счёта.
+    """
+    return kind not in CARD_ACCOUNT_KINDS and any(getattr(plan, relation).count for relation in OPERATION_ENDPOINTS)
+
+
+def get_account_leaf_calls(kind: str, plan: SeedAccountsPlan) -> dict[str, int]:
+    """
+    Считает вызовы выпуска карт и операций на одном счёте.
+
+    :param kind: Вид счетов из SeedUsersPlan, например "credit_card_accounts".
+    :param plan: План счёта.
+    :return: Количество вызовов по эндпоинтам, например {"issue_virtual_card": 1, "make_purchase_operation": 5}.
+    """
+    calls = {
+        endpoint: getattr(plan, relation).count
+        for relation, endpoint in {**CARD_ENDPOINTS, **OPERATION_ENDPOINTS}.items()
+        if getattr(plan, relation).count
+    }
+    if needs_operations_card(kind, plan):
+        # Карта для операций засчитывается в план виртуальных карт или выпускается сверх него (operations_cards)
+        endpoint = CARD_ENDPOINTS[OPERATIONS_CARD]
+        calls[endpoint] = max(calls.get(endpoint, 0), 1)
+
+    return calls
+
+
+def count_seeds_plan_calls(plan: SeedsPlan) -> dict[str, int]:
+    """
+    Перемножает план: сколько RPC каждого вида выполнит SeedsBuilder для полного плана с нуля.
+
+    :param plan: План сидинга.
+    :return: Количество вызовов по эндпоинтам.
+    """
+    users = plan.users.count
+    calls = {"create_user": users} if users else {}
+    for kind, endpoint in ACCOUNT_ENDPOINTS.items():
+        accounts = getattr(plan.users, kind)
+        if not accounts.count:
+            continue
+
+        calls[endpoint] = users * accounts.count
+        for leaf, count in get_account_leaf_calls(kind, accounts).items():
+            calls[leaf] = calls.get(leaf, 0) + users * accounts.count * count
+
+    return calls
+
+
+def get_endpoint_latencies(summaries: list[SeedsMetricsSummary]) -> dict[str, float]:
+    """
+    Средние задержки эндпоинтов в миллисекундах по прошлым сидингам, взвешенные по количеству вызовов.
+
+    :param summaries: Итоговые статистики прошлых сидингов (см. load_seeds_metrics_summaries).
+    :return: Средняя задержка по эндпоинтам.
+    """
+    totals, counts = {}, {}
+    for summary in summaries:
+        for endpoint, metrics in summary.endpoints.items():
+            totals[endpoint] = totals.get(endpoint, 0.0) + metrics.mean * metrics.count
+            counts[endpoint] = counts.get(endpoint, 0) + metrics.count
+
+    return {endpoint: round(totals[endpoint] / count, 3) for endpoint, count in counts.items() if count}
+
+
+def estimate_seeds_plan(
+        plan: SeedsPlan,
+        workers: int,
+        latencies: dict[str, float],
+        limits: dict[str, int] | None = None,
+        rates: dict[str, float] | None = None
+) -> SeedsPlanEstimate:
+    """
+    Оценивает количество RPC и время сидинга плана.
+
+    SeedsBuilder создаёт workers пользователей одновременно, а внутри пользователя выполняет
+    уровни графа параллельно, поэтому время одного пользователя — это критический путь:
+    create_user + самый долгий из счетов (открытие + карта для операций, если она нужна + самый долгий лист). Итоговая оценка —
+    максимум из трёх ограничений:
+    - пачки по workers пользователей, каждая длиной в критический путь;
+    - лимиты одновременных вызовов: count * latency / limit по эндпоинту;
+    - частоты ограничителя: count / rate по эндпоинту.
+
+    Оценка предполагает, что задержки стенда не растут под нагрузкой сидинга, поэтому это нижняя граница.
+
+    :param plan: План сидинга.
+    :param workers: Количество пользователей, создаваемых параллельно.
+    :param latencies: Средние задержки эндпоинтов в миллисекундах (см. get_endpoint_latencies).
+    :param limits: Лимиты одновременных вызовов по эндпоинтам (SEEDS.ENDPOINT_LIMITS).
+    :param rates: Частоты вызовов по эндпоинтам (SEEDS.THROTTLE).
+    :return: Оценка плана.
+    """
+    workers = max(workers, 1)
+    calls = count_seeds_plan_calls(plan)
+    estimate = SeedsPlanEstimate(calls=calls, total_calls=sum(calls.values()), workers=workers)
+    known = {endpoint: latencies[endpoint] for endpoint in calls if endpoint in latencies}
+    if not calls or not known:
+        return estimate
+
+    fallback = sum(known.values()) / len(known)
+    estimate.latencies = known
+    estimate.missing_latencies = sorted(endpoint for endpoint in calls if endpoint not in known)
+
+    def get_latency(endpoint: str) -> float:
+        return known.get(endpoint, fallback) / 1000
+
+    account_paths = [0.0]
+    for kind, endpoint in ACCOUNT_ENDPOINTS.items():
+        accounts = getattr(plan.users, kind)
+        if not accounts.count:
+            continue
+
+        # Карта для операций на счёте без карты выпускается отдельным уровнем перед остальными вызовами
+        card = get_latency(CARD_ENDPOINTS[OPERATIONS_CARD]) if needs_operations_card(kind, accounts) else 0.0
+        leaves = get_account_leaf_calls(kind, accounts)
+        account_paths.append(get_latency(endpoint) + card + max(map(get_latency, leaves), default=0.0))
+
+    estimate.user_duration = round(get_latency("create_user") + max(account_paths), 3)
+    bounds = {"workers": math.ceil(plan.users.count / workers) * estimate.user_duration}
+    for endpoint, limit in (limits or {}).items():
+        if endpoint in calls and limit:
+            bounds[endpoint] = calls[endpoint] * get_latency(endpoint) / limit
+    for endpoint, rate in (rates or {}).items():
+        if endpoint in calls and rate:
+            bounds[endpoint] = max(bounds.get(endpoint, 0.0), calls[endpoint] / rate)
+
+    estimate.bottleneck = max(bounds, key=bounds.get)
+    estimate.duration = round(bounds[estimate.bottleneck], 3)
+    return estimate
@@ -0,0 +1,257 @@
+import time
+from bisect import bisect_left
+from collections import Counter
+from datetime import datetime, timezone
+
+from seeds.schema.metrics import SeedsMetricsSummary, SeedsEndpointMetrics
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_METRICS")
+
+# Верхние границы корзин гистограммы задержек в миллисекундах: геометрическая сетка
+# с шагом 2^(1/4) (~19%) от 0.5 мс до ~110 с. Последняя корзина принимает всё, что больше.
+LATENCY_BUCKETS = tuple(round(0.5 * 2 ** (index / 4), 3) for index in range(72))
+
+
+def get_entity_kind(endpoint: str) -> str:
+    """
+    Возвращает тип сущности, которую создаёт эндпоинт сидинга.
+
+    :param endpoint: Имя эндпоинта (имя метода клиента, например "open_deposit_account").
+    :return: users, accounts, cards, operations или other.
+    """
+    if endpoint == "create_user":
+        return "users"
+    if endpoint.startswith("open_"):
+        return "accounts"
+    if endpoint.startswith("issue_"):
+        return "cards"
+    if endpoint.startswith("make_"):
+        return "operations"
+
+    return "other"
+
+
+class LatencyHistogram:
+    """
+    Гистограмма задержек с фиксированными логарифмическими корзинами.
+    Запись стоит один bisect, память не зависит от количества вызовов,
+    а перцентили считаются с точностью до ширины корзины.
+    """
+
+    __slots__ = ("counts", "count", "errors", "transient_errors", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.errors = 0
+        self.transient_errors = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def record(self, milliseconds: float, error: bool = False, transient: bool = False):
+        """
+        :param milliseconds: Задержка вызова в миллисекундах.
+        :param error: Вызов завершился исключением.
+        :param transient: Ошибка временная (перегрузка, недоступность, таймаут) — считается отдельно от фатальных.
+        """
+        self.counts[min(bisect_left(LATENCY_BUCKETS, milliseconds), len(LATENCY_BUCKETS) - 1)] += 1
+        self.count += 1
+        self.errors += error and not transient
+        self.transient_errors += error and transient
+        self.total += milliseconds
+        self.min = min(self.min, milliseconds)
+        self.max = max(self.max, milliseconds)
+
+    def percentile(self, quantile: float) -> float:
+        """
+        :param quantile: Квантиль от 0 до 1.
+        :return: Верхняя граница корзины, в которую попадает квантиль (не больше максимума).
+        """
+        rank, seen = quantile * self.count, 0
+        for bound, count in zip(LATENCY_BUCKETS, self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(bound, self.max)
+
+        return self.max
+
+    def to_schema(self) -> SeedsEndpointMetrics:
+        if not self.count:
+            return SeedsEndpointMetrics()
+
+        return SeedsEndpointMetrics(
+            count=self.count,
+            errors=self.errors,
+            transient_errors=self.transient_errors,
+            mean=round(self.total / self.count, 3),
+            min=round(self.min, 3),
+            max=round(self.max, 3),
+            p50=round(self.percentile(0.5), 3),
+            p90=round(self.percentile(0.9), 3),
+            p99=round(self.percentile(0.99), 3),
+            buckets={bound: count for bound, count in zip(LATENCY_BUCKETS, self.counts) if count}
+        )
+
+    def merge(self, metrics: SeedsEndpointMetrics):
+        """
+        Добавляет в гистограмму статистику, собранную в другом процессе.
+
+        :param metrics: Статистика эндпоинта из SeedsMetricsSummary.
+        """
+        if not metrics.count:
+            return
+
+        for bound, count in metrics.buckets.items():
+            self.counts[min(bisect_left(LATENCY_BUCKETS, bound), len(LATENCY_BUCKETS) - 1)] += count
+
+        self.count += metrics.count
+        self.errors += metrics.errors
+        self.transient_errors += metrics.transient_errors
+        self.total += metrics.mean * metrics.count
+        self.min = min(self.min, metrics.min)
+        self.max = max(self.max, metrics.max)
+
+
+class SeedsMetrics:
+    """
+    Счётчики и гистограммы задержек сидинга.
+
+    SeedsScheduler записывает сюда каждый RPC (observe), а билдер — каждого готового пользователя (add_user).
+    После start() метрики не чаще раза в interval секунд пишут в лог прогресс: готовых пользователей,
+    созданные сущности по типам, сущностей в секунду и оценку оставшегося времени. Проверка интервала
+    выполняется прямо при записи, поэтому отчёт не зависит от того, крутится ли цикл событий gevent.
+
+    Attributes:
+        interval: Период вывода прогресса в лог в секундах.
+        total_users: Количество пользователей, которых нужно довести до плана.
+        users: Количество готовых пользователей.
+        entities: Количество созданных сущностей по типам.
+        endpoints: Гистограммы задержек по эндпоинтам.
+    """
+
+    def __init__(self, interval: float = 10.0):
+        self.interval = interval
+        self.total_users = 0
+        self.users = 0
+        self.entities = Counter()
+        self.endpoints: dict[str, LatencyHistogram] = {}
+        self.started_at: datetime | None = None
+        self.started = 0.0
+        self.reported = 0.0
+
+    def start(self, total_users: int):
+        """
+        Сбрасывает метрики и включает вывод прогресса.
+
+        :param total_users: Количество пользователей, которых нужно довести до плана.
+        """
+        self.total_users = total_users
+        self.users = 0
+        self.entities.clear()
+        self.endpoints.clear()
+        self.started_at = datetime.now(timezone.utc)
+        self.started = self.reported = time.perf_counter()
+
+    def observe(self, endpoint: str, seconds: float, error: bool = False, transient: bool = False):
+        """
+        Записывает один вызов эндпоинта.
+
+        :param endpoint: Имя эндпоинта.
+        :param seconds: Длительность вызова в секундах.
+        :param error: Вызов завершился исключением.
+        :param transient: Ошибка временная и вызов может быть повторён.
+        """
+        histogram = self.endpoints.get(endpoint)
+        if histogram is None:
+            histogram = self.endpoints[endpoint] = LatencyHistogram()
+
+        histogram.record(seconds * 1000, error, transient)
+        if not error:
+            self.entities[get_entity_kind(endpoint)] += 1
+
+        self.maybe_report()
+
+    def add_user(self):
+        """
+        Отмечает пользователя, доведённого до плана.
+        """
+        self.users += 1
+        self.maybe_report()
+
+    @property
+    def duration(self) -> float:
+        return time.perf_counter() - self.started if self.started_at else 0.0
+
+    @property
+    def users_rate(self) -> float:
+        return self.users / self.duration if self.duration else 0.0
+
+    @property
+    def entities_rate(self) -> float:
+        return sum(self.entities.values()) / self.duration if self.duration else 0.0
+
+    @property
+    def eta(self) -> float | None:
+        """
+        Оценка оставшегося времени в секундах по текущей скорости или None, пока скорость неизвестна.
+        """
+        if not self.users_rate:
+            return None
+
+        return max(self.total_users - self.users, 0) / self.users_rate
+
+    def maybe_report(self):
+        """
+        Пишет прогресс в лог, если с прошлого отчёта прошло не меньше interval секунд.
+        """
+        if self.started_at is None:
+            return
+
+        now = time.perf_counter()
+        if now - self.reported >= self.interval:
+            self.reported = now
+            self.report()
+
+    def report(self):
+        """
+        Пишет текущий прогресс в лог.
+        """
+        eta = "unknown" if self.eta is None else f"{self.eta:.0f}s"
+        message = (
+            f"Seeded {self.users}/{self.total_users} users in {self.duration:.1f}s "
+            f"({self.users_rate:.1f} users/s), ETA {eta}"
+        )
+        # Сущности неизвестны, пока их считает другой процесс (см. AsyncSeedsBuilderProcess)
+        if self.entities:
+            entities = ", ".join(f"{kind}={count}" for kind, count in sorted(self.entities.items()))
+            message += f"; {self.entities_rate:.1f} entities/s: {entities}"
+
+        logger.info(message)
+
+    def merge(self, summary: SeedsMetricsSummary):
+        """
+        Добавляет сущности и задержки, собранные в другом процессе (например, в AsyncSeedsBuilderProcess).
+        Пользователи не суммируются — их родительский процесс уже учёл через add_user.
+
+        :param summary: Итоговая статистика другого процесса.
+        """
+        self.entities.update(summary.entities)
+        for endpoint, metrics in summary.endpoints.items():
+            self.endpoints.setdefault(endpoint, LatencyHistogram()).merge(metrics)
+
+    def summary(self) -> SeedsMetricsSummary:
+        """
+        :return: Итоговая статистика для сохранения рядом с дампом.
+        """
+        return SeedsMetricsSummary(
+            started_at=self.started_at or datetime.now(timezone.utc),
+            duration=round(self.duration, 3),
+            users=self.users,
+            users_total=self.total_users,
+            users_rate=round(self.users_rate, 3),
+            entities=dict(self.entities),
+            entities_rate=round(self.entities_rate, 3),
+            endpoints={endpoint: histogram.to_schema() for endpoint, histogram in sorted(self.endpoints.items())}
+        )
@@ -0,0 +1,325 @@
+import fcntl
+import mmap
+import os
+import random
+import struct
+from collections import deque
+from typing import Sequence
+
+from gevent.lock import Semaphore
+
+from seeds.selection import SeedUserSelector, UniformSelector
+from tools.config.seeds import SeedUserPoolMode, SeedUserPoolExhaustion
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_POOL")
+
+
+class SeedUserPoolExhaustedError(IndexError):
+    """
+    Свободных пользователей в пуле не осталось (политика FAIL или истёк таймаут политики BLOCK).
+    Наследуется от IndexError — так же завершался SeedsResult.get_next_user на пустом списке.
+    """
+
+
+class SeedUserLease:
+    """
+    Аренда пользователя из пула. Пока аренда не возвращена, пользователь в режиме EXCLUSIVE
+    не выдаётся другим виртуальным пользователям.
+
+    Attributes:
+        user: Арендованный пользователь из сидинга.
+    """
+
+    __slots__ = ("pool", "index", "owned", "user")
+
+    def __init__(self, pool: "SeedUserPool", index: int, owned: bool):
+        self.pool = pool
+        self.index = index
+        self.owned = owned
+        self.user = pool.get(index)
+
+    def release(self):
+        """
+        Возвращает пользователя в пул. Повторный вызов ничего не делает.
+        """
+        self.pool.release(self)
+
+    def __enter__(self) -> "SeedUserLease":
+        return self
+
+    def __exit__(self, *args):
+        self.release()
+
+
+class SeedUserPool:
+    """
+    Пул пользователей из сидинга с арендой и возвратом.
+
+    Свободные пользователи хранятся в deque индексов, поэтому аренда и возврат стоят O(1)
+    (в отличие от list.pop(0) в SeedsResult.get_next_user). Число свободных мест считает
+    gevent-семафор: при политике BLOCK виртуальный пользователь кооперативно ждёт возврата
+    аренды, не блокируя остальные greenlet'ы.
+
+    Режимы:
+    - EXCLUSIVE: пользователь одновременно выдаётся только одному виртуальному пользователю;
+    - SHARED: пользователь может быть выдан не более чем shares виртуальным пользователям сразу
+      (shares=None — без ограничения, пользователи выбираются случайно, как в get_random_user).
+
+    Политики при исчерпании:
+    - FAIL: сразу выбросить SeedUserPoolExhaustedError, как SeedsResult.get_next_user (по умолчанию);
+    - BLOCK: ждать возврата аренды (не дольше timeout секунд, если он задан);
+    - RECYCLE: выдать уже арендованного пользователя без учёта аренды (см. selector).
+
+    Пользователи без учёта аренды (SHARED без shares и RECYCLE) выбираются стратегией selector:
+    по умолчанию равномерно случайно, а также по кругу или с перекосом в сторону горячих пользователей
+    (см. seeds.selection).
+    """
+
+    def __init__(
+            self,
+            users: Sequence,
+            mode: SeedUserPoolMode = SeedUserPoolMode.EXCLUSIVE,
+            shares: int | None = None,
+            exhaustion: SeedUserPoolExhaustion = SeedUserPoolExhaustion.FAIL,
+            timeout: float | None = None,
+            selector: SeedUserSelector | None = None
+    ):
+        """
+        :param users: Пользователи сидинга (SeedsDump, CompactSeedsResult или список SeedUserResult).
+        :param mode: Режим выдачи пользователей.
+        :param shares: Максимум одновременных аренд одного пользователя в режиме SHARED.
+        :param exhaustion: Политика при отсутствии свободных пользователей.
+        :param timeout: Максимальное время ожидания в секундах для политики BLOCK.
+        :param selector: Стратегия выбора пользователей без учёта аренды; по умолчанию — равномерно случайно.
+        """
+        self.users = users
+        self.exhaustion = exhaustion
+        self.timeout = timeout
+        self.shares = 1 if mode == SeedUserPoolMode.EXCLUSIVE else shares
+        self.selector = selector or UniformSelector()
+        self.added = []
+
+        if self.shares is not None:
+            self.free = self.get_initial_free()
+            self.available = Semaphore(len(self.free))
+
+    def get_initial_free(self) -> deque:
+        """
+        Начальная очередь свободных мест: каждый пользователь сидинга shares раз.
+        """
+        return deque(index for _ in range(self.shares) for index in range(len(self.users)))
+
+    def __len__(self) -> int:
+        return len(self.users) + len(self.added)
+
+    def get(self, index: int):
+        """
+        Возвращает пользователя по индексу: сначала идут пользователи сидинга, затем добавленные через add().
+        """
+        if index < len(self.users):
+            return self.users[index]
+
+        return self.added[index - len(self.users)]
+
+    def add(self, user):
+        """
+        Добавляет в пул нового пользователя, созданного во время теста (например, SeedsReplenisher).
+        Пользователь сразу становится доступен для аренды и будит ожидающих при политике BLOCK.
+
+        :param user: Полностью созданный пользователь.
+        """
+        index = len(self)
+        self.added.append(user)
+        if self.shares is None:
+            return
+
+        for _ in range(self.shares):
+            self.free.append(index)
+            self.available.release()
+
+    @property
+    def free_count(self) -> int:
+        """
+        Количество свободных мест для аренды (для пула без ограничения аренд — размер пула).
+        """
+        return len(self) if self.shares is None else self.available.counter
+
+    def next_index(self) -> int:
+        """
+        Возвращает индекс следующего пользователя без учёта аренды (см. selector).
+        """
+        if not len(self):
+            raise SeedUserPoolExhaustedError("Seed user pool is empty")
+
+        return self.selector.select(len(self))
+
+    def acquire(self) -> bool:
+        """
+        Занимает место в пуле согласно политике исчерпания.
+
+        :return: True, если место занято; False, если нужно выдать пользователя без аренды (RECYCLE).
+        :raises SeedUserPoolExhaustedError: Если свободных мест нет (FAIL) или истёк таймаут (BLOCK).
+        """
+        match self.exhaustion:
+            case SeedUserPoolExhaustion.BLOCK:
+                acquired = self.available.acquire(blocking=False)
+                if not acquired:
+                    logger.warning(
+                        f"No free users in seed user pool of {len(self)} users, "
+                        f"waiting for a lease to be released (timeout {self.timeout})"
+                    )
+                    acquired = self.available.acquire(timeout=self.timeout)
+            case SeedUserPoolExhaustion.RECYCLE:
+                return self.available.acquire(blocking=False)
+            case _:
+                acquired = self.available.acquire(blocking=False)
+
+        if not acquired:
+            raise SeedUserPoolExhaustedError(f"No free users left in seed user pool of {len(self)} users")
+
+        return True
+
+    def lease(self) -> SeedUserLease:
+        """
+        Арендует пользователя из пула.
+
+        :return: Аренда, которую нужно вернуть через release() (например, в on_stop TaskSet).
+        :raises SeedUserPoolExhaustedError: Если свободных пользователей нет и политика это запрещает.
+        """
+        if self.shares is None or not self.acquire():
+            return SeedUserLease(self, self.next_index(), owned=False)
+
+        return SeedUserLease(self, self.free.popleft(), owned=True)
+
+    def release(self, lease: SeedUserLease):
+        """
+        Возвращает арендованного пользователя в пул.
+
+        :param lease: Аренда, полученная из lease().
+        """
+        if not lease.owned:
+            return
+
+        lease.owned = False
+        self.free.append(lease.index)
+        self.available.release()
+
+    def get_next_user(self):
+        """
+        Арендует пользователя без возврата — замена SeedsResult.get_next_user за O(1).
+        """
+        return self.lease().user
+
+    def get_random_user(self):
+        """
+        Возвращает случайного пользователя без аренды, как SeedsResult.get_random_user.
+        """
+        if not len(self):
+            raise SeedUserPoolExhaustedError("Seed user pool is empty")
+
+        return self.get(random.randrange(len(self)))
+
+
+class SharedSeedsCursor:
+    """
+    Атомарный счётчик, общий для всех процессов на одной машине (например, при `locust --processes N`).
+
+    Значение хранится в 8-байтовом файле, отображённом в память, а инкремент выполняется
+    под эксклюзивной блокировкой fcntl.flock, поэтому два процесса никогда не получат одно значение.
+    """
+
+    def __init__(self, path: str):
+        """
+        :param path: Путь к файлу счётчика (создаётся при необходимости).
+        """
+        self.path = path
+        self.fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o644)
+        if os.fstat(self.fd).st_size < 8:
+            os.ftruncate(self.fd, 8)
+
+        self.memory = mmap.mmap(self.fd, 8)
+
+    def next(self) -> int:
+        """
+        Возвращает текущее значение счётчика и увеличивает его на единицу.
+        """
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            value, = struct.unpack_from("Q", self.memory)
+            struct.pack_into("Q", self.memory, 0, value + 1)
+            return value
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+    def reset(self):
+        """
+        Обнуляет счётчик (например, перед новым запуском теста).
+        """
+        fcntl.flock(self.fd, fcntl.LOCK_EX)
+        try:
+            struct.pack_into("Q", self.memory, 0, 0)
+        finally:
+            fcntl.flock(self.fd, fcntl.LOCK_UN)
+
+
+class SharedSeedUserPool(SeedUserPool):
+    """
+    Пул в режиме EXCLUSIVE, общий для нескольких процессов на одной машине.
+
+    Все процессы читают один и тот же дамп через mmap (SeedsDump), поэтому страницы дампа
+    лежат в памяти один раз. Ещё не выданных пользователей процессы забирают через общий
+    атомарный курсор SharedSeedsCursor, так что один пользователь не достанется двум процессам.
+    Возвращённые аренды остаются в локальном списке свободных пользователей процесса
+    и переиспользуются им без обращения к курсору.
+
+    Между процессами пользователи не перераспределяются: когда курсор прошёл весь дамп, а локально
+    свободных пользователей нет, аренда сразу завершается SeedUserPoolExhaustedError (и при BLOCK),
+    даже если у других процессов есть возвращённые пользователи. RECYCLE по-прежнему выдаёт
+    пользователя без учёта аренды.
+    """
+
+    def __init__(
+            self,
+            users: Sequence,
+            cursor: SharedSeedsCursor,
+            exhaustion: SeedUserPoolExhaustion = SeedUserPoolExhaustion.FAIL,
+            timeout: float | None = None
+    ):
+        """
+        :param users: Пользователи сидинга, общие для всех процессов (SeedsDump).
+        :param cursor: Общий курсор, по которому процессы забирают пользователей.
+        :param exhaustion: Политика при отсутствии свободных пользователей.
+        :param timeout: Максимальное время ожидания в секундах для политики BLOCK.
+        """
+        super().__init__(users, mode=SeedUserPoolMode.EXCLUSIVE, exhaustion=exhaustion, timeout=timeout)
+        self.shared_cursor = cursor
+
+    def get_initial_free(self) -> deque:
+        """
+        Процесс начинает без свободных пользователей и забирает их через общий курсор.
+        """
+        return deque()
+
+    def acquire(self) -> bool:
+        """
+        Если локально свободных пользователей нет, забирает следующего пользователя через общий курсор,
+        после чего занимает место согласно политике исчерпания.
+
+        :raises SeedUserPoolExhaustedError: Если курсор прошёл весь дамп и локально свободных пользователей нет
+                                     (кроме политики RECYCLE).
+        """
+        if not self.free:
+            index = self.shared_cursor.next()
+            if index >= len(self.users):
+                if self.exhaustion == SeedUserPoolExhaustion.RECYCLE:
+                    return False
+
+                raise SeedUserPoolExhaustedError(
+                    f"All {len(self.users)} users of shared seed user pool are taken by this and other processes"
+                )
+
+            self.free.append(index)
+            self.available.release()
+
+        return super().acquire()
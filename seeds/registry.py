@@ -0,0 +1,50 @@
+"""
+Таблицы сущностей сидинга: какой эндпоинт создаёт каждый вид счетов, карт и операций.
+
+SeedsBuilder, AsyncSeedsBuilder и оценщик плана (seeds.estimator) строят граф вызовов только по этим
+таблицам. Имя эндпоинта совпадает с именем метода клиента gateway (и адаптера из seeds.services),
+а ключ таблицы — с именем поля в SeedUsersPlan/SeedAccountsPlan и в SeedUserResult/SeedAccountResult.
+
+Чтобы добавить новый вид операций, достаточно строки в OPERATION_ENDPOINTS и одноимённых полей в
+SeedAccountsPlan и SeedAccountResult: операции будут создаваться на любом виде счетов параллельно
+с остальными картами и операциями счёта.
+"""
+
+# Вид счетов -> эндпоинт открытия счёта (метод клиента счетов)
+ACCOUNT_ENDPOINTS = {
+    "deposit_accounts": "open_deposit_account",
+    "savings_accounts": "open_savings_account",
+    "debit_card_accounts": "open_debit_card_account",
+    "credit_card_accounts": "open_credit_card_account",
+}
+
+# Виды счетов, при открытии которых gateway сразу выпускает виртуальную карту
+CARD_ACCOUNT_KINDS = ("debit_card_accounts", "credit_card_accounts")
+
+# Вид карт -> эндпоинт выпуска карты (метод клиента карт)
+CARD_ENDPOINTS = {
+    "physical_cards": "issue_physical_card",
+    "virtual_cards": "issue_virtual_card",
+}
+
+# Вид карт, которая выпускается для операций на счёте, открытом без карты
+OPERATIONS_CARD = "virtual_cards"
+
+# Вид операций -> эндпоинт операции (метод клиента операций)
+OPERATION_ENDPOINTS = {
+    "top_up_operations": "make_top_up_operation",
+    "purchase_operations": "make_purchase_operation",
+    "transfer_operations": "make_transfer_operation",
+    "cash_withdrawal_operations": "make_cash_withdrawal_operation",
+    "fee_operations": "make_fee_operation",
+    "cashback_operations": "make_cashback_operation",
+    "bill_payment_operations": "make_bill_payment_operation",
+}
+
+# Эндпоинты, создающие сущности: неидемпотентны, повторяются только если запрос не был отправлен
+CREATE_ENDPOINTS = frozenset({
+    "create_user",
+    *ACCOUNT_ENDPOINTS.values(),
+    *CARD_ENDPOINTS.values(),
+    *OPERATION_ENDPOINTS.values(),
+})
@@ -0,0 +1,102 @@
+import gevent
+
+from seeds.builder import (
+    SeedsBuilder,
+    build_grpc_seeds_builder,
+    build_http_seeds_builder,
+    build_services_seeds_builder
+)
+from seeds.pool import SeedUserPool
+from seeds.schema.plan import SeedUsersPlan
+from tools.config.seeds import SeedsBackend
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_REPLENISHER")
+
+
+def build_replenisher_seeds_builder(backend: SeedsBackend) -> SeedsBuilder:
+    """
+    Возвращает блокирующий SeedsBuilder для досоздания пользователей внутри процесса Locust.
+
+    Асинхронные бэкенды работают только в отдельном интерпретаторе, поэтому для них
+    используется gevent-совместимый аналог на том же транспорте.
+
+    :param backend: Бэкенд сидинга из настроек.
+    :return: SeedsBuilder на gRPC-, HTTP-клиентах или клиентах внутренних сервисов.
+    """
+    match backend:
+        case SeedsBackend.GRPC | SeedsBackend.GRPC_AIO:
+            return build_grpc_seeds_builder()
+        case SeedsBackend.SERVICES:
+            return build_services_seeds_builder()
+        case _:
+            return build_http_seeds_builder()
+
+
+class SeedsReplenisher:
+    """
+    Фоновое досоздание пользователей во время теста.
+
+    Сценарии с монопольной выдачей пользователей (EXCLUSIVE) могут запустить не больше виртуальных
+    пользователей, чем было создано сидингом. Replenisher следит за числом свободных пользователей
+    в пуле и, когда оно падает ниже min_free, создаёт новых пользователей по тому же SeedUsersPlan
+    и добавляет их в пул.
+
+    Работа идёт в отдельном greenlet'е с низким приоритетом: перед каждым пользователем он ждёт
+    gevent.idle() (цикл событий свободен от задач виртуальных пользователей), а между пользователями
+    делает паузу interval. Клиенты билдера не подключены к статистике Locust, поэтому запросы
+    досоздания не попадают в результаты теста.
+    """
+
+    def __init__(
+            self,
+            pool: SeedUserPool,
+            builder: SeedsBuilder,
+            plan: SeedUsersPlan,
+            min_free: int = 10,
+            interval: float = 1.0
+    ):
+        """
+        :param pool: Пул, который нужно пополнять.
+        :param builder: Билдер для создания пользователей.
+        :param plan: План одного пользователя (тот же, что и в сидинг-сценарии).
+        :param min_free: Порог свободных пользователей, ниже которого запускается досоздание.
+        :param interval: Пауза в секундах между созданием пользователей.
+        """
+        self.pool = pool
+        self.builder = builder
+        self.plan = plan
+        self.min_free = min_free
+        self.interval = interval
+        self.greenlet: gevent.Greenlet | None = None
+
+    def run(self):
+        """
+        Основной цикл: проверяет глубину пула и при необходимости создаёт по одному пользователю.
+        Ошибки создания логируются и не останавливают цикл.
+        """
+        while True:
+            if self.pool.free_count < self.min_free:
+                gevent.idle()
+                try:
+                    self.pool.add(self.builder.build_user(plan=self.plan))
+                    logger.debug(f"Seed user added to pool, {self.pool.free_count} free of {len(self.pool)}")
+                except Exception as error:
+                    logger.warning(f"Failed to replenish seed user pool: {error}")
+
+            gevent.sleep(self.interval)
+
+    def start(self):
+        """
+        Запускает фоновый greenlet, если он ещё не запущен.
+        """
+        if self.greenlet is None:
+            self.greenlet = gevent.spawn(self.run)
+
+    def stop(self):
+        """
+        Останавливает фоновый greenlet.
+        """
+        if self.greenlet is not None:
+            self.greenlet.kill()
+            self.greenlet = None
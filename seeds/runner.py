@@ -0,0 +1,83 @@
+import argparse
+import sys
+import time
+
+import gevent
+
+from seeds.builder import SeedsBuilder, build_seeds_builder
+from seeds.scenario import SeedsScenario
+from seeds.scenarios import get_seeds_scenarios
+from tools.config.seeds import SeedsBackend
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_RUNNER")
+
+
+class SeedsRunner:
+    """
+    Одновременный сидинг нескольких сценариев.
+
+    Каждый сценарий запускается в своём greenlet'е, а билдеры сценариев с одним бэкендом создаются
+    через SeedsBuilder.fork() от одного общего билдера. Поэтому все сценарии работают поверх
+    одних каналов и пулов соединений, вместе соблюдают лимиты SEEDS.ENDPOINT_LIMITS, SEEDS.THROTTLE
+    и общий лимит SEEDS.CONCURRENCY, а метрики и дамп у каждого сценария свои.
+
+    Асинхронные бэкенды (grpc_aio, http_async) работают в отдельном процессе на сценарий,
+    поэтому такие сценарии запускаются параллельно, но соединения и лимиты у них свои.
+    """
+
+    def __init__(self, scenarios: list[SeedsScenario]):
+        """
+        :param scenarios: Сценарии для сидинга.
+        """
+        self.scenarios = scenarios
+        self.builders: dict[SeedsBackend, SeedsBuilder] = {}
+
+    def attach(self, scenario: SeedsScenario):
+        """
+        Подключает сценарий к общему билдеру его бэкенда.
+        """
+        if scenario.backend in (SeedsBackend.GRPC_AIO, SeedsBackend.HTTP_ASYNC):
+            return
+
+        builder = self.builders.get(scenario.backend)
+        if builder is None:
+            builder = self.builders[scenario.backend] = build_seeds_builder(scenario.backend)
+
+        scenario.builder = builder.fork()
+
+    def run(self) -> dict[str, BaseException | None]:
+        """
+        Сидит все сценарии одновременно и дожидается их завершения.
+        Ошибка одного сценария не останавливает остальные.
+
+        :return: Ошибка по имени сценария (None — сценарий завершился успешно).
+        """
+        started = time.perf_counter()
+        for scenario in self.scenarios:
+            self.attach(scenario)
+
+        greenlets = {scenario.scenario: gevent.spawn(scenario.build) for scenario in self.scenarios}
+        gevent.joinall(list(greenlets.values()))
+
+        errors = {name: greenlet.exception for name, greenlet in greenlets.items()}
+        for name, error in errors.items():
+            if error is not None:
+                logger.error(f"[{name}] Seeding failed: {error!r}")
+
+        failed = sum(error is not None for error in errors.values())
+        logger.info(
+            f"Seeded {len(errors) - failed}/{len(errors)} scenarios in {time.perf_counter() - started:.1f}s"
+        )
+        return errors
+
+
+if __name__ == '__main__':
+    # Сидинг всех (или перечисленных) сценариев одной командой:
+    # python -m seeds.runner [existing_user_get_operations ...]
+    parser = argparse.ArgumentParser(description="Seed all registered seeds scenarios concurrently")
+    parser.add_argument("scenarios", nargs="*", help="Seeds scenario names (default: all)")
+    arguments = parser.parse_args()
+
+    runner = SeedsRunner(get_seeds_scenarios(arguments.scenarios))
+    sys.exit(1 if any(runner.run().values()) else 0)
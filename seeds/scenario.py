@@ -1,9 +1,34 @@
 from abc import ABC, abstractmethod
+from datetime import datetime, timezone
+from functools import cached_property
+from typing import Sequence
 
-from seeds.builder import build_grpc_seeds_builder
-from seeds.dumps import save_seeds_result, load_seeds_result
+from config import settings
+from seeds.async_builder import AsyncSeedsBuilderProcess
+from seeds.builder import SeedsBuilder, build_seeds_builder
+from seeds.compact import CompactSeedsResult
+from seeds.pool import SeedUserPool
+from seeds.selection import build_seed_user_selector
+from seeds.dumps import (
+    save_seeds_result,
+    load_seeds_result,
+    append_seeds_checkpoint,
+    load_seeds_checkpoint,
+    remove_seeds_checkpoint,
+    save_seeds_meta,
+    load_seeds_meta,
+    save_seeds_metrics,
+    load_seeds_metrics_summaries,
+    SeedsDump
+)
+from seeds.estimator import estimate_seeds_plan, get_endpoint_latencies, count_seeds_plan_calls
+from seeds.schema.estimate import SeedsPlanEstimate
+from seeds.schema.meta import SeedsMeta, SeedsCheckpointMeta
 from seeds.schema.plan import SeedsPlan
-from seeds.schema.result import SeedsResult
+from seeds.schema.result import SeedsResult, SeedUserResult
+from seeds.schema.verification import SeedsVerification
+from seeds.verifier import SeedsVerifier, build_seeds_verifier
+from tools.config.seeds import SeedsBackend, SeedUserPoolMode
 from tools.logger import get_logger
 
 logger = get_logger("SEEDS_SCENARIO")
@@ -15,12 +40,21 @@ class SeedsScenario(ABC):
     Этот класс инкапсулирует общую логику генерации, сохранения и загрузки данных для тестов.
     """
 
-    def __init__(self):
+    @cached_property
+    def builder(self) -> SeedsBuilder | AsyncSeedsBuilderProcess:
         """
-        Инициализация класса SeedsScenario.
-        Создаёт экземпляр билдера для генерации сидинговых данных через gRPC.
+        Билдер для генерации сидинговых данных через бэкенд сценария (см. backend).
+        Создаётся при первом обращении, поэтому загрузка дампа и оценка плана (estimate)
+        не создают клиентов и не обращаются к стенду.
         """
-        self.builder = build_grpc_seeds_builder()
+        return build_seeds_builder(self.backend)
+
+    @cached_property
+    def verifier(self) -> SeedsVerifier:
+        """
+        Verifier для проверки дампа на стенде (см. verify). Создаётся при первом обращении.
+        """
+        return build_seeds_verifier()
 
     @property
     @abstractmethod
@@ -40,6 +74,114 @@ class SeedsScenario(ABC):
         """
         ...
 
+    @property
+    def backend(self) -> SeedsBackend:
+        """
+        Бэкенд, через который сценарий создаёт данные. По умолчанию берётся из настройки SEEDS.BACKEND;
+        сценарий может переопределить свойство, например, чтобы сидить напрямую во внутренние сервисы.
+        """
+        return settings.seeds.backend
+
+    @property
+    def target(self) -> str:
+        """
+        Адрес стенда, на котором выполняется сидинг выбранным бэкендом.
+        Входит в хэш плана, чтобы дамп одного стенда не переиспользовался на другом.
+        """
+        match self.backend:
+            case SeedsBackend.GRPC | SeedsBackend.GRPC_AIO:
+                return settings.gateway_grpc_client.client_url
+            case SeedsBackend.SERVICES if settings.seeds.services is not None:
+                return settings.seeds.services.users.client_url
+            case _:
+                return settings.gateway_http_client.client_url
+
+    def load_meta(self) -> SeedsMeta | None:
+        """
+        Загружает метаданные прошлого дампа, если его ещё можно использовать:
+        не задан флаг SEEDS.FORCE, дамп создан на том же стенде и не старше SEEDS.CACHE_TTL.
+        :return: Метаданные дампа или None, если дамп нужно собрать заново.
+        """
+        if settings.seeds.force:
+            return None
+
+        meta = load_seeds_meta(scenario=self.scenario)
+        if meta is None or meta.target != self.target:
+            return None
+
+        age = (datetime.now(timezone.utc) - meta.created_at).total_seconds()
+        if settings.seeds.cache_ttl is not None and age > settings.seeds.cache_ttl:
+            logger.info(f"[{self.scenario}] Seeds dump is {age:.0f}s old and expired, reseeding.")
+            return None
+
+        return meta
+
+    def is_cached(self) -> bool:
+        """
+        Проверяет, можно ли переиспользовать сохранённый дамп без повторного сидинга:
+        дамп пригоден (см. load_meta) и собран ровно по текущему плану.
+
+        При включённой настройке SEEDS.VERIFY дамп дополнительно проверяется на стенде
+        по случайной выборке из SEEDS.VERIFY.SAMPLE пользователей: если хотя бы один пользователь
+        или счёт пропал, дамп не переиспользуется как есть (см. load_reusable_users).
+        :return: True, если повторный сидинг не нужен.
+        """
+        meta = self.load_meta()
+        if meta is None or meta.plan_hash != self.plan.get_hash(self.target):
+            return False
+
+        if not settings.seeds.verify.enabled:
+            return True
+
+        with self.open() as dump:
+            return self.verify(dump, sample=settings.seeds.verify.sample).is_intact
+
+    def verify(self, users: Sequence[SeedUserResult], sample: int | None = None) -> SeedsVerification:
+        """
+        Проверяет, что пользователи и счета дампа существуют на стенде, и пишет долю выживших в лог.
+        :param users: Пользователи дампа.
+        :param sample: Размер случайной выборки; None — проверить всех пользователей.
+        :return: Результат проверки с живыми пользователями.
+        """
+        verification = self.verifier.verify(users, sample=sample)
+        logger.info(
+            f"[{self.scenario}] Verified {verification.checked} seed users: {verification.alive} alive "
+            f"({verification.survival:.1%}), {verification.complete} with all accounts."
+        )
+        return verification
+
+    def load_reusable_users(self) -> list[SeedUserResult]:
+        """
+        Возвращает пользователей из прошлого дампа, которых можно дополнить до текущего плана.
+
+        Дамп подходит для наращивания, если он пригоден (см. load_meta) и состав счетов
+        в плане изменился только количественно (см. SeedUsersPlan.extends).
+        Например, при росте плана со 100 до 1000 пользователей досоздаются только 900.
+
+        При включённой настройке SEEDS.VERIFY проверяются все пользователи дампа: пропавшие со стенда
+        пользователи и счета отбрасываются и досоздаются заново. Если выжило меньше
+        SEEDS.VERIFY.MIN_SURVIVAL пользователей, дамп собирается с нуля.
+        :return: Пользователи прошлого дампа или пустой список, если дамп нужно собрать заново.
+        """
+        meta = self.load_meta()
+        if meta is None:
+            return []
+
+        if not self.plan.users.extends(meta.plan.users):
+            logger.info(f"[{self.scenario}] Account structure in plan changed, existing seeds dump can't be extended.")
+            return []
+
+        users = self.load().users
+        if not settings.seeds.verify.enabled:
+            return users
+
+        verification = self.verify(users)
+        if verification.survival < settings.seeds.verify.min_survival:
+            logger.info(f"[{self.scenario}] Too few seed users survived on target, reseeding from scratch.")
+            return []
+
+        return verification.users
+
     def save(self, result: SeedsResult) -> None:
         """
         Сохраняет результат сидинга в файл.
@@ -47,6 +189,15 @@ class SeedsScenario(ABC):
         """
         logger.info(f"[{self.scenario}] Saving seeds result to file.")
         save_seeds_result(result=result, scenario=self.scenario)
+        save_seeds_meta(
+            meta=SeedsMeta(
+                plan_hash=self.plan.get_hash(self.target),
+                target=self.target,
+                created_at=datetime.now(timezone.utc),
+                plan=self.plan
+            ),
+            scenario=self.scenario
+        )
         logger.info(f"[{self.scenario}] Seeding result saved successfully.")
 
     def load(self) -> SeedsResult:
@@ -59,12 +210,112 @@ class SeedsScenario(ABC):
         logger.info(f"[{self.scenario}] Seeding result loaded successfully.")
         return result
 
+    def open(self) -> SeedsDump:
+        """
+        Открывает дамп сидинга для ленивой раздачи пользователей в нагрузочном сценарии.
+        В отличие от load(), не загружает дамп в память целиком.
+        :return: Объект SeedsDump с интерфейсом get_next_user/get_random_user.
+        """
+        logger.info(f"[{self.scenario}] Opening seeding dump.")
+        dump = SeedsDump(scenario=self.scenario)
+        logger.info(f"[{self.scenario}] Seeding dump opened with {len(dump)} users.")
+        return dump
+
+    def load_compact(self) -> CompactSeedsResult:
+        """
+        Загружает дамп сидинга в компактное колоночное хранилище.
+        Подходит, когда пул пользователей должен постоянно находиться в памяти воркера.
+        :return: Объект CompactSeedsResult с интерфейсом get_next_user/get_random_user.
+        """
+        logger.info(f"[{self.scenario}] Loading seeding dump into compact storage.")
+        with self.open() as dump:
+            result = CompactSeedsResult.from_users(dump)
+        logger.info(f"[{self.scenario}] Seeding dump loaded into compact storage with {len(result)} users.")
+        return result
+
+    def pool(self, mode: SeedUserPoolMode, users: Sequence | None = None) -> SeedUserPool:
+        """
+        Открывает дамп сидинга как пул пользователей с арендой и возвратом.
+        Ограничение аренд, политика исчерпания и стратегия выбора пользователей берутся из настроек SEEDS.POOL.
+        :param mode: EXCLUSIVE — у каждого виртуального пользователя свой пользователь, SHARED — общие пользователи.
+        :param users: Пользователи для пула (например, шард, полученный от мастера Locust); по умолчанию — весь дамп.
+        :return: Объект SeedUserPool.
+        """
+        return SeedUserPool(
+            users=self.open() if users is None else users,
+            mode=mode,
+            shares=settings.seeds.pool.shares,
+            exhaustion=settings.seeds.pool.exhaustion,
+            timeout=settings.seeds.pool.timeout,
+            selector=build_seed_user_selector(settings.seeds.pool)
+        )
+
+    def estimate(self, workers: int | None = None) -> SeedsPlanEstimate:
+        """
+        Оценивает количество RPC и время сидинга плана без обращения к стенду (см. estimate_seeds_plan).
+        Задержки эндпоинтов берутся из статистики прошлых сидингов в папке dumps,
+        лимиты и частоты — из настроек SEEDS.ENDPOINT_LIMITS и SEEDS.THROTTLE.
+        :param workers: Количество пользователей, создаваемых параллельно; по умолчанию SEEDS.WORKERS.
+        :return: Оценка плана.
+        """
+        throttle = settings.seeds.throttle
+        rates = {
+            endpoint: throttle.rates.get(endpoint, throttle.rate)
+            for endpoint in count_seeds_plan_calls(self.plan)
+        }
+        return estimate_seeds_plan(
+            plan=self.plan,
+            workers=workers or settings.seeds.workers,
+            latencies=get_endpoint_latencies(load_seeds_metrics_summaries()),
+            limits=settings.seeds.endpoint_limits,
+            rates={endpoint: rate for endpoint, rate in rates.items() if rate}
+        )
+
     def build(self) -> None:
         """
         Генерирует данные с помощью билдера, используя план сидинга, и сохраняет результат.
+        Если подходящий дамп уже есть (см. is_cached), сидинг пропускается.
+
+        Если прошлый дамп можно нарастить до плана (см. load_reusable_users), создаются только
+        недостающие пользователи и счета, а новые сущности добавляются к существующим.
+
+        Каждый готовый пользователь сразу дописывается в checkpoint-файл. Если сидинг упал,
+        при включённой настройке SEEDS.RESUME следующий запуск загрузит уже созданных
+        пользователей из checkpoint и досоздаст только недостающих. Checkpoint другого плана
+        или окружения, а также любой checkpoint при SEEDS.FORCE отбрасывается.
+
+        Статистика сидинга (сущности, скорость, задержки RPC) сохраняется рядом с дампом (см. save_seeds_metrics).
         """
+        if self.is_cached():
+            logger.info(f"[{self.scenario}] Reusing existing seeds dump, seeding skipped.")
+            return
+
         plan_json = self.plan.model_dump_json(indent=2,exclude_defaults=True)
         logger.info(f"[{self.scenario}] Starting seeding data generation for plan {plan_json}")
-        result = self.builder.build(self.plan)
+
+        users = self.load_reusable_users()
+        if users:
+            logger.info(f"[{self.scenario}] Extending existing seeds dump with {len(users)} users to the plan.")
+
+        checkpoint = SeedsCheckpointMeta(plan_hash=self.plan.get_hash(self.target), target=self.target)
+        if settings.seeds.resume and not settings.seeds.force:
+            # Пользователи из checkpoint уже доведены до плана и заменяют свои версии из дампа
+            merged = {user.user_id: user for user in users}
+            merged.update(
+                (user.user_id, user) for user in load_seeds_checkpoint(meta=checkpoint, scenario=self.scenario)
+            )
+            users = list(merged.values())
+        else:
+            remove_seeds_checkpoint(scenario=self.scenario)
+
+        result = self.builder.build(
+            self.plan,
+            users=users,
+            on_user=lambda user: append_seeds_checkpoint(user=user, meta=checkpoint, scenario=self.scenario)
+        )
         logger.info(f"[{self.scenario}] Seeding data generation completed successfully.")
+        self.builder.metrics.report()
+
         self.save(result)
+        save_seeds_metrics(summary=self.builder.metrics.summary(), scenario=self.scenario)
+        remove_seeds_checkpoint(scenario=self.scenario)
@@ -0,0 +1,41 @@
+import importlib
+import inspect
+import pkgutil
+
+from seeds.scenario import SeedsScenario
+
+
+def discover_seeds_scenarios() -> list[type[SeedsScenario]]:
+    """
+    Импортирует все модули пакета seeds.scenarios и возвращает найденные в них
+    неабстрактные наследники SeedsScenario. Новый сценарий достаточно положить в пакет —
+    регистрировать его отдельно не нужно.
+
+    :return: Классы сценариев в порядке имён модулей.
+    """
+    for module in sorted(pkgutil.iter_modules(__path__), key=lambda module: module.name):
+        importlib.import_module(f"{__name__}.{module.name}")
+
+    scenarios, pending = [], list(SeedsScenario.__subclasses__())
+    while pending:
+        cls = pending.pop(0)
+        pending.extend(cls.__subclasses__())
+        if cls.__module__.startswith(f"{__name__}.") and not inspect.isabstract(cls):
+            scenarios.append(cls)
+
+    return sorted(scenarios, key=lambda cls: cls.__module__)
+
+
+def get_seeds_scenarios(names: list[str] | None = None) -> list[SeedsScenario]:
+    """
+    Создаёт сценарии сидинга по именам (SeedsScenario.scenario).
+
+    :param names: Имена сценариев; None или пустой список — все сценарии.
+    :return: Экземпляры сценариев в порядке имён.
+    :raises KeyError: Если сценария с таким именем нет.
+    """
+    scenarios = {scenario.scenario: scenario for scenario in (cls() for cls in discover_seeds_scenarios())}
+    if not names:
+        return list(scenarios.values())
+
+    return [scenarios[name] for name in names]
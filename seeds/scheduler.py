@@ -0,0 +1,311 @@
+import asyncio
+import copy
+import time
+from contextlib import contextmanager, asynccontextmanager, nullcontext
+from typing import Callable, Awaitable, TypeVar, Iterator
+
+import gevent
+from gevent.lock import BoundedSemaphore
+
+from config import settings
+from seeds.metrics import SeedsMetrics
+from seeds.registry import CREATE_ENDPOINTS
+from seeds.throttle import SeedsThrottle, RetryPolicy, is_transient_error
+
+T = TypeVar("T")
+
+
+def split_groups(results: list[T], groups: tuple[list, ...]) -> list[list[T]]:
+    """
+    Разбивает плоский список результатов обратно на группы исходных размеров.
+
+    :param results: Результаты задач в порядке их постановки.
+    :param groups: Группы задач, из которых был собран плоский список.
+    :return: Список результатов, сгруппированный так же, как задачи.
+    """
+    grouped, start = [], 0
+    for group in groups:
+        grouped.append(results[start:start + len(group)])
+        start += len(group)
+
+    return grouped
+
+
+class SeedsScheduler:
+    """
+    Планировщик RPC для SeedsBuilder.
+
+    План сидинга образует граф зависимостей: пользователь → счета → (карты ‖ операции).
+    Узлы одного уровня зависят только от результата родителя, поэтому билдер отдаёт их
+    планировщику пачкой через gather/gather_groups, и они выполняются одновременно
+    в отдельных greenlet'ах. Критический путь одного пользователя сокращается до трёх RPC.
+
+    Чтобы параллельные листья не перегружали отдельные эндпоинты, каждый вызов проходит
+    через call(endpoint, ...), который:
+    - ждёт токен ограничителя частоты эндпоинта (SeedsThrottle, при необходимости с AIMD);
+    - ограничивает число одновременных запросов к эндпоинту;
+    - замеряет длительность вызова для метрик сидинга;
+    - повторяет вызов при временных ошибках (RetryPolicy), не прерывая весь сидинг.
+
+    Attributes:
+        limits: Лимиты одновременных вызовов по имени эндпоинта (например, {"make_purchase_operation": 20})
+        metrics: Счётчики сущностей и гистограммы задержек по эндпоинтам
+        throttle: Ограничители частоты по эндпоинтам
+        retry: Политика повторов при временных ошибках
+        concurrency: Общий лимит одновременных вызовов всех эндпоинтов (None — без ограничения)
+    """
+
+    def __init__(
+            self,
+            limits: dict[str, int] | None = None,
+            metrics: SeedsMetrics | None = None,
+            throttle: SeedsThrottle | None = None,
+            retry: RetryPolicy | None = None,
+            concurrency: int | None = None
+    ):
+        self.limits = limits or {}
+        self.metrics = metrics or SeedsMetrics()
+        self.throttle = throttle or SeedsThrottle()
+        self.retry = retry or RetryPolicy(attempts=1)
+        self.concurrency = BoundedSemaphore(concurrency) if concurrency else None
+        self.semaphores = {endpoint: BoundedSemaphore(limit) for endpoint, limit in self.limits.items()}
+
+    def fork(self) -> "SeedsScheduler":
+        """
+        Создаёт планировщик с теми же лимитами, ограничителями частоты, повторами и общим лимитом
+        параллельности, но с собственными метриками. Так несколько сценариев, которые сидятся одновременно
+        (см. SeedsRunner), вместе не превышают ограничений, а статистика у каждого своя.
+        """
+        scheduler = copy.copy(self)
+        scheduler.metrics = SeedsMetrics(interval=self.metrics.interval)
+        return scheduler
+
+    @contextmanager
+    def acquire(self, endpoint: str) -> Iterator[None]:
+        """
+        Занимает место в лимите эндпоинта и в общем лимите параллельности.
+        """
+        semaphore = self.semaphores.get(endpoint)
+        with nullcontext() if semaphore is None else semaphore:
+            with nullcontext() if self.concurrency is None else self.concurrency:
+                yield
+
+    def observe(self, endpoint: str, func: Callable[..., T], **kwargs) -> T:
+        """
+        Выполняет вызов и записывает его длительность в метрики и регулятор частоты.
+        Время ожидания токена и семафора эндпоинта в задержку не входит.
+        """
+        started = time.perf_counter()
+        try:
+            response = func(**kwargs)
+        except BaseException as error:
+            elapsed, transient = time.perf_counter() - started, is_transient_error(error)
+            self.metrics.observe(endpoint, elapsed, error=True, transient=transient)
+            self.throttle.record(endpoint, elapsed, error=transient)
+            raise
+
+        elapsed = time.perf_counter() - started
+        self.metrics.observe(endpoint, elapsed)
+        self.throttle.record(endpoint, elapsed)
+        return response
+
+    def call(self, endpoint: str, func: Callable[..., T], **kwargs) -> T:
+        """
+        Выполняет вызов эндпоинта с учётом его частоты и лимита параллельности,
+        повторяя его при временных ошибках.
+
+        :param endpoint: Имя эндпоинта (совпадает с именем метода клиента, например "create_user").
+        :param func: Метод клиента, выполняющий RPC.
+        :param kwargs: Аргументы вызова.
+        :return: Ответ эндпоинта.
+        """
+        attempt = 1
+        while True:
+            delay = self.throttle.reserve(endpoint)
+            if delay:
+                gevent.sleep(delay)
+            try:
+                with self.acquire(endpoint):
+                    return self.observe(endpoint, func, **kwargs)
+            except Exception as error:
+                if not self.retry.should_retry(error, attempt, endpoint):
+                    raise
+
+            gevent.sleep(self.retry.get_delay(attempt))
+            attempt += 1
+
+    def gather(self, *tasks: Callable[[], T]) -> list[T]:
+        """
+        Выполняет независимые задачи одновременно и возвращает результаты в порядке задач.
+        При ошибке в любой задаче остальные останавливаются, а исключение пробрасывается дальше.
+
+        :param tasks: Функции без аргументов.
+        :return: Результаты задач.
+        """
+        if len(tasks) <= 1:
+            return [task() for task in tasks]
+
+        greenlets = [gevent.spawn(task) for task in tasks]
+        try:
+            gevent.joinall(greenlets, raise_error=True)
+        except BaseException:
+            gevent.killall(greenlets)
+            raise
+
+        return [greenlet.value for greenlet in greenlets]
+
+    def gather_groups(self, *groups: list[Callable[[], T]]) -> list[list[T]]:
+        """
+        Выполняет несколько групп независимых задач как один уровень графа.
+
+        :param groups: Списки задач (например, физические карты, виртуальные карты, пополнения...).
+        :return: Результаты, сгруппированные так же, как задачи.
+        """
+        results = self.gather(*[task for group in groups for task in group])
+        return split_groups(results, groups)
+
+
+class AsyncSeedsScheduler:
+    """
+    Асинхронный аналог SeedsScheduler для AsyncSeedsBuilder: те же уровни графа, лимиты,
+    общий лимит параллельности, ограничение частоты и повторы по эндпоинтам,
+    но поверх asyncio.gather, asyncio.Semaphore и asyncio.sleep.
+    """
+
+    def __init__(
+            self,
+            limits: dict[str, int] | None = None,
+            metrics: SeedsMetrics | None = None,
+            throttle: SeedsThrottle | None = None,
+            retry: RetryPolicy | None = None,
+            concurrency: int | None = None
+    ):
+        self.limits = limits or {}
+        self.metrics = metrics or SeedsMetrics()
+        self.throttle = throttle or SeedsThrottle()
+        self.retry = retry or RetryPolicy(attempts=1)
+        self.concurrency = asyncio.Semaphore(concurrency) if concurrency else None
+        self.semaphores = {endpoint: asyncio.Semaphore(limit) for endpoint, limit in self.limits.items()}
+
+    @asynccontextmanager
+    async def acquire(self, endpoint: str):
+        """
+        Занимает место в лимите эндпоинта и в общем лимите параллельности.
+        """
+        semaphore = self.semaphores.get(endpoint)
+        async with nullcontext() if semaphore is None else semaphore:
+            async with nullcontext() if self.concurrency is None else self.concurrency:
+                yield
+
+    async def observe(self, endpoint: str, func: Callable[..., Awaitable[T]], **kwargs) -> T:
+        """
+        Выполняет вызов и записывает его длительность в метрики и регулятор частоты.
+        """
+        started = time.perf_counter()
+        try:
+            response = await func(**kwargs)
+        except BaseException as error:
+            elapsed, transient = time.perf_counter() - started, is_transient_error(error)
+            self.metrics.observe(endpoint, elapsed, error=True, transient=transient)
+            self.throttle.record(endpoint, elapsed, error=transient)
+            raise
+
+        elapsed = time.perf_counter() - started
+        self.metrics.observe(endpoint, elapsed)
+        self.throttle.record(endpoint, elapsed)
+        return response
+
+    async def call(self, endpoint: str, func: Callable[..., Awaitable[T]], **kwargs) -> T:
+        """
+        Выполняет вызов эндпоинта с учётом его частоты и лимита параллельности,
+        повторяя его при временных ошибках.
+
+        :param endpoint: Имя эндпоинта (совпадает с именем метода клиента).
+        :param func: Метод клиента, возвращающий awaitable.
+        :param kwargs: Аргументы вызова.
+        :return: Ответ эндпоинта.
+        """
+        attempt = 1
+        while True:
+            delay = self.throttle.reserve(endpoint)
+            if delay:
+                await asyncio.sleep(delay)
+            try:
+                async with self.acquire(endpoint):
+                    return await self.observe(endpoint, func, **kwargs)
+            except Exception as error:
+                if not self.retry.should_retry(error, attempt, endpoint):
+                    raise
+
+            await asyncio.sleep(self.retry.get_delay(attempt))
+            attempt += 1
+
+    async def gather_groups(self, *groups: list[Awaitable[T]]) -> list[list[T]]:
+        """
+        Выполняет несколько групп корутин как один уровень графа.
+
+        :param groups: Списки корутин.
+        :return: Результаты, сгруппированные так же, как корутины.
+        """
+        results = await asyncio.gather(*[task for group in groups for task in group])
+        return split_groups(list(results), groups)
+
+
+def build_seeds_throttle() -> SeedsThrottle:
+    """
+    Фабрика ограничителей частоты из настроек SEEDS.THROTTLE.
+    """
+    config = settings.seeds.throttle
+    return SeedsThrottle(
+        rate=config.rate,
+        rates=config.rates,
+        burst=config.burst,
+        adaptive=config.adaptive,
+        min_rate=config.min_rate,
+        max_rate=config.max_rate,
+        latency_target=config.latency_target,
+        error_threshold=config.error_threshold,
+        window=config.window,
+        increase=config.increase,
+        decrease=config.decrease
+    )
+
+
+def build_seeds_retry_policy() -> RetryPolicy:
+    """
+    Фабрика политики повторов из настроек SEEDS.RETRY.
+    Создающие эндпоинты из seeds.registry повторяются только при неотправленных запросах.
+    """
+    config = settings.seeds.retry
+    return RetryPolicy(
+        attempts=config.attempts,
+        backoff=config.backoff,
+        max_backoff=config.max_backoff,
+        non_idempotent=CREATE_ENDPOINTS
+    )
+
+
+def build_seeds_scheduler() -> SeedsScheduler:
+    """
+    Фабрика планировщика для SeedsBuilder с лимитами, ограничением частоты, повторами и метриками из настроек.
+    """
+    return SeedsScheduler(
+        limits=settings.seeds.endpoint_limits,
+        metrics=SeedsMetrics(interval=settings.seeds.progress_interval),
+        throttle=build_seeds_throttle(),
+        retry=build_seeds_retry_policy(),
+        concurrency=settings.seeds.concurrency
+    )
+
+
+def build_async_seeds_scheduler() -> AsyncSeedsScheduler:
+    """
+    Фабрика планировщика для AsyncSeedsBuilder с теми же настройками, что и build_seeds_scheduler.
+    """
+    return AsyncSeedsScheduler(
+        limits=settings.seeds.endpoint_limits,
+        metrics=SeedsMetrics(interval=settings.seeds.progress_interval),
+        throttle=build_seeds_throttle(),
+        retry=build_seeds_retry_policy(),
+        concurrency=settings.seeds.concurrency
+    )
@@ -0,0 +1,25 @@
+from pydantic import BaseModel
+
+
+class SeedsPlanEstimate(BaseModel):
+    """
+    Оценка стоимости плана сидинга (см. estimate_seeds_plan).
+
+    Attributes:
+        calls (dict[str, int]): Количество RPC по эндпоинтам.
+        total_calls (int): Общее количество RPC.
+        workers (int): Количество пользователей, создаваемых параллельно, для которого сделана оценка.
+        latencies (dict[str, float]): Средние задержки эндпоинтов в миллисекундах по прошлым сидингам.
+        missing_latencies (list[str]): Эндпоинты плана без замеров; для них взята средняя задержка известных.
+        user_duration (float | None): Оценка времени создания одного пользователя (критический путь) в секундах.
+        duration (float | None): Оценка общего времени сидинга в секундах; None, если замеров нет совсем.
+        bottleneck (str | None): Что ограничивает оценку: "workers" или имя эндпоинта с лимитом/частотой.
+    """
+    calls: dict[str, int]
+    total_calls: int
+    workers: int
+    latencies: dict[str, float] = {}
+    missing_latencies: list[str] = []
+    user_duration: float | None = None
+    duration: float | None = None
+    bottleneck: str | None = None
@@ -0,0 +1,35 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+from seeds.schema.plan import SeedsPlan
+
+
+class SeedsMeta(BaseModel):
+    """
+    Метаданные дампа сидинга. Сохраняются рядом с дампом и позволяют понять,
+    можно ли переиспользовать уже созданные данные вместо повторного сидинга.
+
+    Attributes:
+        plan_hash (str): Хэш плана и адреса окружения (см. SeedsPlan.get_hash).
+        target (str): Адрес gateway, через который создавались данные.
+        created_at (datetime): Время завершения сидинга.
+        plan (SeedsPlan): План, по которому был собран дамп.
+    """
+    plan_hash: str
+    target: str
+    created_at: datetime
+    plan: SeedsPlan
+
+
+class SeedsCheckpointMeta(BaseModel):
+    """
+    Заголовок checkpoint-файла сидинга (первая строка файла). Позволяет продолжить сидинг
+    только тем же планом и на том же окружении, для которых checkpoint был записан.
+
+    Attributes:
+        plan_hash (str): Хэш плана и адреса окружения (см. SeedsPlan.get_hash).
+        target (str): Адрес gateway, через который создавались пользователи.
+    """
+    plan_hash: str
+    target: str
@@ -0,0 +1,55 @@
+from datetime import datetime
+
+from pydantic import BaseModel
+
+
+class SeedsEndpointMetrics(BaseModel):
+    """
+    Статистика вызовов одного эндпоинта за время сидинга.
+
+    Attributes:
+        count (int): Количество вызовов (включая ошибочные).
+        errors (int): Количество вызовов, завершившихся фатальной ошибкой.
+        transient_errors (int): Количество вызовов, завершившихся временной ошибкой (повторяются планировщиком).
+        mean (float): Средняя задержка в миллисекундах.
+        min (float): Минимальная задержка в миллисекундах.
+        max (float): Максимальная задержка в миллисекундах.
+        p50 (float): Медиана задержки в миллисекундах (верхняя граница корзины гистограммы).
+        p90 (float): 90-й перцентиль задержки в миллисекундах.
+        p99 (float): 99-й перцентиль задержки в миллисекундах.
+        buckets (dict[float, int]): Непустые корзины гистограммы: верхняя граница в мс → число вызовов.
+    """
+    count: int = 0
+    errors: int = 0
+    transient_errors: int = 0
+    mean: float = 0
+    min: float = 0
+    max: float = 0
+    p50: float = 0
+    p90: float = 0
+    p99: float = 0
+    buckets: dict[float, int] = {}
+
+
+class SeedsMetricsSummary(BaseModel):
+    """
+    Итоговая статистика сидинга. Сохраняется рядом с дампом (см. save_seeds_metrics).
+
+    Attributes:
+        started_at (datetime): Время начала сидинга.
+        duration (float): Длительность сидинга в секундах.
+        users (int): Количество пользователей, доведённых до плана за этот запуск.
+        users_total (int): Количество пользователей, которых нужно было довести до плана.
+        users_rate (float): Пользователей в секунду.
+        entities (dict[str, int]): Созданные сущности по типам (users, accounts, cards, operations).
+        entities_rate (float): Созданных сущностей в секунду.
+        endpoints (dict[str, SeedsEndpointMetrics]): Статистика по каждому эндпоинту сидинга.
+    """
+    started_at: datetime
+    duration: float
+    users: int
+    users_total: int
+    users_rate: float
+    entities: dict[str, int]
+    entities_rate: float
+    endpoints: dict[str, SeedsEndpointMetrics]
@@ -1,5 +1,9 @@
+import hashlib
+
 from pydantic import BaseModel, Field
 
+from seeds.registry import ACCOUNT_ENDPOINTS
+
 
 class SeedCardsPlan(BaseModel):
     """
@@ -30,6 +34,9 @@ class SeedAccountsPlan(BaseModel):
         physical_cards (SeedCardsPlan): План по созданию физических карт на счётах.
         top_up_operations (SeedOperationsPlan): План по созданию операций пополнения.
         purchase_operations (SeedOperationsPlan): План по созданию операций покупки.
+        fee_operations (SeedOperationsPlan): План по созданию операций комиссии.
+        cashback_operations (SeedOperationsPlan): План по созданию операций кэшбэка.
+        bill_payment_operations (SeedOperationsPlan): План по созданию операций оплаты счетов.
     """
     count: int = 0
     physical_cards: SeedCardsPlan = Field(default_factory=SeedCardsPlan)
@@ -38,6 +45,20 @@ class SeedAccountsPlan(BaseModel):
     virtual_cards: SeedCardsPlan = Field(default_factory=SeedCardsPlan)
     transfer_operations: SeedOperationsPlan = Field(default_factory=SeedOperationsPlan)
     cash_withdrawal_operations: SeedOperationsPlan = Field(default_factory=SeedOperationsPlan)
+    fee_operations: SeedOperationsPlan = Field(default_factory=SeedOperationsPlan)
+    cashback_operations: SeedOperationsPlan = Field(default_factory=SeedOperationsPlan)
+    bill_payment_operations: SeedOperationsPlan = Field(default_factory=SeedOperationsPlan)
+
+    def extends(self, other: "SeedAccountsPlan") -> bool:
+        """
+        Проверяет, можно ли получить счета этого плана, досоздав счета к результату плана other.
+        Это возможно, если состав одного счёта (карты и операции) не изменился
+        или по плану other счетов этого типа не создавалось вовсе.
+
+        :param other: План, по которому уже были созданы данные.
+        :return: True, если достаточно открыть недостающие счета.
+        """
+        return other.count == 0 or self.model_dump(exclude={"count"}) == other.model_dump(exclude={"count"})
 
 
 class SeedUsersPlan(BaseModel):
@@ -57,6 +78,16 @@ class SeedUsersPlan(BaseModel):
     debit_card_accounts: SeedAccountsPlan = Field(default_factory=SeedAccountsPlan)
     credit_card_accounts: SeedAccountsPlan = Field(default_factory=SeedAccountsPlan)
 
+    def extends(self, other: "SeedUsersPlan") -> bool:
+        """
+        Проверяет, можно ли довести данные плана other до этого плана, создав только недостающих
+        пользователей и счета (см. SeedAccountsPlan.extends).
+
+        :param other: План, по которому уже были созданы данные.
+        :return: True, если возможно инкрементальное наращивание.
+        """
+        return all(getattr(self, kind).extends(getattr(other, kind)) for kind in ACCOUNT_ENDPOINTS)
+
 
 class SeedsPlan(BaseModel):
     """
@@ -66,3 +97,14 @@ class SeedsPlan(BaseModel):
         users (SeedUsersPlan): План по созданию пользователей и всей связанной структуры.
     """
     users: SeedUsersPlan = Field(default_factory=SeedUsersPlan)
+
+    def get_hash(self, target: str) -> str:
+        """
+        Возвращает хэш плана вместе с адресом окружения, в котором создаются данные.
+        Одинаковый план на другом стенде даёт другой хэш, поэтому чужой дамп не будет переиспользован.
+
+        :param target: Адрес gateway, через который выполняется сидинг.
+        :return: SHA-256 в шестнадцатеричном виде.
+        """
+        payload = f"{target}\n{self.model_dump_json()}"
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
@@ -30,16 +30,26 @@ class SeedAccountResult(BaseModel):
     Attributes:
         account_id (str): Уникальный идентификатор счёта.
         physical_cards (list[SeedCardResult]): Список физических карт, привязанных к счёту.
+        virtual_cards (list[SeedCardResult]): Список виртуальных карт по плану.
+        operations_cards (list[SeedCardResult]): Карта для операций на счёте, открытом без карты,
+            если план не предусматривает виртуальных карт (см. SeedsBuilder.build_account_result).
         top_up_operations (list[SeedOperationResult]): Список операций пополнения.
         purchase_operations (list[SeedOperationResult]): Список операций покупки.
+        fee_operations (list[SeedOperationResult]): Список операций комиссии.
+        cashback_operations (list[SeedOperationResult]): Список операций кэшбэка.
+        bill_payment_operations (list[SeedOperationResult]): Список операций оплаты счетов.
     """
     account_id: str
     physical_cards: list[SeedCardResult] = Field(default_factory=list)
     top_up_operations: list[SeedOperationResult] = Field(default_factory=list)
     purchase_operations: list[SeedOperationResult] = Field(default_factory=list)
     virtual_cards: list[SeedCardResult] = Field(default_factory=list)
+    operations_cards: list[SeedCardResult] = Field(default_factory=list)
     transfer_operations: list[SeedOperationResult] = Field(default_factory=list)
     cash_withdrawal_operations: list[SeedOperationResult] = Field(default_factory=list)
+    fee_operations: list[SeedOperationResult] = Field(default_factory=list)
+    cashback_operations: list[SeedOperationResult] = Field(default_factory=list)
+    bill_payment_operations: list[SeedOperationResult] = Field(default_factory=list)
 
 
 class SeedUserResult(BaseModel):
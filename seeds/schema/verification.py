@@ -0,0 +1,33 @@
+from pydantic import BaseModel
+
+from seeds.schema.result import SeedUserResult
+
+
+class SeedsVerification(BaseModel):
+    """
+    Результат проверки дампа сидинга на стенде (см. SeedsVerifier.verify).
+
+    Attributes:
+        checked (int): Количество проверенных пользователей (вся выборка или весь дамп).
+        alive (int): Количество пользователей, которые ещё существуют на стенде.
+        complete (int): Количество живых пользователей, у которых на стенде есть все счета из дампа.
+        users (list[SeedUserResult]): Живые пользователи из проверенных, без отсутствующих на стенде счетов.
+    """
+    checked: int
+    alive: int
+    complete: int
+    users: list[SeedUserResult] = []
+
+    @property
+    def survival(self) -> float:
+        """
+        Доля живых пользователей среди проверенных (1.0, если проверять было некого).
+        """
+        return self.alive / self.checked if self.checked else 1.0
+
+    @property
+    def is_intact(self) -> bool:
+        """
+        True, если все проверенные пользователи и их счета есть на стенде и дамп можно использовать как есть.
+        """
+        return self.complete == self.checked
@@ -0,0 +1,174 @@
+import random
+from abc import ABC, abstractmethod
+from array import array
+from typing import Sequence
+
+from tools.config.seeds import SeedUserPoolConfig, SeedUserSelection
+
+
+class AliasTable:
+    """
+    Таблица псевдонимов (метод Уолкера—Воуза) для выборки индекса с заданными весами за O(1).
+
+    Построение стоит O(n): каждая из n ячеек хранит вероятность «остаться» на своём индексе
+    и индекс-псевдоним, на который выборка уходит в остальных случаях. Выборка — один случайный
+    индекс ячейки и одно сравнение, независимо от числа пользователей и формы распределения.
+    """
+
+    __slots__ = ("probabilities", "aliases")
+
+    def __init__(self, weights: Sequence[float]):
+        """
+        :param weights: Неотрицательные веса индексов (нормировать не нужно).
+        :raises ValueError: Если весов нет или их сумма не положительна.
+        """
+        total = sum(weights)
+        if not weights or total <= 0:
+            raise ValueError("Alias table requires at least one positive weight")
+
+        size = len(weights)
+        scaled = [weight * size / total for weight in weights]
+        self.probabilities = array("d", [1.0]) * size
+        self.aliases = array("I", range(size))
+
+        small = [index for index, weight in enumerate(scaled) if weight < 1.0]
+        large = [index for index, weight in enumerate(scaled) if weight >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.probabilities[less] = scaled[less]
+            self.aliases[less] = more
+            scaled[more] += scaled[less] - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+
+    def __len__(self) -> int:
+        return len(self.probabilities)
+
+    def sample(self) -> int:
+        """
+        Возвращает случайный индекс с вероятностью, пропорциональной его весу.
+        """
+        index = random.randrange(len(self.probabilities))
+        return index if random.random() < self.probabilities[index] else self.aliases[index]
+
+
+class SeedUserSelector(ABC):
+    """
+    Стратегия выбора пользователя пула, когда пул не ограничивает аренды (режим SHARED без shares)
+    или выдаёт пользователей по кругу при исчерпании (RECYCLE).
+    """
+
+    @abstractmethod
+    def select(self, size: int) -> int:
+        """
+        Возвращает индекс следующего пользователя.
+
+        :param size: Текущий размер пула (больше нуля).
+        """
+        ...
+
+
+class SequentialSelector(SeedUserSelector):
+    """
+    Последовательный обход всех пользователей по кругу: каждый пользователь получает одинаковую долю запросов,
+    а повторное обращение к пользователю происходит не раньше, чем через размер пула выдач.
+    """
+
+    def __init__(self):
+        self.cursor = 0
+
+    def select(self, size: int) -> int:
+        index = self.cursor % size
+        self.cursor += 1
+        return index
+
+
+class UniformSelector(SeedUserSelector):
+    """
+    Равномерно случайный выбор пользователя, как в SeedsResult.get_random_user.
+    """
+
+    def select(self, size: int) -> int:
+        return random.randrange(size)
+
+
+class WeightedSelector(SeedUserSelector):
+    """
+    Случайный выбор пользователя по весам через таблицу псевдонимов.
+    Таблица строится при первом выборе и перестраивается, только если размер пула изменился.
+    """
+
+    def __init__(self):
+        self.table: AliasTable | None = None
+
+    @abstractmethod
+    def get_weights(self, size: int) -> list[float]:
+        """
+        Возвращает веса пользователей пула заданного размера.
+        """
+        ...
+
+    def select(self, size: int) -> int:
+        if self.table is None or len(self.table) != size:
+            self.table = AliasTable(self.get_weights(size))
+
+        return self.table.sample()
+
+
+class ZipfSelector(WeightedSelector):
+    """
+    Распределение Ципфа: пользователь с рангом k (его индексом в пуле) выбирается с весом 1 / (k + 1) ** skew.
+    Так несколько «горячих» пользователей получают большую часть запросов, как ключи кэша в реальном трафике.
+    Чем больше skew, тем сильнее перекос; skew = 0 — равномерный выбор.
+    """
+
+    def __init__(self, skew: float = 1.0):
+        """
+        :param skew: Показатель перекоса распределения.
+        """
+        super().__init__()
+        self.skew = skew
+
+    def get_weights(self, size: int) -> list[float]:
+        return [1.0 / (rank + 1) ** self.skew for rank in range(size)]
+
+
+class HotColdSelector(WeightedSelector):
+    """
+    Разделение пула на горячих и холодных пользователей: первая доля hot_fraction пользователей пула
+    получает долю hot_weight всех запросов, остальные — оставшиеся запросы. Внутри каждой части выбор равномерный.
+    Например, hot_fraction=0.2 и hot_weight=0.8 — правило 80/20.
+    """
+
+    def __init__(self, hot_fraction: float = 0.2, hot_weight: float = 0.8):
+        """
+        :param hot_fraction: Доля горячих пользователей в пуле (не меньше одного пользователя).
+        :param hot_weight: Доля запросов, приходящаяся на горячих пользователей.
+        """
+        super().__init__()
+        self.hot_fraction = hot_fraction
+        self.hot_weight = hot_weight
+
+    def get_weights(self, size: int) -> list[float]:
+        hot = min(max(round(size * self.hot_fraction), 1), size)
+        if hot == size:
+            return [1.0] * size
+
+        return [self.hot_weight / hot] * hot + [(1.0 - self.hot_weight) / (size - hot)] * (size - hot)
+
+
+def build_seed_user_selector(config: SeedUserPoolConfig) -> SeedUserSelector:
+    """
+    Фабрика стратегии выбора пользователей по настройкам SEEDS.POOL.
+
+    :param config: Настройки пула пользователей.
+    :return: Стратегия выбора пользователей.
+    """
+    match config.selection:
+        case SeedUserSelection.UNIFORM:
+            return UniformSelector()
+        case SeedUserSelection.ZIPF:
+            return ZipfSelector(skew=config.zipf_skew)
+        case SeedUserSelection.HOT_COLD:
+            return HotColdSelector(hot_fraction=config.hot_fraction, hot_weight=config.hot_weight)
+        case _:
+            return SequentialSelector()
@@ -0,0 +1,129 @@
+"""
+Адаптеры внутренних сервисов к API gateway-клиентов, которое использует SeedsBuilder.
+
+SeedsBuilder вызывает методы gateway-клиентов (open_debit_card_account, issue_virtual_card,
+make_top_up_operation и т.д.) и читает из ответов только идентификаторы. Адаптеры выполняют
+те же действия вызовами CreateAccount/CreateCard/CreateOperation внутренних сервисов и
+возвращают ответы той же формы, поэтому билдер и SeedsResult не зависят от транспорта.
+Клиент UsersService уже совместим с SeedsBuilder (create_user() -> response.user.id) и адаптера не требует.
+"""
+
+from clients.grpc.services.accounts.client import AccountsServiceGRPCClient
+from clients.grpc.services.cards.client import CardsServiceGRPCClient
+from clients.grpc.services.operations.client import OperationsServiceGRPCClient
+from contracts.services.accounts.account_pb2 import AccountType
+from contracts.services.cards.card_pb2 import CardType
+from contracts.services.cards.rpc_create_card_pb2 import CreateCardResponse
+from contracts.services.gateway.accounts.account_pb2 import AccountView
+from contracts.services.gateway.accounts.rpc_open_credit_card_account_pb2 import OpenCreditCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_debit_card_account_pb2 import OpenDebitCardAccountResponse
+from contracts.services.gateway.accounts.rpc_open_deposit_account_pb2 import OpenDepositAccountResponse
+from contracts.services.gateway.accounts.rpc_open_savings_account_pb2 import OpenSavingsAccountResponse
+from contracts.services.operations.operation_pb2 import OperationType
+from contracts.services.operations.rpc_create_operation_pb2 import CreateOperationResponse
+
+
+class AccountsServiceSeedsClient:
+    """
+    Открытие счетов через AccountsService (и CardsService для карточных счетов).
+
+    Все счета возвращаются в форме ответов gateway (AccountView со списком карт).
+    Gateway при открытии дебетового и кредитного счёта сразу выпускает виртуальную карту;
+    адаптер повторяет это поведение, чтобы операции по плану было на что проводить.
+    """
+
+    def __init__(self, accounts_client: AccountsServiceGRPCClient, cards_client: CardsServiceGRPCClient):
+        """
+        :param accounts_client: Клиент AccountsService.
+        :param cards_client: Клиент CardsService.
+        """
+        self.accounts_client = accounts_client
+        self.cards_client = cards_client
+
+    def open_account(self, user_id: str, account_type: AccountType.ValueType, issue_card: bool = False) -> AccountView:
+        """
+        Создаёт счёт и при необходимости выпускает к нему виртуальную карту.
+
+        :return: Представление счёта (с выпущенной картой или без карт), как в ответах gateway.
+        """
+        account = self.accounts_client.create_account(user_id, account_type).account
+        cards = [self.cards_client.create_card(account.id, CardType.CARD_TYPE_VIRTUAL).card] if issue_card else []
+        return AccountView(
+            id=account.id,
+            type=account.type,
+            cards=cards,
+            status=account.status,
+            balance=account.balance
+        )
+
+    def open_savings_account(self, user_id: str) -> OpenSavingsAccountResponse:
+        account = self.open_account(user_id, AccountType.ACCOUNT_TYPE_SAVINGS)
+        return OpenSavingsAccountResponse(account=account)
+
+    def open_deposit_account(self, user_id: str) -> OpenDepositAccountResponse:
+        account = self.open_account(user_id, AccountType.ACCOUNT_TYPE_DEPOSIT)
+        return OpenDepositAccountResponse(account=account)
+
+    def open_debit_card_account(self, user_id: str) -> OpenDebitCardAccountResponse:
+        account = self.open_account(user_id, AccountType.ACCOUNT_TYPE_DEBIT_CARD, issue_card=True)
+        return OpenDebitCardAccountResponse(account=account)
+
+    def open_credit_card_account(self, user_id: str) -> OpenCreditCardAccountResponse:
+        account = self.open_account(user_id, AccountType.ACCOUNT_TYPE_CREDIT_CARD, issue_card=True)
+        return OpenCreditCardAccountResponse(account=account)
+
+
+class CardsServiceSeedsClient:
+    """
+    Выпуск карт через CardsService. ID пользователя сервису не нужен — карта привязывается к счёту.
+    """
+
+    def __init__(self, cards_client: CardsServiceGRPCClient):
+        """
+        :param cards_client: Клиент CardsService.
+        """
+        self.cards_client = cards_client
+
+    def issue_virtual_card(self, user_id: str, account_id: str) -> CreateCardResponse:
+        return self.cards_client.create_card(account_id, CardType.CARD_TYPE_VIRTUAL)
+
+    def issue_physical_card(self, user_id: str, account_id: str) -> CreateCardResponse:
+        return self.cards_client.create_card(account_id, CardType.CARD_TYPE_PHYSICAL)
+
+
+class OperationsServiceSeedsClient:
+    """
+    Создание операций через OperationsService. Методы make_*_operation соответствуют методам
+    gateway-клиента и отличаются только типом операции.
+    """
+
+    def __init__(self, operations_client: OperationsServiceGRPCClient):
+        """
+        :param operations_client: Клиент OperationsService.
+        """
+        self.operations_client = operations_client
+
+    def make_fee_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        return self.operations_client.create_operation(card_id, account_id, OperationType.OPERATION_TYPE_FEE)
+
+    def make_top_up_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        return self.operations_client.create_operation(card_id, account_id, OperationType.OPERATION_TYPE_TOP_UP)
+
+    def make_purchase_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        return self.operations_client.create_operation(card_id, account_id, OperationType.OPERATION_TYPE_PURCHASE)
+
+    def make_cashback_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        return self.operations_client.create_operation(card_id, account_id, OperationType.OPERATION_TYPE_CASHBACK)
+
+    def make_transfer_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        return self.operations_client.create_operation(card_id, account_id, OperationType.OPERATION_TYPE_TRANSFER)
+
+    def make_bill_payment_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        return self.operations_client.create_operation(
+            card_id, account_id, OperationType.OPERATION_TYPE_BILL_PAYMENT
+        )
+
+    def make_cash_withdrawal_operation(self, card_id: str, account_id: str) -> CreateOperationResponse:
+        return self.operations_client.create_operation(
+            card_id, account_id, OperationType.OPERATION_TYPE_CASH_WITHDRAWAL
+        )
@@ -0,0 +1,297 @@
+import random
+import time
+
+import grpc
+from httpx import HTTPStatusError, TimeoutException, TransportError, ConnectError, ConnectTimeout, PoolTimeout
+
+from tools.logger import get_logger
+
+logger = get_logger("SEEDS_THROTTLE")
+
+# Коды gRPC, при которых запрос имеет смысл повторить: сервис перегружен или временно недоступен
+TRANSIENT_GRPC_CODES = frozenset({
+    grpc.StatusCode.UNAVAILABLE,
+    grpc.StatusCode.DEADLINE_EXCEEDED,
+    grpc.StatusCode.RESOURCE_EXHAUSTED,
+    grpc.StatusCode.ABORTED,
+})
+
+# HTTP-статусы с тем же смыслом
+TRANSIENT_HTTP_STATUSES = frozenset({429, 502, 503, 504})
+
+# Коды gRPC и HTTP-статусы, при которых сервис гарантированно не выполнял запрос: нет доступного
+# сервиса или запрос отклонён ограничителем. Таймауты и 502/504 сюда не входят — запрос мог дойти.
+UNSENT_GRPC_CODES = frozenset({grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.RESOURCE_EXHAUSTED})
+UNSENT_HTTP_STATUSES = frozenset({429, 503})
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """
+    Определяет, является ли ошибка временной (перегрузка, недоступность, таймаут) или фатальной
+    (неверный запрос, ошибка валидации, баг), которую повторять бессмысленно.
+
+    :param error: Исключение, выброшенное клиентом.
+    :return: True для временной ошибки.
+    """
+    if isinstance(error, grpc.RpcError) and callable(getattr(error, "code", None)):
+        return error.code() in TRANSIENT_GRPC_CODES
+    if isinstance(error, HTTPStatusError):
+        return error.response.status_code in TRANSIENT_HTTP_STATUSES
+
+    # Таймауты и сетевые ошибки httpx (обрыв соединения, отказ в подключении)
+    return isinstance(error, (TimeoutException, TransportError))
+
+
+def is_unsent_error(error: BaseException) -> bool:
+    """
+    Определяет, что запрос гарантированно не был выполнен сервисом: подключиться не удалось
+    или сервис отклонил запрос до обработки. Только такие ошибки безопасно повторять
+    для неидемпотентных (создающих) эндпоинтов.
+
+    :param error: Исключение, выброшенное клиентом.
+    :return: True, если запрос не дошёл до обработки.
+    """
+    if isinstance(error, grpc.RpcError) and callable(getattr(error, "code", None)):
+        return error.code() in UNSENT_GRPC_CODES
+    if isinstance(error, HTTPStatusError):
+        return error.response.status_code in UNSENT_HTTP_STATUSES
+
+    # Соединение не установлено или не получено из пула — запрос не отправлялся
+    return isinstance(error, (ConnectError, ConnectTimeout, PoolTimeout))
+
+
+class TokenBucket:
+    """
+    Ограничитель частоты «ведро токенов»: в среднем не больше rate вызовов в секунду,
+    всплеск — не больше burst вызовов подряд.
+
+    reserve() не спит сам, а возвращает, сколько нужно подождать, поэтому одно и то же ведро
+    работает и с gevent.sleep, и с asyncio.sleep. Токены резервируются в долг: каждый следующий
+    вызывающий получает задержку после предыдущего, так что ожидающие выстраиваются в очередь.
+    """
+
+    __slots__ = ("rate", "burst", "tokens", "updated")
+
+    def __init__(self, rate: float, burst: float | None = None):
+        """
+        :param rate: Вызовов в секунду.
+        :param burst: Ёмкость ведра; по умолчанию — одна секунда трафика (но не меньше 1).
+        """
+        self.rate = rate
+        self.burst = burst or max(rate, 1)
+        self.tokens = self.burst
+        self.updated = time.monotonic()
+
+    def refill(self):
+        now = time.monotonic()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self) -> float:
+        """
+        Забирает токен.
+
+        :return: Время в секундах, которое нужно подождать перед вызовом (0 — можно сразу).
+        """
+        self.refill()
+        self.tokens -= 1
+        return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    def set_rate(self, rate: float):
+        """
+        Меняет частоту, предварительно начислив токены по старой частоте.
+        """
+        self.refill()
+        self.rate = rate
+
+
+class AdaptiveRate:
+    """
+    AIMD-регулятор частоты одного эндпоинта (additive increase / multiplicative decrease, как в TCP).
+
+    Результаты вызовов копятся в окне из window вызовов. Когда окно заполнено:
+    - доля временных ошибок выше error_threshold или средняя задержка выше latency_target —
+      частота умножается на decrease (быстрый сброс при перегрузке);
+    - иначе частота увеличивается на increase вызовов в секунду (осторожный рост).
+    Частота остаётся в диапазоне [min_rate, max_rate].
+    """
+
+    def __init__(
+            self,
+            endpoint: str,
+            bucket: TokenBucket,
+            min_rate: float = 1.0,
+            max_rate: float | None = None,
+            latency_target: float | None = None,
+            error_threshold: float = 0.05,
+            window: int = 50,
+            increase: float = 1.0,
+            decrease: float = 0.5
+    ):
+        """
+        :param endpoint: Имя эндпоинта (для логов).
+        :param bucket: Ведро токенов, частоту которого регулирует AIMD.
+        :param min_rate: Нижняя граница частоты.
+        :param max_rate: Верхняя граница частоты (None — без ограничения).
+        :param latency_target: Допустимая средняя задержка в секундах (None — задержка не учитывается).
+        :param error_threshold: Допустимая доля временных ошибок в окне.
+        :param window: Количество вызовов, по которым принимается решение.
+        :param increase: Прирост частоты за окно без перегрузки (вызовов в секунду).
+        :param decrease: Множитель частоты при перегрузке.
+        """
+        self.endpoint = endpoint
+        self.bucket = bucket
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.latency_target = latency_target
+        self.error_threshold = error_threshold
+        self.window = window
+        self.increase = increase
+        self.decrease = decrease
+        self.calls = 0
+        self.errors = 0
+        self.latency = 0.0
+
+    def record(self, seconds: float, error: bool = False):
+        """
+        :param seconds: Длительность вызова.
+        :param error: Вызов завершился временной ошибкой.
+        """
+        self.calls += 1
+        self.errors += error
+        self.latency += seconds
+        if self.calls < self.window:
+            return
+
+        overloaded = self.errors / self.calls > self.error_threshold or (
+                self.latency_target is not None and self.latency / self.calls > self.latency_target
+        )
+        if overloaded:
+            rate = max(self.min_rate, self.bucket.rate * self.decrease)
+        else:
+            rate = self.bucket.rate + self.increase
+            if self.max_rate is not None:
+                rate = min(self.max_rate, rate)
+
+        if rate != self.bucket.rate:
+            logger.debug(f"{self.endpoint}: rate {self.bucket.rate:.1f} -> {rate:.1f} calls/s")
+            self.bucket.set_rate(rate)
+
+        self.calls = self.errors = 0
+        self.latency = 0.0
+
+
+class SeedsThrottle:
+    """
+    Ограничители частоты по эндпоинтам сидинга.
+
+    Для эндпоинтов без заданной частоты (ни в rates, ни по умолчанию rate) ограничения нет.
+    При adaptive=True частота каждого эндпоинта подстраивается AIMD-регулятором
+    под ошибки и задержки стенда, начиная с заданной. Если частота эндпоинта не задана,
+    регулятор начинает с max_rate (если он задан) или с min_rate и ищет допустимую частоту сам.
+    """
+
+    def __init__(
+            self,
+            rate: float | None = None,
+            rates: dict[str, float] | None = None,
+            burst: float | None = None,
+            adaptive: bool = False,
+            **adaptive_options
+    ):
+        """
+        :param rate: Частота по умолчанию для всех эндпоинтов (вызовов в секунду).
+        :param rates: Частоты по именам эндпоинтов, например {"create_user": 50}.
+        :param burst: Ёмкость ведра токенов.
+        :param adaptive: Включить AIMD-регулирование частоты.
+        :param adaptive_options: Параметры AdaptiveRate (min_rate, max_rate, latency_target и т.д.).
+        """
+        self.rate = rate
+        self.rates = rates or {}
+        self.burst = burst
+        self.adaptive = adaptive
+        self.adaptive_options = adaptive_options
+        self.buckets: dict[str, TokenBucket | None] = {}
+        self.regulators: dict[str, AdaptiveRate] = {}
+
+    def get_bucket(self, endpoint: str) -> TokenBucket | None:
+        if endpoint not in self.buckets:
+            rate = self.rates.get(endpoint, self.rate)
+            if not rate and self.adaptive:
+                rate = self.adaptive_options.get("max_rate") or self.adaptive_options.get("min_rate", 1.0)
+
+            bucket = self.buckets[endpoint] = TokenBucket(rate, self.burst) if rate else None
+            if bucket is not None and self.adaptive:
+                self.regulators[endpoint] = AdaptiveRate(endpoint, bucket, **self.adaptive_options)
+
+        return self.buckets[endpoint]
+
+    def reserve(self, endpoint: str) -> float:
+        """
+        :return: Время в секундах, которое нужно подождать перед вызовом эндпоинта.
+        """
+        bucket = self.get_bucket(endpoint)
+        return 0.0 if bucket is None else bucket.reserve()
+
+    def record(self, endpoint: str, seconds: float, error: bool = False):
+        """
+        Передаёт результат вызова AIMD-регулятору эндпоинта (если он есть).
+
+        :param endpoint: Имя эндпоинта.
+        :param seconds: Длительность вызова.
+        :param error: Вызов завершился временной ошибкой.
+        """
+        regulator = self.regulators.get(endpoint)
+        if regulator is not None:
+            regulator.record(seconds, error)
+
+
+class RetryPolicy:
+    """
+    Повтор вызовов при временных ошибках с экспоненциальной задержкой и полным джиттером:
+    перед попыткой n ждём случайное время от 0 до min(max_backoff, backoff * 2^(n-1)),
+    чтобы параллельные greenlet'ы не повторяли запросы синхронно.
+
+    Создающие RPC неидемпотентны: если запрос дошёл до сервиса, но ответ потерялся по таймауту,
+    повтор создаст ещё одну сущность. Поэтому эндпоинты из non_idempotent повторяются только
+    при ошибках, гарантирующих, что запрос не выполнялся (is_unsent_error).
+    """
+
+    def __init__(
+            self,
+            attempts: int = 3,
+            backoff: float = 0.1,
+            max_backoff: float = 5.0,
+            non_idempotent: frozenset[str] = frozenset()
+    ):
+        """
+        :param attempts: Максимальное количество попыток вызова (1 — без повторов).
+        :param backoff: Базовая задержка перед повтором в секундах.
+        :param max_backoff: Максимальная задержка перед повтором в секундах.
+        :param non_idempotent: Эндпоинты, которые нельзя повторять после таймаута или 502/504.
+        """
+        self.attempts = max(attempts, 1)
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.non_idempotent = frozenset(non_idempotent)
+
+    def should_retry(self, error: BaseException, attempt: int, endpoint: str | None = None) -> bool:
+        """
+        :param error: Ошибка попытки.
+        :param attempt: Номер завершившейся попытки, начиная с 1.
+        :param endpoint: Имя эндпоинта; для неидемпотентных повторяются только неотправленные запросы.
+        :return: True, если ошибку безопасно повторить и попытки ещё остались.
+        """
+        if attempt >= self.attempts:
+            return False
+        if endpoint in self.non_idempotent:
+            return is_unsent_error(error)
+
+        return is_transient_error(error)
+
+    def get_delay(self, attempt: int) -> float:
+        """
+        :param attempt: Номер завершившейся попытки, начиная с 1.
+        :return: Задержка перед следующей попыткой в секундах.
+        """
+        return random.uniform(0, min(self.max_backoff, self.backoff * 2 ** (attempt - 1)))
@@ -0,0 +1,125 @@
+import random
+from typing import Callable, Sequence, TypeVar
+
+import grpc
+from gevent.pool import Pool
+
+from clients.grpc.gateway.accounts.client import AccountsGatewayGRPCClient
+from clients.grpc.gateway.client import build_gateway_grpc_client
+from clients.grpc.gateway.users.client import UsersGatewayGRPCClient
+from config import settings
+from seeds.registry import ACCOUNT_ENDPOINTS
+from seeds.scheduler import SeedsScheduler, build_seeds_scheduler
+from seeds.schema.result import SeedUserResult
+from seeds.schema.verification import SeedsVerification
+
+T = TypeVar("T")
+
+
+class SeedsVerifier:
+    """
+    Проверяет, что пользователи и счета из дампа сидинга всё ещё существуют на стенде.
+
+    После сброса окружения дамп ссылается на удалённых пользователей, и сценарии падают
+    на первом же get_accounts. Verifier запрашивает каждого проверяемого пользователя через
+    GetUser и его счета через GetAccounts (оба вызова одновременно), а пользователей проверяет
+    параллельно в пуле greenlet'ов. Вызовы идут через SeedsScheduler, поэтому подчиняются тем же
+    лимитам, частотам и повторам, что и сидинг.
+
+    Пользователь, которого нет на стенде (NOT_FOUND), отбрасывается целиком; у живого пользователя
+    отбрасываются только отсутствующие счета — их досоздаст SeedsBuilder при наращивании дампа.
+    """
+
+    def __init__(
+            self,
+            users_gateway_client: UsersGatewayGRPCClient,
+            accounts_gateway_client: AccountsGatewayGRPCClient,
+            workers: int = 1,
+            scheduler: SeedsScheduler | None = None
+    ):
+        """
+        :param users_gateway_client: Клиент UsersGatewayService.
+        :param accounts_gateway_client: Клиент AccountsGatewayService.
+        :param workers: Количество пользователей, проверяемых параллельно.
+        :param scheduler: Планировщик вызовов с лимитами и повторами.
+        """
+        self.users_gateway_client = users_gateway_client
+        self.accounts_gateway_client = accounts_gateway_client
+        self.workers = max(workers, 1)
+        self.scheduler = scheduler or SeedsScheduler()
+
+    def call(self, endpoint: str, func: Callable[..., T], user_id: str) -> T | None:
+        """
+        Выполняет проверочный вызов через планировщик.
+
+        :return: Ответ эндпоинта или None, если пользователя нет на стенде (NOT_FOUND).
+        """
+        try:
+            return self.scheduler.call(endpoint, func, user_id=user_id)
+        except grpc.RpcError as error:
+            if error.code() == grpc.StatusCode.NOT_FOUND:
+                return None
+
+            raise
+
+    def verify_user(self, user: SeedUserResult) -> SeedUserResult | None:
+        """
+        Проверяет одного пользователя.
+
+        :param user: Пользователь из дампа.
+        :return: Пользователь только с существующими счетами или None, если пользователя нет на стенде.
+        """
+        user_response, accounts_response = self.scheduler.gather(
+            lambda: self.call("get_user", self.users_gateway_client.get_user, user_id=user.user_id),
+            lambda: self.call("get_accounts", self.accounts_gateway_client.get_accounts, user_id=user.user_id)
+        )
+        if user_response is None or accounts_response is None:
+            return None
+
+        account_ids = {account.id for account in accounts_response.accounts}
+        return SeedUserResult(
+            user_id=user.user_id,
+            **{
+                kind: [account for account in getattr(user, kind) if account.account_id in account_ids]
+                for kind in ACCOUNT_ENDPOINTS
+            }
+        )
+
+    def verify(self, users: Sequence[SeedUserResult], sample: int | None = None) -> SeedsVerification:
+        """
+        Проверяет пользователей дампа.
+
+        :param users: Пользователи дампа (SeedsResult.users или SeedsDump).
+        :param sample: Размер случайной выборки пользователей; None — проверить всех.
+        :return: Количество живых и полных пользователей и живые пользователи без отсутствующих счетов.
+        """
+        indexes = range(len(users))
+        if sample is not None and sample < len(users):
+            indexes = sorted(random.sample(indexes, sample))
+
+        checked = [users[index] for index in indexes]
+        verified = Pool(size=self.workers).map(self.verify_user, checked)
+
+        alive = [user for user in verified if user is not None]
+        return SeedsVerification(
+            checked=len(checked),
+            alive=len(alive),
+            complete=sum(user == original for user, original in zip(verified, checked)),
+            users=alive
+        )
+
+
+def build_seeds_verifier() -> SeedsVerifier:
+    """
+    Фабрика для создания Verifier поверх gRPC-клиентов gateway (оба клиента работают через один канал).
+    Параллельность проверки задаётся SEEDS.VERIFY.WORKERS, по умолчанию — SEEDS.WORKERS.
+
+    :return: Инициализированный SeedsVerifier.
+    """
+    channel = build_gateway_grpc_client()
+    return SeedsVerifier(
+        users_gateway_client=UsersGatewayGRPCClient(channel=channel),
+        accounts_gateway_client=AccountsGatewayGRPCClient(channel=channel),
+        workers=settings.seeds.verify.workers or settings.seeds.workers,
+        scheduler=build_seeds_scheduler()
+    )
@@ -0,0 +1,103 @@
+import os
+
+import pytest
+
+from seeds.dumps import (
+    SeedsDump,
+    SeedsDumpCorruptedError,
+    append_seeds_checkpoint,
+    get_seeds_checkpoint_file,
+    get_seeds_file,
+    get_seeds_index_file,
+    is_seeds_dump_consistent,
+    load_seeds_checkpoint,
+    load_seeds_result,
+    save_seeds_result
+)
+from seeds.schema.meta import SeedsCheckpointMeta
+from seeds.schema.result import SeedsResult, SeedUserResult, SeedAccountResult, SeedCardResult
+
+SCENARIO = "test"
+META = SeedsCheckpointMeta(plan_hash="hash", target="localhost:9003")
+
+
+@pytest.fixture(autouse=True)
+def dumps_dir(tmp_path, monkeypatch):
+    # Дампы пишутся в ./dumps относительно рабочей директории
+    monkeypatch.chdir(tmp_path)
+
+
+def build_user(index: int) -> SeedUserResult:
+    return SeedUserResult(
+        user_id=f"user-{index}",
+        debit_card_accounts=[
+            SeedAccountResult(account_id=f"account-{index}", physical_cards=[SeedCardResult(card_id=f"card-{index}")])
+        ]
+    )
+
+
+def test_dump_round_trip():
+    result = SeedsResult(users=[build_user(index) for index in range(3)])
+
+    save_seeds_result(result, SCENARIO)
+
+    assert is_seeds_dump_consistent(SCENARIO)
+    assert load_seeds_result(SCENARIO) == result
+    with SeedsDump(SCENARIO) as dump:
+        assert len(dump) == 3
+        assert dump[-1] == result.users[2]
+        assert dump.get_next_user() == result.users[0]
+        assert dump.get_next_user() == result.users[1]
+
+
+def test_empty_dump_round_trip():
+    save_seeds_result(SeedsResult(), SCENARIO)
+
+    with SeedsDump(SCENARIO) as dump:
+        assert len(dump) == 0
+        with pytest.raises(IndexError):
+            dump.get_next_user()
+
+
+def test_dump_not_matching_index_is_corrupted():
+    save_seeds_result(SeedsResult(users=[build_user(0)]), SCENARIO)
+    with open(get_seeds_file(SCENARIO), "ab") as file:
+        file.write(b"partial")
+
+    assert not is_seeds_dump_consistent(SCENARIO)
+    with pytest.raises(SeedsDumpCorruptedError):
+        SeedsDump(SCENARIO)
+
+
+def test_dump_without_index_is_not_consistent():
+    save_seeds_result(SeedsResult(users=[build_user(0)]), SCENARIO)
+    os.remove(get_seeds_index_file(SCENARIO))
+
+    assert not is_seeds_dump_consistent(SCENARIO)
+
+
+def test_checkpoint_resume():
+    users = [build_user(index) for index in range(2)]
+    for user in users:
+        append_seeds_checkpoint(user, META, SCENARIO)
+
+    assert load_seeds_checkpoint(META, SCENARIO) == users
+
+
+def test_checkpoint_truncates_incomplete_line():
+    append_seeds_checkpoint(build_user(0), META, SCENARIO)
+    with open(get_seeds_checkpoint_file(SCENARIO), "a") as file:
+        file.write('{"user_id": "user-')
+
+    assert load_seeds_checkpoint(META, SCENARIO) == [build_user(0)]
+
+    # Следующая запись не склеивается с обрывком
+    append_seeds_checkpoint(build_user(1), META, SCENARIO)
+    assert load_seeds_checkpoint(META, SCENARIO) == [build_user(0), build_user(1)]
+
+
+def test_checkpoint_for_another_plan_is_discarded():
+    append_seeds_checkpoint(build_user(0), META, SCENARIO)
+
+    assert load_seeds_checkpoint(META.model_copy(update={"plan_hash": "other"}), SCENARIO) == []
+    assert not os.path.exists(get_seeds_checkpoint_file(SCENARIO))
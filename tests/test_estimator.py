@@ -0,0 +1,73 @@
+from seeds.estimator import count_seeds_plan_calls, estimate_seeds_plan
+from seeds.schema.plan import SeedsPlan, SeedUsersPlan, SeedAccountsPlan, SeedCardsPlan, SeedOperationsPlan
+
+
+def test_count_calls_multiplies_plan():
+    plan = SeedsPlan(
+        users=SeedUsersPlan(
+            count=10,
+            debit_card_accounts=SeedAccountsPlan(
+                count=2,
+                physical_cards=SeedCardsPlan(count=1),
+                purchase_operations=SeedOperationsPlan(count=3)
+            )
+        )
+    )
+
+    assert count_seeds_plan_calls(plan) == {
+        "create_user": 10,
+        "open_debit_card_account": 20,
+        "issue_physical_card": 20,
+        "make_purchase_operation": 60,
+    }
+
+
+def test_count_calls_adds_operations_card_for_account_without_card():
+    plan = SeedsPlan(
+        users=SeedUsersPlan(
+            count=2,
+            savings_accounts=SeedAccountsPlan(count=1, top_up_operations=SeedOperationsPlan(count=2))
+        )
+    )
+
+    assert count_seeds_plan_calls(plan) == {
+        "create_user": 2,
+        "open_savings_account": 2,
+        "issue_virtual_card": 2,
+        "make_top_up_operation": 4,
+    }
+
+
+def test_count_calls_reuses_planned_virtual_card_for_operations():
+    plan = SeedsPlan(
+        users=SeedUsersPlan(
+            count=1,
+            deposit_accounts=SeedAccountsPlan(
+                count=1,
+                virtual_cards=SeedCardsPlan(count=2),
+                fee_operations=SeedOperationsPlan(count=1)
+            )
+        )
+    )
+
+    assert count_seeds_plan_calls(plan)["issue_virtual_card"] == 2
+
+
+def test_count_calls_of_empty_plan():
+    assert count_seeds_plan_calls(SeedsPlan()) == {}
+
+
+def test_estimate_uses_workers_and_critical_path():
+    plan = SeedsPlan(
+        users=SeedUsersPlan(count=4, credit_card_accounts=SeedAccountsPlan(count=1))
+    )
+
+    estimate = estimate_seeds_plan(
+        plan,
+        workers=2,
+        latencies={"create_user": 100.0, "open_credit_card_account": 50.0}
+    )
+
+    assert estimate.total_calls == 8
+    assert estimate.user_duration == 0.15
+    assert estimate.missing_latencies == []
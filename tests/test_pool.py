@@ -0,0 +1,132 @@
+import pytest
+
+from seeds.pool import SeedUserPool, SeedUserPoolExhaustedError, SharedSeedUserPool, SharedSeedsCursor
+from seeds.selection import SequentialSelector
+from tools.config.seeds import SeedUserPoolMode, SeedUserPoolExhaustion
+
+
+def test_exclusive_pool_leases_each_user_once():
+    pool = SeedUserPool(["a", "b", "c"])
+
+    users = {pool.lease().user for _ in range(3)}
+
+    assert users == {"a", "b", "c"}
+    assert pool.free_count == 0
+
+
+def test_exclusive_pool_fails_when_exhausted():
+    pool = SeedUserPool(["a"])
+    pool.lease()
+
+    with pytest.raises(SeedUserPoolExhaustedError):
+        pool.lease()
+
+
+def test_released_user_is_leased_again():
+    pool = SeedUserPool(["a"])
+
+    with pool.lease() as lease:
+        assert lease.user == "a"
+
+    assert pool.free_count == 1
+    assert pool.lease().user == "a"
+
+
+def test_double_release_returns_user_once():
+    pool = SeedUserPool(["a"])
+    lease = pool.lease()
+
+    lease.release()
+    lease.release()
+
+    assert pool.free_count == 1
+
+
+def test_shared_pool_limits_leases_per_user():
+    pool = SeedUserPool(["a", "b"], mode=SeedUserPoolMode.SHARED, shares=2)
+
+    users = [pool.lease().user for _ in range(4)]
+
+    assert sorted(users) == ["a", "a", "b", "b"]
+    with pytest.raises(SeedUserPoolExhaustedError):
+        pool.lease()
+
+
+def test_shared_pool_without_shares_is_never_exhausted():
+    pool = SeedUserPool(["a", "b"], mode=SeedUserPoolMode.SHARED, selector=SequentialSelector())
+
+    users = [pool.lease().user for _ in range(4)]
+
+    assert users == ["a", "b", "a", "b"]
+
+
+def test_block_pool_times_out():
+    pool = SeedUserPool(["a"], exhaustion=SeedUserPoolExhaustion.BLOCK, timeout=0.01)
+    pool.lease()
+
+    with pytest.raises(SeedUserPoolExhaustedError):
+        pool.lease()
+
+
+def test_recycle_pool_returns_unowned_lease():
+    pool = SeedUserPool(["a"], exhaustion=SeedUserPoolExhaustion.RECYCLE)
+    pool.lease()
+
+    lease = pool.lease()
+
+    assert lease.user == "a"
+    assert not lease.owned
+
+
+def test_added_user_becomes_available():
+    pool = SeedUserPool(["a"])
+    pool.lease()
+
+    pool.add("b")
+
+    assert len(pool) == 2
+    assert pool.lease().user == "b"
+
+
+def test_shared_cursor_hands_out_each_user_once(tmp_path):
+    cursor = SharedSeedsCursor(str(tmp_path / "cursor"))
+    first = SharedSeedUserPool(["a", "b", "c"], cursor=cursor)
+    second = SharedSeedUserPool(["a", "b", "c"], cursor=SharedSeedsCursor(str(tmp_path / "cursor")))
+
+    users = [first.lease().user, second.lease().user, first.lease().user]
+
+    assert sorted(users) == ["a", "b", "c"]
+    with pytest.raises(SeedUserPoolExhaustedError):
+        second.lease()
+
+
+def test_shared_cursor_pool_reuses_released_users(tmp_path):
+    pool = SharedSeedUserPool(["a"], cursor=SharedSeedsCursor(str(tmp_path / "cursor")))
+
+    pool.lease().release()
+
+    assert pool.lease().user == "a"
+
+
+def test_shared_cursor_pool_blocks_no_longer_than_exhausted(tmp_path):
+    pool = SharedSeedUserPool(
+        ["a"],
+        cursor=SharedSeedsCursor(str(tmp_path / "cursor")),
+        exhaustion=SeedUserPoolExhaustion.BLOCK,
+        timeout=None
+    )
+    pool.lease()
+
+    with pytest.raises(SeedUserPoolExhaustedError):
+        pool.lease()
+
+
+def test_shared_cursor_pool_recycles_when_exhausted(tmp_path):
+    pool = SharedSeedUserPool(
+        ["a"],
+        cursor=SharedSeedsCursor(str(tmp_path / "cursor")),
+        exhaustion=SeedUserPoolExhaustion.RECYCLE
+    )
+    pool.lease()
+
+    assert pool.lease().user == "a"
@@ -0,0 +1,74 @@
+import random
+from collections import Counter
+
+import pytest
+
+from seeds.selection import AliasTable, HotColdSelector, SequentialSelector, ZipfSelector
+
+SAMPLES = 20_000
+
+
+@pytest.fixture(autouse=True)
+def seed_random():
+    random.seed(42)
+
+
+def test_alias_table_follows_weights():
+    table = AliasTable([1, 2, 7])
+
+    counts = Counter(table.sample() for _ in range(SAMPLES))
+
+    assert counts[0] / SAMPLES == pytest.approx(0.1, abs=0.02)
+    assert counts[1] / SAMPLES == pytest.approx(0.2, abs=0.02)
+    assert counts[2] / SAMPLES == pytest.approx(0.7, abs=0.02)
+
+
+def test_alias_table_skips_zero_weights():
+    table = AliasTable([0, 1, 0])
+
+    assert {table.sample() for _ in range(100)} == {1}
+
+
+@pytest.mark.parametrize("weights", [[], [0, 0]])
+def test_alias_table_rejects_empty_weights(weights):
+    with pytest.raises(ValueError):
+        AliasTable(weights)
+
+
+def test_sequential_selector_cycles():
+    selector = SequentialSelector()
+
+    assert [selector.select(3) for _ in range(5)] == [0, 1, 2, 0, 1]
+
+
+def test_zipf_selector_prefers_low_ranks():
+    selector = ZipfSelector(skew=1.0)
+
+    counts = Counter(selector.select(10) for _ in range(SAMPLES))
+
+    # Вес ранга k равен 1 / (k + 1): первый пользователь выбирается вдвое чаще второго
+    assert counts[0] / counts[1] == pytest.approx(2.0, rel=0.1)
+    assert counts[0] > counts[9] * 5
+
+
+def test_zipf_selector_without_skew_is_uniform():
+    selector = ZipfSelector(skew=0.0)
+
+    assert selector.get_weights(4) == [1.0] * 4
+
+
+def test_weighted_selector_rebuilds_table_on_resize():
+    selector = ZipfSelector()
+
+    selector.select(2)
+    selector.select(5)
+
+    assert len(selector.table) == 5
+
+
+def test_hot_cold_selector_splits_requests():
+    selector = HotColdSelector(hot_fraction=0.2, hot_weight=0.8)
+
+    counts = Counter(selector.select(10) for _ in range(SAMPLES))
+
+    assert (counts[0] + counts[1]) / SAMPLES == pytest.approx(0.8, abs=0.02)
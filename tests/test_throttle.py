@@ -0,0 +1,106 @@
+import grpc
+import httpx
+import pytest
+
+from seeds.throttle import AdaptiveRate, RetryPolicy, TokenBucket, is_transient_error, is_unsent_error
+
+
+class RpcError(grpc.RpcError):
+    def __init__(self, code: grpc.StatusCode):
+        self._code = code
+
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+
+def build_status_error(status_code: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("POST", "http://localhost/api/v1/users")
+    response = httpx.Response(status_code, request=request)
+    return httpx.HTTPStatusError("error", request=request, response=response)
+
+
+def test_token_bucket_allows_burst_then_queues():
+    bucket = TokenBucket(rate=10, burst=2)
+
+    delays = [bucket.reserve() for _ in range(4)]
+
+    assert delays[:2] == [0.0, 0.0]
+    assert delays[2] == pytest.approx(0.1, abs=0.01)
+    assert delays[3] == pytest.approx(0.2, abs=0.01)
+
+
+def test_adaptive_rate_increases_without_errors():
+    bucket = TokenBucket(rate=10)
+    regulator = AdaptiveRate("create_user", bucket, max_rate=10.5, window=2, increase=1.0)
+
+    regulator.record(0.01)
+    regulator.record(0.01)
+
+    assert bucket.rate == 10.5
+
+
+def test_adaptive_rate_decreases_on_errors():
+    bucket = TokenBucket(rate=10)
+    regulator = AdaptiveRate("create_user", bucket, min_rate=4, window=2, decrease=0.5)
+
+    regulator.record(0.01, error=True)
+    regulator.record(0.01)
+    assert bucket.rate == 5
+
+    regulator.record(0.01, error=True)
+    regulator.record(0.01)
+    assert bucket.rate == 4
+
+
+def test_adaptive_rate_decreases_on_latency():
+    bucket = TokenBucket(rate=10)
+    regulator = AdaptiveRate("create_user", bucket, latency_target=0.1, window=2, decrease=0.5)
+
+    regulator.record(0.2)
+    regulator.record(0.2)
+
+    assert bucket.rate == 5
+
+
+@pytest.mark.parametrize(
+    "error, transient, unsent",
+    [
+        (RpcError(grpc.StatusCode.UNAVAILABLE), True, True),
+        (RpcError(grpc.StatusCode.RESOURCE_EXHAUSTED), True, True),
+        (RpcError(grpc.StatusCode.DEADLINE_EXCEEDED), True, False),
+        (RpcError(grpc.StatusCode.INVALID_ARGUMENT), False, False),
+        (build_status_error(429), True, True),
+        (build_status_error(503), True, True),
+        (build_status_error(504), True, False),
+        (build_status_error(400), False, False),
+        (httpx.ConnectError("refused"), True, True),
+        (httpx.ReadTimeout("timeout"), True, False),
+        (ValueError("bug"), False, False),
+    ]
+)
+def test_error_classification(error, transient, unsent):
+    assert is_transient_error(error) == transient
+    assert is_unsent_error(error) == unsent
+
+
+def test_retry_policy_limits_attempts():
+    policy = RetryPolicy(attempts=2)
+    error = RpcError(grpc.StatusCode.UNAVAILABLE)
+
+    assert policy.should_retry(error, 1)
+    assert not policy.should_retry(error, 2)
+
+
+def test_retry_policy_retries_non_idempotent_only_when_unsent():
+    policy = RetryPolicy(attempts=3, non_idempotent=frozenset({"create_user"}))
+    timeout = RpcError(grpc.StatusCode.DEADLINE_EXCEEDED)
+
+    assert policy.should_retry(timeout, 1, "get_user")
+    assert not policy.should_retry(timeout, 1, "create_user")
+    assert policy.should_retry(RpcError(grpc.StatusCode.UNAVAILABLE), 1, "create_user")
+
+
+def test_retry_policy_delay_is_capped():
+    policy = RetryPolicy(backoff=1.0, max_backoff=2.0)
+
+    assert all(0 <= policy.get_delay(attempt) <= 2.0 for attempt in range(1, 10))
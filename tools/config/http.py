@@ -1,6 +1,18 @@
+from enum import StrEnum
+
+from httpx import Limits, Timeout
 from pydantic import BaseModel, HttpUrl
 
 
+class HTTPPoolSharing(StrEnum):
+    # Свой пул соединений у каждого виртуального пользователя (общий для всех его gateway-клиентов)
+    USER = "user"
+    # Один пул соединений на весь процесс Locust
+    PROCESS = "process"
+    # Один пул соединений на группу из pool_users виртуальных пользователей
+    USERS = "users"
+
+
 class HTTPClientConfig(BaseModel):
     # URL сервиса, к которому будем подключаться через httpx
     url: HttpUrl
@@ -8,6 +20,76 @@ class HTTPClientConfig(BaseModel):
     # Таймаут для запросов в секундах (по умолчанию 100)
     timeout: float = 100.0
 
+    # Отдельные таймауты в секундах на подключение, чтение, запись и ожидание соединения из пула
+    # (не заданы — используется timeout)
+    connect_timeout: float | None = None
+    read_timeout: float | None = None
+    write_timeout: float | None = None
+    pool_timeout: float | None = None
+
+    # Лимиты пула соединений httpx (по умолчанию — значения httpx; None — без ограничения)
+    max_connections: int | None = 100
+    max_keepalive_connections: int | None = 20
+    keepalive_expiry: float | None = 5.0
+
+    # Дополнительно отправлять в Locust время ожидания свободного соединения из пула отдельной метрикой
+    # (время ответа HTTP всё равно измеряется целиком)
+    pool_wait_metric: bool = False
+
+    # Отправлять в Locust фазы каждого запроса (подключение, TLS, отправка, ожидание ответа, загрузка тела)
+    # по событиям httpcore trace; включает и метрику ожидания соединения из пула
+    trace_phases: bool = False
+
+    # Отправлять в Locust время до первого байта (получения заголовков) отдельной метрикой
+    ttfb_metric: bool = False
+
+    # Включить HTTP/2: несколько запросов одного пула идут параллельно по одному соединению (нужен пакет h2)
+    http2: bool = False
+
+    # HTTP/2 без TLS (h2c) с prior knowledge: для http:// без него httpx согласует только HTTP/1.1
+    http2_prior_knowledge: bool = False
+
+    # Как виртуальные пользователи Locust делят пулы соединений
+    pool_sharing: HTTPPoolSharing = HTTPPoolSharing.USER
+
+    # Количество виртуальных пользователей на один пул для политики USERS
+    pool_users: int = 10
+
+    # Период вывода заполненности пулов соединений в лог в секундах (не задано — только по окончании теста)
+    pool_report_interval: float | None = 30.0
+
+    @property
+    def timeouts(self) -> Timeout:
+        """
+        Таймауты для httpx.Client: незаданные connect/read/write/pool берутся из timeout.
+        """
+        return Timeout(
+            self.timeout,
+            connect=self.timeout if self.connect_timeout is None else self.connect_timeout,
+            read=self.timeout if self.read_timeout is None else self.read_timeout,
+            write=self.timeout if self.write_timeout is None else self.write_timeout,
+            pool=self.timeout if self.pool_timeout is None else self.pool_timeout
+        )
+
+    @property
+    def limits(self) -> Limits:
+        """
+        Лимиты пула соединений для httpx.Client.
+        """
+        return Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry
+        )
+
+    @property
+    def http1(self) -> bool:
+        """
+        Разрешён ли HTTP/1.1. Отключается только для HTTP/2 с prior knowledge,
+        иначе при http:// без TLS httpx не перейдёт на HTTP/2.
+        """
+        return not (self.http2 and self.http2_prior_knowledge)
+
     @property
     def client_url(self) -> str:
         """
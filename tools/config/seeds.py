@@ -0,0 +1,181 @@
+from enum import StrEnum
+
+from pydantic import BaseModel, Field
+
+from tools.config.grpc import GRPCClientConfig
+
+
+class SeedsBackend(StrEnum):
+    # Блокирующий SeedsBuilder поверх gRPC/HTTP клиентов (gevent)
+    GRPC = "grpc"
+    HTTP = "http"
+    # Асинхронный AsyncSeedsBuilder поверх grpc.aio/httpx.AsyncClient (asyncio)
+    GRPC_AIO = "grpc_aio"
+    HTTP_ASYNC = "http_async"
+    # Блокирующий SeedsBuilder напрямую во внутренние сервисы (users, accounts, cards, operations) в обход gateway
+    SERVICES = "services"
+
+
+class SeedUserPoolMode(StrEnum):
+    # Пользователь одновременно выдаётся только одному виртуальному пользователю
+    EXCLUSIVE = "exclusive"
+    # Пользователь может быть выдан нескольким виртуальным пользователям сразу
+    SHARED = "shared"
+
+
+class SeedUserPoolExhaustion(StrEnum):
+    # Ждать, пока другой виртуальный пользователь вернёт аренду
+    BLOCK = "block"
+    # Выдать уже арендованного пользователя по кругу
+    RECYCLE = "recycle"
+    # Сразу завершиться ошибкой
+    FAIL = "fail"
+
+
+class SeedUserSelection(StrEnum):
+    # Все пользователи по кругу
+    SEQUENTIAL = "sequential"
+    # Равномерно случайный пользователь
+    UNIFORM = "uniform"
+    # Распределение Ципфа: немногие «горячие» пользователи получают большую часть запросов
+    ZIPF = "zipf"
+    # Доля горячих пользователей получает заданную долю запросов, остальные — оставшиеся
+    HOT_COLD = "hot_cold"
+
+
+class SeedUserPoolConfig(BaseModel):
+    # Максимум одновременных аренд одного пользователя в режиме SHARED (не задано — без ограничения)
+    shares: int | None = None
+
+    # Поведение пула, когда свободных пользователей не осталось
+    exhaustion: SeedUserPoolExhaustion = SeedUserPoolExhaustion.FAIL
+
+    # Максимальное время ожидания свободного пользователя в секундах для политики BLOCK (None — без ограничения)
+    timeout: float | None = 30.0
+
+    # Выбор пользователя, когда пул не ограничивает аренды (SHARED без shares) или выдаёт по кругу (RECYCLE)
+    selection: SeedUserSelection = SeedUserSelection.UNIFORM
+
+    # Перекос распределения Ципфа (0 — равномерно, больше — сильнее перекос)
+    zipf_skew: float = 1.0
+
+    # Доля горячих пользователей пула и доля запросов к ним для выбора HOT_COLD
+    hot_fraction: float = 0.2
+    hot_weight: float = 0.8
+
+
+class SeedsReplenishConfig(BaseModel):
+    # Досоздавать пользователей во время теста для сценариев с монопольной выдачей (EXCLUSIVE)
+    enabled: bool = False
+
+    # Минимальное число свободных пользователей в пуле, ниже которого запускается досоздание
+    min_free: int = 10
+
+    # Пауза в секундах между созданием пользователей, чтобы не влиять на измеряемый трафик
+    interval: float = 1.0
+
+
+class SeedsThrottleConfig(BaseModel):
+    # Частота вызовов каждого эндпоинта в секунду по умолчанию (не задано — без ограничения)
+    rate: float | None = None
+
+    # Частоты по эндпоинтам, например: SEEDS.THROTTLE.RATES={"create_user": 50}
+    rates: dict[str, float] = {}
+
+    # Ёмкость ведра токенов — сколько вызовов можно сделать подряд (не задано — секунда трафика)
+    burst: float | None = None
+
+    # Подстраивать частоту под ошибки и задержки стенда (AIMD)
+    adaptive: bool = False
+
+    # Границы частоты для AIMD; без rate/rates AIMD стартует с max_rate, а если он не задан — с min_rate
+    min_rate: float = 1.0
+    max_rate: float | None = None
+
+    # Допустимая средняя задержка вызова в секундах (не задано — задержка не учитывается)
+    latency_target: float | None = None
+
+    # Допустимая доля временных ошибок в окне
+    error_threshold: float = 0.05
+
+    # Количество вызовов, по которым AIMD принимает решение
+    window: int = 50
+
+    # Прирост частоты за окно без перегрузки и множитель частоты при перегрузке
+    increase: float = 1.0
+    decrease: float = 0.5
+
+
+class SeedsRetryConfig(BaseModel):
+    # Максимальное количество попыток вызова при временных ошибках (1 — без повторов)
+    attempts: int = 3
+
+    # Базовая и максимальная задержка перед повтором в секундах (экспоненциальный рост с джиттером)
+    backoff: float = 0.1
+    max_backoff: float = 5.0
+
+
+class SeedsVerifyConfig(BaseModel):
+    # Проверять перед переиспользованием, что пользователи и счета из дампа есть на стенде
+    enabled: bool = False
+
+    # Размер случайной выборки для решения о переиспользовании дампа (не задано — проверять весь дамп)
+    sample: int | None = 100
+
+    # Минимальная доля живых пользователей, при которой дамп очищается и наращивается, а не собирается заново
+    min_survival: float = 0.5
+
+    # Количество пользователей, проверяемых параллельно (не задано — SEEDS.WORKERS)
+    workers: int | None = None
+
+
+class SeedsServicesConfig(BaseModel):
+    # Адреса внутренних сервисов для бэкенда SERVICES, например: SEEDS.SERVICES.USERS.HOST=localhost
+    users: GRPCClientConfig
+    cards: GRPCClientConfig
+    accounts: GRPCClientConfig
+    operations: GRPCClientConfig
+
+
+class SeedsConfig(BaseModel):
+    # Количество пользователей, которые сидятся параллельно (1 — строго последовательный режим)
+    workers: int = 1
+
+    # Лимиты одновременных вызовов по эндпоинтам, например: SEEDS.ENDPOINT_LIMITS={"create_user": 10}
+    endpoint_limits: dict[str, int] = {}
+
+    # Общий лимит одновременных вызовов всех эндпоинтов (при запуске через seeds.runner — всех сценариев вместе)
+    concurrency: int | None = None
+
+    # Бэкенд, через который SeedsScenario создаёт данные (сценарий может переопределить его свойством backend)
+    backend: SeedsBackend = SeedsBackend.GRPC
+
+    # Адреса внутренних сервисов, обязательны только для бэкенда SERVICES
+    services: SeedsServicesConfig | None = None
+
+    # Продолжать прерванный сидинг из checkpoint-файла, создавая только недостающих пользователей
+    resume: bool = False
+
+    # Время жизни готового дампа в секундах; None — дамп с тем же планом и стендом переиспользуется всегда
+    cache_ttl: float | None = None
+
+    # Игнорировать готовый дамп и выполнить сидинг заново
+    force: bool = False
+
+    # Проверка дампа на стенде перед переиспользованием
+    verify: SeedsVerifyConfig = Field(default_factory=SeedsVerifyConfig)
+
+    # Ограничение частоты вызовов по эндпоинтам
+    throttle: SeedsThrottleConfig = Field(default_factory=SeedsThrottleConfig)
+
+    # Повтор вызовов при временных ошибках (UNAVAILABLE, 503, таймауты)
+    retry: SeedsRetryConfig = Field(default_factory=SeedsRetryConfig)
+
+    # Период вывода прогресса сидинга (пользователи, сущности в секунду, ETA) в лог в секундах
+    progress_interval: float = 10.0
+
+    # Настройки пула пользователей, из которого сценарии берут сидированных пользователей
+    pool: SeedUserPoolConfig = Field(default_factory=SeedUserPoolConfig)
+
+    # Настройки фонового досоздания пользователей во время теста
+    replenish: SeedsReplenishConfig = Field(default_factory=SeedsReplenishConfig)
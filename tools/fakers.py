@@ -113,6 +113,38 @@ class Fake:
         """
         return self.float(1, 1000)
     
+    def card_number(self) -> str:
+        """
+        Генерирует случайный номер банковской карты.
+
+        :return: Номер карты из 16 цифр.
+        """
+        return self.faker.credit_card_number(card_type="visa16")
+
+    def card_expiry_date(self) -> str:
+        """
+        Генерирует случайную дату окончания действия карты.
+
+        :return: Дата в формате YYYY-MM-DD.
+        """
+        return self.faker.future_date(end_date="+1825d").isoformat()
+
+    def cvv(self) -> str:
+        """
+        Генерирует случайный CVV-код карты.
+
+        :return: Строка из 3 цифр.
+        """
+        return self.faker.numerify("###")
+
+    def pin(self) -> str:
+        """
+        Генерирует случайный PIN-код карты.
+
+        :return: Строка из 4 цифр.
+        """
+        return self.faker.numerify("####")
+
     def proto_enum(self, value: EnumTypeWrapper) -> int:
         """
         Выбирает случайное значение из proto enum-типа.
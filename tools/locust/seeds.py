@@ -0,0 +1,178 @@
+from locust.env import Environment
+from locust.runners import MasterRunner, WorkerRunner
+
+from seeds.compact import CompactSeedsResult
+from seeds.dumps import get_seeds_cursor_file
+from seeds.pool import SharedSeedsCursor, SharedSeedUserPool
+from seeds.replenisher import SeedsReplenisher, build_replenisher_seeds_builder
+from seeds.scenario import SeedsScenario
+from seeds.schema.result import SeedUserResult
+from config import settings
+from tools.config.seeds import SeedUserPoolMode
+from tools.logger import get_logger
+
+logger = get_logger("LOCUST_SEEDS")
+
+# Тип сообщения Locust, которым мастер отправляет воркеру его шард пользователей
+SEEDS_SHARD_MESSAGE = "seeds_shard"
+
+# Тип сообщения Locust, которым мастер просит локальных воркеров подключиться к общему дампу
+SEEDS_ATTACH_MESSAGE = "seeds_attach"
+
+# Сколько пользователей отправляется в одном сообщении шарда
+SEEDS_SHARD_CHUNK_SIZE = 1000
+
+
+def get_shard_range(total: int, index: int, count: int) -> range:
+    """
+    Возвращает диапазон индексов пользователей, который достаётся шарду.
+    Шарды не пересекаются и отличаются по размеру не более чем на одного пользователя.
+
+    :param total: Общее число пользователей в дампе.
+    :param index: Номер шарда (индекс воркера).
+    :param count: Количество шардов (воркеров).
+    :return: Диапазон индексов пользователей шарда.
+    """
+    return range(total * index // count, total * (index + 1) // count)
+
+
+def send_seeds_shards(environment: Environment, seeds_scenario: SeedsScenario):
+    """
+    Делит дамп сидинга между подключёнными воркерами и отправляет каждому его шард.
+
+    Вызывается на мастере в test_start — до отправки воркерам команд на запуск пользователей,
+    поэтому к моменту on_start у воркера уже есть пул. Пользователи читаются из дампа лениво
+    и отправляются пачками по SEEDS_SHARD_CHUNK_SIZE, так что мастер не держит дамп в памяти.
+    """
+    runner: MasterRunner = environment.runner
+    workers = sorted(
+        runner.clients.ready + runner.clients.spawning + runner.clients.running,
+        key=lambda worker: runner.get_worker_index(worker.id)
+    )
+
+    with seeds_scenario.open() as dump:
+        for index, worker in enumerate(workers):
+            shard = get_shard_range(len(dump), index, len(workers))
+            logger.info(f"[{seeds_scenario.scenario}] Sending {len(shard)} seed users to worker {worker.id}")
+
+            for start in range(0, len(shard), SEEDS_SHARD_CHUNK_SIZE) or [0]:
+                chunk = shard[start:start + SEEDS_SHARD_CHUNK_SIZE]
+                runner.send_message(
+                    SEEDS_SHARD_MESSAGE,
+                    {"offset": start, "total": len(shard), "users": [dump[item].model_dump_json() for item in chunk]},
+                    client_id=worker.id
+                )
+
+
+def attach_seeds_workers(environment: Environment, seeds_scenario: SeedsScenario):
+    """
+    Просит воркеров, запущенных через `locust --processes N` на этой же машине, подключиться к общему дампу.
+
+    Вместо пересылки шардов мастер обнуляет общий курсор раздачи пользователей, а воркеры
+    открывают тот же дамп через mmap: страницы дампа хранятся в памяти один раз на всю машину,
+    а пользователей процессы забирают через атомарный курсор (см. SharedSeedUserPool).
+    """
+    SharedSeedsCursor(get_seeds_cursor_file(seeds_scenario.scenario)).reset()
+    environment.runner.send_message(SEEDS_ATTACH_MESSAGE)
+
+
+def init_seeds_replenisher(environment: Environment, seeds_scenario: SeedsScenario):
+    """
+    Запускает фоновое досоздание пользователей (SEEDS.REPLENISH) на время каждого запуска теста.
+
+    Replenisher создаётся в test_start для пула, который к этому моменту лежит в environment.seeds,
+    и останавливается в test_stop. Пополняются только пулы с монопольной выдачей пользователей.
+    """
+    replenisher: SeedsReplenisher | None = None
+
+    def on_test_start(**kwargs):
+        nonlocal replenisher
+        pool = getattr(environment, "seeds", None)
+        if pool is None or pool.shares != 1:
+            return
+
+        replenisher = SeedsReplenisher(
+            pool=pool,
+            builder=build_replenisher_seeds_builder(seeds_scenario.backend),
+            plan=seeds_scenario.plan.users,
+            min_free=settings.seeds.replenish.min_free,
+            interval=settings.seeds.replenish.interval
+        )
+        replenisher.start()
+
+    def on_test_stop(**kwargs):
+        if replenisher is not None:
+            replenisher.stop()
+
+    environment.events.test_start.add_listener(on_test_start)
+    environment.events.test_stop.add_listener(on_test_stop)
+
+
+def init_seeds_pool(environment: Environment, seeds_scenario: SeedsScenario, mode: SeedUserPoolMode):
+    """
+    Готовит пул пользователей сидинга для запуска Locust в любом режиме.
+
+    - Локальный запуск: выполняет сидинг и открывает весь дамп как пул.
+    - Мастер (--master): выполняет сидинг один раз и при старте теста раздаёт воркерам
+      непересекающиеся шарды дампа через канал сообщений Locust.
+    - Воркер (--worker): сам сидинг не выполняет, а собирает полученный от мастера шард
+      в компактное хранилище и строит пул только из него.
+    - `--processes N`: мастер и воркеры работают на одной машине, поэтому воркеры не получают шарды,
+      а подключаются к общему дампу через mmap и делят пользователей через общий атомарный курсор.
+
+    Так стоимость сидинга и память воркера не растут при добавлении воркеров,
+    а разные воркеры никогда не выдают одного и того же пользователя.
+
+    При включённой настройке SEEDS.REPLENISH процессы, выполняющие виртуальных пользователей,
+    досоздают пользователей в фоне, когда пул пустеет (см. SeedsReplenisher).
+
+    :param environment: Окружение Locust из события init.
+    :param seeds_scenario: Сидинг-сценарий нагрузочного теста.
+    :param mode: Режим выдачи пользователей пулом.
+    """
+    if settings.seeds.replenish.enabled and not isinstance(environment.runner, MasterRunner):
+        init_seeds_replenisher(environment=environment, seeds_scenario=seeds_scenario)
+
+    if isinstance(environment.runner, WorkerRunner):
+        shard = CompactSeedsResult()
+
+        def on_seeds_shard(msg, **kwargs):
+            nonlocal shard
+            if msg.data["offset"] == 0:
+                shard = CompactSeedsResult()
+
+            for user in msg.data["users"]:
+                shard.append(SeedUserResult.model_validate_json(user))
+
+            if len(shard) == msg.data["total"]:
+                logger.info(f"[{seeds_scenario.scenario}] Received shard of {len(shard)} seed users from master")
+                environment.seeds = seeds_scenario.pool(mode=mode, users=shard)
+
+        def on_seeds_attach(**kwargs):
+            logger.info(f"[{seeds_scenario.scenario}] Attaching to seeds dump shared by local processes")
+            if mode == SeedUserPoolMode.EXCLUSIVE:
+                environment.seeds = SharedSeedUserPool(
+                    users=seeds_scenario.open(),
+                    cursor=SharedSeedsCursor(get_seeds_cursor_file(seeds_scenario.scenario)),
+                    exhaustion=settings.seeds.pool.exhaustion,
+                    timeout=settings.seeds.pool.timeout
+                )
+            else:
+                environment.seeds = seeds_scenario.pool(mode=mode)
+
+        environment.runner.register_message(SEEDS_SHARD_MESSAGE, on_seeds_shard)
+        environment.runner.register_message(SEEDS_ATTACH_MESSAGE, on_seeds_attach)
+        return
+
+    seeds_scenario.build()
+
+    if isinstance(environment.runner, MasterRunner):
+        # При --processes все воркеры — дочерние процессы этой же машины и видят тот же дамп
+        processes = environment.parsed_options and environment.parsed_options.processes
+        distribute = attach_seeds_workers if processes else send_seeds_shards
+        environment.events.test_start.add_listener(
+            lambda **kwargs: distribute(environment=environment, seeds_scenario=seeds_scenario)
+        )
+        return
+
+    environment.seeds = seeds_scenario.pool(mode=mode)